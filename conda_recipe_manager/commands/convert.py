@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import multiprocessing as mp
 import os
@@ -12,7 +13,7 @@ import time
 import traceback
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Final, Optional
+from typing import Final, Optional, cast
 
 import click
 
@@ -23,6 +24,7 @@ from conda_recipe_manager.parser.enums import SchemaVersion
 from conda_recipe_manager.parser.exceptions import ParsingException, ParsingJinjaException
 from conda_recipe_manager.parser.recipe_parser_convert import RecipeParserConvert
 from conda_recipe_manager.parser.types import V0_FORMAT_RECIPE_FILE_NAME, V1_FORMAT_RECIPE_FILE_NAME, RecipeReaderFlags
+from conda_recipe_manager.utils.meta import get_crm_version
 
 # When performing a bulk operation, overall "success" is indicated by the % of recipe files that were converted
 # "successfully"
@@ -85,6 +87,91 @@ def _record_unrecoverable_failure(
     return conversion_result
 
 
+def _get_conversion_cache_file(cache_dir: Path, recipe_content: str, conversion_options: tuple[object, ...]) -> Path:
+    """
+    Determines where the cached conversion results of a recipe file are stored. Entries are keyed on the recipe file
+    contents, the options that change the conversion results, and the version of this project.
+
+    :param cache_dir: Directory containing cached conversion results.
+    :param recipe_content: Contents of the recipe file to convert.
+    :param conversion_options: Options provided by the user that change the conversion results.
+    :returns: Path to the cache file for this conversion.
+    """
+    hasher: Final = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{get_crm_version()}{conversion_options}\0".encode())
+    hasher.update(recipe_content.encode())
+    return cache_dir / f"{hasher.hexdigest()}.json"
+
+
+def _read_conversion_cache(cache_file: Path) -> Optional[tuple[str, MessageTable]]:
+    """
+    Reads previously cached conversion results.
+
+    :param cache_file: Cache file to read from.
+    :returns: The converted recipe and the messages logged while converting it. `None` if there is no usable entry.
+    """
+    try:
+        cache_entry: Final = cast(
+            dict[str, str | dict[str, list[str]]], json.loads(cache_file.read_text(encoding="utf-8"))
+        )
+        content: Final = cache_entry["content"]
+        messages: Final = cache_entry["messages"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if not isinstance(content, str) or not isinstance(messages, dict):
+        return None
+
+    msg_tbl: Final = MessageTable()
+    for category in MessageCategory:
+        for msg in messages.get(category, []):
+            msg_tbl.add_message(category, msg)
+    return content, msg_tbl
+
+
+def _write_conversion_cache(cache_file: Path, conversion_result: ConversionResult) -> None:
+    """
+    Caches the results of a successful conversion. Failing to write to the cache does not fail the conversion.
+
+    :param cache_file: Cache file to write to.
+    :param conversion_result: Results of the conversion to cache.
+    """
+    cache_entry: Final = {
+        "content": conversion_result.content,
+        "messages": {category: conversion_result.msg_tbl.get_messages(category) for category in MessageCategory},
+    }
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache_entry), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _output_conversion_result(
+    conversion_result: ConversionResult, output: Optional[Path], print_output: bool
+) -> ConversionResult:
+    """
+    Convenience function that prints or dumps the converted recipe file and sets the final return code.
+
+    :param conversion_result: Results of a successful conversion.
+    :param output: If specified, the file contents are written to this file path. Otherwise, the file is dumped to
+        STDOUT IF `print_output` is set to `True`.
+    :param print_output: Prints the recipe to STDOUT/STDERR if the output file is not specified and this flag is `True`.
+    :returns: The final `conversion_result` instance that should be returned immediately.
+    """
+    # Print or dump the results to a file. Printing is disabled for bulk operations.
+    print_out(conversion_result.content, print_enabled=print_output and (output is None))
+    if output is not None:
+        print_err(
+            "WARNING: File is not called `recipe.yaml`.",
+            print_enabled=print_output and os.path.basename(output) != "recipe.yaml",
+        )
+        with open(output, "w", encoding="utf-8") as fptr:
+            fptr.write(conversion_result.content)
+
+    conversion_result.set_return_code()
+    return conversion_result
+
+
 def convert_file(
     file_path: Path,
     output: Optional[Path],
@@ -92,6 +179,7 @@ def convert_file(
     debug: bool,
     fail_on_unsupported_jinja: bool,
     also_test_latest_python: bool = False,
+    cache_dir: Optional[Path] = None,
 ) -> ConversionResult:
     """
     Converts a single recipe file to the V1 format, tracking results.
@@ -104,6 +192,8 @@ def convert_file(
     :param fail_on_unsupported_jinja: If set, the conversion process will exit with a failure if unsupported JINJA is
         encountered in the V0 recipe.
     :param also_test_latest_python: If set, expand python_version to a list that also tests on the latest Python.
+    :param cache_dir: (Optional) If specified, conversion results are cached in this directory. Recipe files that
+        have been previously converted with the same options are not converted again. Ignored in debug mode.
     :returns: A struct containing the results of the conversion process, including debugging metadata.
     """
     # pylint: disable=too-complex
@@ -124,6 +214,17 @@ def convert_file(
             e,
         )
 
+    # Skip the conversion entirely if this recipe file has been converted before.
+    cache_file: Optional[Path] = None
+    if cache_dir is not None and not debug:
+        cache_file = _get_conversion_cache_file(
+            cache_dir, recipe_content, (fail_on_unsupported_jinja, also_test_latest_python)
+        )
+        cache_entry: Final = _read_conversion_cache(cache_file)
+        if cache_entry is not None:
+            conversion_result.content, conversion_result.msg_tbl = cache_entry
+            return _output_conversion_result(conversion_result, output, print_output)
+
     # Pre-process the recipe
     try:
         recipe_content = RecipeParserConvert.pre_process_recipe_text(recipe_content)
@@ -206,6 +307,16 @@ def convert_file(
         # Print the new parser, if requested
         print_err("########## CONVERTED RECIPE FILE ##########", print_enabled=debug)
         print_err(debug_new_parser, print_enabled=debug)
+    # The working copy of the recipe is parsed when the conversion starts.
+    except ParsingException as e:
+        return _record_unrecoverable_failure(
+            conversion_result,
+            ExitCode.PARSE_EXCEPTION,
+            "EXCEPTION: An exception occurred while parsing the recipe file",
+            print_output,
+            debug,
+            e,
+        )
     except Exception as e:  # pylint: disable=broad-exception-caught
         return _record_unrecoverable_failure(
             conversion_result,
@@ -216,18 +327,9 @@ def convert_file(
             e,
         )
 
-    # Print or dump the results to a file. Printing is disabled for bulk operations.
-    print_out(conversion_result.content, print_enabled=print_output and (output is None))
-    if output is not None:
-        print_err(
-            "WARNING: File is not called `recipe.yaml`.",
-            print_enabled=print_output and os.path.basename(output) != "recipe.yaml",
-        )
-        with open(output, "w", encoding="utf-8") as fptr:
-            fptr.write(conversion_result.content)
-
-    conversion_result.set_return_code()
-    return conversion_result
+    if cache_file is not None:
+        _write_conversion_cache(cache_file, conversion_result)
+    return _output_conversion_result(conversion_result, output, print_output)
 
 
 def process_recipe(
@@ -237,6 +339,7 @@ def process_recipe(
     debug: bool,
     fail_on_unsupported_jinja: bool,
     also_test_latest_python: bool = False,
+    cache_dir: Optional[Path] = None,
 ) -> tuple[str, ConversionResult]:
     """
     Helper function that performs the conversion operation for parallelizable execution.
@@ -248,10 +351,13 @@ def process_recipe(
     :param fail_on_unsupported_jinja: If set, the conversion process will exit with a failure if unsupported JINJA is
         encountered in the V0 recipe.
     :param also_test_latest_python: If set, expand python_version to a list that also tests on the latest Python.
+    :param cache_dir: (Optional) If specified, conversion results are cached in this directory.
     :returns: Tuple containing the key/value pairing that tracks the result of the conversion operation
     """
     out_file: Optional[Path] = None if output is None else file.parent / output
-    conversion_result = convert_file(file, out_file, False, debug, fail_on_unsupported_jinja, also_test_latest_python)
+    conversion_result = convert_file(
+        file, out_file, False, debug, fail_on_unsupported_jinja, also_test_latest_python, cache_dir
+    )
     conversion_result.project_name = file.relative_to(path).parts[0]
     return str(file.relative_to(path)), conversion_result
 
@@ -349,6 +455,15 @@ def _collect_issue_stats(project_name: str, issues: list[str], hist: dict[str, i
         " that tests on both the minimum and latest Python."
     ),
 )
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False, path_type=Path),
+    default=None,
+    help=(
+        "Directory to cache conversion results in. Recipe files that have already been converted with the same"
+        " options and version of this tool are not converted again."
+    ),
+)
 def convert(
     path: Path,
     output: Optional[Path],
@@ -357,6 +472,7 @@ def convert(
     debug: bool,
     fail_on_unsupported_jinja: bool,
     also_test_latest_python: bool,
+    cache_dir: Optional[Path],
 ) -> None:  # pylint: disable=redefined-outer-name
     """
     Recipe conversion CLI utility. By default, recipes print to STDOUT. Messages always print to STDERR. Takes 1 file or
@@ -370,7 +486,7 @@ def convert(
     ## Single-file case ##
     if len(files) == 1:
         result: Final[ConversionResult] = convert_file(
-            files[0], output, True, debug, fail_on_unsupported_jinja, also_test_latest_python
+            files[0], output, True, debug, fail_on_unsupported_jinja, also_test_latest_python, cache_dir
         )
         result.msg_tbl.print_messages_by_category(MessageCategory.WARNING)
         result.msg_tbl.print_messages_by_category(MessageCategory.ERROR)
@@ -386,7 +502,8 @@ def convert(
             pool.starmap(
                 process_recipe,
                 [  # type: ignore[misc]
-                    (file, path, output, debug, fail_on_unsupported_jinja, also_test_latest_python) for file in files
+                    (file, path, output, debug, fail_on_unsupported_jinja, also_test_latest_python, cache_dir)
+                    for file in files
                 ],
             )
         )
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import difflib
 import json
+from functools import lru_cache
 from importlib.resources import files
 from importlib.resources.abc import Traversable
 from typing import Final, Optional, cast
@@ -76,6 +77,11 @@ class SpdxUtils:
             self._license_matching_table[license_id] = license_id
             self._license_ids_normalized_table[license_id.upper()] = license_id
 
+        # Bucket the matching table's keys by length to prune approximate-match searches.
+        self._license_matching_keys_by_len: dict[int, list[str]] = {}
+        for key in self._license_matching_table:
+            self._license_matching_keys_by_len.setdefault(len(key), []).append(key)
+
     def _match_gpl_license(self, sanitized_license: str) -> Optional[str]:
         """
         Attempt to upgrade GPL licenses to their newer naming schemes. Annoyingly the JSON data does not map old
@@ -98,6 +104,54 @@ class SpdxUtils:
 
         return None
 
+    def _get_closest_matching_key(self, license_field: str) -> Optional[str]:
+        """
+        Finds the key in the license matching table that is most similar to the provided license. This produces the
+        same result as `difflib.get_close_matches(license_field, <keys>, n=1)`, but candidates are visited in order of
+        their best possible similarity score (which is bound by the difference in string lengths), so the search stops
+        as soon as no remaining candidate can beat the current best match.
+
+        :param license_field: License string provided by the recipe to match
+        :returns: The closest matching key in the license matching table, if one is similar enough.
+        """
+        matcher: Final = difflib.SequenceMatcher()
+        matcher.set_seq2(license_field)
+        field_len: Final = len(license_field)
+        max_key_len: Final = max(self._license_matching_keys_by_len, default=0)
+        # `difflib`'s default similarity cutoff
+        best_score = 0.6
+        best_key: Optional[str] = None
+
+        def _max_score(key_len: int) -> float:
+            # A key's length limits its similarity score, no matter its contents (see `real_quick_ratio()`).
+            total_len: Final = key_len + field_len
+            return 2.0 * min(key_len, field_len) / total_len if total_len else 1.0
+
+        for len_diff in range(max(field_len, max_key_len) + 1):
+            # Scores are bound by lower values as the length difference grows, so the search can end once no key of
+            # either length can compete with the current best match.
+            key_lens = [field_len + len_diff]
+            if 0 < len_diff <= field_len:
+                key_lens.append(field_len - len_diff)
+            if all(_max_score(key_len) < best_score for key_len in key_lens):
+                break
+            for key_len in key_lens:
+                for key in self._license_matching_keys_by_len.get(key_len, []):
+                    matcher.set_seq1(key)
+                    if (
+                        matcher.real_quick_ratio() >= best_score
+                        and matcher.quick_ratio() >= best_score
+                        and (score := matcher.ratio()) >= best_score
+                        # Ties are broken the same way as `difflib.get_close_matches()`
+                        and (score > best_score or best_key is None or key > best_key)
+                    ):
+                        best_score = score
+                        best_key = key
+
+        return best_key
+
+    # The same licenses appear across many recipes (and outputs). As this class is read-only, results are memoized.
+    @lru_cache(maxsize=2048)  # type: ignore[misc]
     def find_closest_license_match(self, license_field: str) -> Optional[str]:
         """
         Given a license string from a recipe file (from `/about/license`), return the most likely ID in the SPDX
@@ -134,13 +188,9 @@ class SpdxUtils:
         if "," in sanitized_license:
             return None
 
-        match_list = difflib.get_close_matches(license_field, self._license_matching_table.keys(), 1)
-        if not match_list:
-            return None
-
-        match_key = match_list[0]
+        match_key: Final = self._get_closest_matching_key(license_field)
         # This shouldn't be possible, but we'll guard against it to prevent an illegal dictionary access anyways
-        if match_key not in self._license_matching_table:
+        if match_key is None or match_key not in self._license_matching_table:
             return None
 
         return self._license_matching_table[match_key]
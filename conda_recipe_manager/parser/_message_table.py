@@ -4,7 +4,7 @@
 
 import sys
 from enum import StrEnum, auto
-from typing import Final
+from typing import Final, cast
 
 
 class MessageCategory(StrEnum):
@@ -29,18 +29,21 @@ class MessageTable:
         """
         Constructs an empty message table
         """
-        self._tbl: dict[MessageCategory, list[str]] = {}
+        # Messages with arguments are stored unformatted, as a `(message, args)` pair, until they are first read.
+        self._tbl: dict[MessageCategory, list[str | tuple[str, tuple[object, ...]]]] = {}
 
-    def add_message(self, category: MessageCategory, message: str) -> None:
+    def add_message(self, category: MessageCategory, message: str, *args: object) -> None:
         """
-        Adds a message to the table
+        Adds a message to the table. Like the standard Python library logger, `%`-style formatting of the message with
+        any provided arguments is deferred until the message is read.
 
         :param category:
         :param message:
+        :param args: (Optional) Arguments to format the message with.
         """
         if category not in self._tbl:
             self._tbl[category] = []
-        self._tbl[category].append(message)
+        self._tbl[category].append((message, args) if args else message)
 
     def get_messages(self, category: MessageCategory) -> list[str]:
         """
@@ -51,7 +54,12 @@ class MessageTable:
         """
         if category not in self._tbl:
             return []
-        return self._tbl[category]
+        msgs: Final = self._tbl[category]
+        # Format deferred messages in-place, so that formatting only occurs once.
+        for i, msg in enumerate(msgs):
+            if isinstance(msg, tuple):
+                msgs[i] = msg[0] % msg[1]
+        return cast(list[str], msgs)
 
     def get_message_count(self, category: MessageCategory) -> int:
         """
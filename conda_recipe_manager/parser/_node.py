@@ -114,6 +114,34 @@ class Node:
             f"  - Key?:         {self.key_flag}\n"
         )
 
+    def clone(self) -> Node:
+        """
+        Produces a structural copy of this node and all of its descendants. This intentionally bypasses
+        `copy.deepcopy()` so that the shared sentinel value is preserved by reference.
+
+        :returns: A new node tree, equivalent to this one.
+        """
+
+        def _clone_without_children(node: Node) -> Node:
+            return Node(
+                value=list(node.value) if isinstance(node.value, list) else node.value,
+                comment=node.comment,
+                comment_pos=node.comment_pos,
+                list_member_flag=node.list_member_flag,
+                multiline_variant=node.multiline_variant,
+                key_flag=node.key_flag,
+            )
+
+        root: Final = _clone_without_children(self)
+        # The tree is copied with an explicit stack, instead of recursion, so deeply nested trees do not exhaust the
+        # call stack. Each entry tracks an original node and the copy whose children still need to be populated.
+        stack: Final[list[tuple[Node, Node]]] = [(self, root)]
+        while stack:
+            original, copy = stack.pop()
+            copy.children = [_clone_without_children(child) for child in original.children]
+            stack.extend(zip(original.children, copy.children))
+        return root
+
     def short_str(self) -> str:
         """
         Renders the Node as a simple string. Useful for other `__str__()` functions to call.
@@ -8,8 +8,7 @@ from __future__ import annotations
 import json
 from typing import Final, Optional
 
-from conda_recipe_manager.parser._types import Regex
-from conda_recipe_manager.parser._utils import search_any_regex
+from conda_recipe_manager.parser._utils import contains_jinja_function
 from conda_recipe_manager.parser.selector_parser import SelectorParser
 from conda_recipe_manager.parser.types import TAB_SPACE_COUNT, SchemaVersion
 from conda_recipe_manager.types import JsonType
@@ -85,7 +84,7 @@ class NodeVar:
         if (
             isinstance(self._value, str)
             and not self._value.startswith("env.get(")
-            and not search_any_regex(Regex.JINJA_FUNCTIONS_SET, self._value)
+            and not contains_jinja_function(self._value)
         ):
             return f"'{self._value}'" if '"' in self._value else f'"{self._value}"'
         # Render lists as multiline strings for better readability.
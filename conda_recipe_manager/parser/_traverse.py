@@ -155,12 +155,7 @@ def traverse_with_index(root: Node, path: StrStack) -> tuple[Optional[Node], int
     return node, virt_idx, phys_idx
 
 
-def traverse_all(
-    node: Optional[Node],
-    func: Callable[[Node, StrStack], None],
-    path: Optional[StrStackImmutable] = None,
-    idx_num: int = 0,
-) -> None:
+def traverse_all(node: Optional[Node], func: Callable[[Node, StrStack], None]) -> None:
     """
     Given a node, traverse all child nodes and apply a function to each node. Useful for updating or extracting
     information on the whole tree.
@@ -170,23 +165,63 @@ def traverse_all(
 
     :param node: Node to start with
     :param func: Function to apply against all traversed nodes.
-    :param path: CALLERS: DO NOT SET. This value tracks the current path of a node. This should only be specified in
-        recursive calls to this function. Tuples are used for their immutability, so paths change based on the current
-        stack frame.
-    :param idx_num: CALLERS: DO NOT SET. Used in recursive calls to track the index position of a list-member node.
     """
     if node is None:
         return
-    # Initialize, if on the root node. Otherwise build-up the path
-    if path is None:
-        path = (ROOT_NODE_VALUE,)
-    elif node.list_member_flag:
-        path = (str(idx_num),) + path
-    # Leafs do not contain their values in the path, unless the leaf is an empty key (as the key is part of the path).
-    elif not node.is_strong_leaf():
-        path = (str(node.value),) + path
-    func(node, list(path))
-    # Used for paths that contain lists of items
-    mapping = remap_child_indices_phys_to_virt(node.children)
-    for i in range(len(node.children)):
-        traverse_all(node.children[i], func, path, mapping[i])
+    # Nodes are visited depth-first and in order (parents before their children), with an explicit stack instead of
+    # recursion. Each entry tracks a node, the path of its parent and its (virtual) index in the parent. Paths are
+    # stored as tuples, with the root at the end, so that siblings can share the path of their parent.
+    stack: Final[list[tuple[Node, StrStackImmutable, int]]] = [(node, (), 0)]
+    while stack:
+        cur, path, idx_num = stack.pop()
+        # Initialize, if on the root node. Otherwise build-up the path
+        if not path:
+            path = (ROOT_NODE_VALUE,)
+        elif cur.list_member_flag:
+            path = (str(idx_num),) + path
+        # Leafs do not contain their values in the path, unless the leaf is an empty key (as the key is part of the
+        # path).
+        elif not cur.is_strong_leaf():
+            path = (str(cur.value),) + path
+        func(cur, list(path))
+        # Used for paths that contain lists of items. Children are pushed in reverse, so they are visited in order.
+        mapping = remap_child_indices_phys_to_virt(cur.children)
+        for i in range(len(cur.children) - 1, -1, -1):
+            stack.append((cur.children[i], path, mapping[i]))
+
+
+def traverse_all_str_paths(node: Optional[Node], func: Callable[[Node, str], None]) -> None:
+    """
+    Equivalent of `traverse_all()` that provides the path of each node as a string, instead of as a stack. Paths are
+    built-up incrementally from the path of the parent node, which is cheaper than converting a stack for every node.
+
+    NOTE: The paths provided will return virtual indices, not physical indices. In other words, comments in a list do
+          not count towards the index position of a list member.
+
+    :param node: Node to start with
+    :param func: Function to apply against all traversed nodes.
+    """
+    if node is None:
+        return
+    # Each entry tracks a node, the path of its parent (`None` for the starting node) and its (virtual) index in the
+    # parent. Paths are built with the same rules as `traverse_all()` and `stack_path_to_str()`.
+    stack: Final[list[tuple[Node, Optional[str], int]]] = [(node, None, 0)]
+    while stack:
+        cur, parent_path, idx_num = stack.pop()
+        path = ""
+        if parent_path is not None:
+            path = parent_path
+            segment: Optional[str] = None
+            if cur.list_member_flag:
+                segment = str(idx_num)
+            # Leafs do not contain their values in the path, unless the leaf is an empty key (as the key is part of the
+            # path).
+            elif not cur.is_strong_leaf():
+                segment = str(cur.value)
+            if segment is not None and segment != ROOT_NODE_VALUE:
+                path = f"{parent_path}/{segment}"
+        func(cur, path)
+        # Used for paths that contain lists of items. Children are pushed in reverse, so they are visited in order.
+        mapping = remap_child_indices_phys_to_virt(cur.children)
+        for i in range(len(cur.children) - 1, -1, -1):
+            stack.append((cur.children[i], path, mapping[i]))
@@ -29,6 +29,15 @@ StrStackImmutable = tuple[str, ...]
 ROOT_NODE_VALUE: Final[str] = "/"
 # Marker used to temporarily work around some Jinja-template parsing issues
 RECIPE_MANAGER_SUB_MARKER: Final[str] = "__RECIPE_MANAGER_SUBSTITUTION_MARKER__"
+# Every pattern in `Regex.JINJA_FUNCTIONS_SET` requires at least one of these characters to match. Strings that
+# contain none of them can be rejected without running any regular expressions.
+JINJA_FUNCTION_TRIGGER_CHARS: Final[frozenset[str]] = frozenset("|([+")
+# Every `Regex.AMBIGUOUS_DEP_*` pattern requires at least one of these (operator) characters to match.
+AMBIGUOUS_DEP_TRIGGER_CHARS: Final[frozenset[str]] = frozenset("<>=~!")
+# Plain (unquoted) words that a YAML 1.1 parser does not interpret as strings (booleans and nulls), in lower-case.
+YAML_NON_STR_PLAIN_WORDS: Final[frozenset[str]] = frozenset(
+    {"y", "n", "yes", "no", "true", "false", "on", "off", "null"}
+)
 
 
 class CanonicalSortOrder:
@@ -163,6 +172,8 @@ class Regex:
 
     ## V0 Formatter regular expressions ##
     V0_FMT_SECTION_HEADER: Final[re.Pattern[str]] = re.compile(r"^[\w|-]+:$")
+    # Matches the block of comment-only lines found at the very start of a formatted V0 recipe file.
+    V0_FMT_TOF_COMMENTS: Final[re.Pattern[str]] = re.compile(r"(?:#[^\n]*\n)*")
 
     ## Pre-process conversion tooling regular expressions ##
     # Finds `environ[]` used by a some recipe files. Requires a whitespace character to prevent matches with
@@ -194,8 +205,7 @@ class Regex:
     # Attempts to normalize multiline strings containing quoted escaped newlines.
     PRE_PROCESS_QUOTED_MULTILINE_STRINGS: Final[re.Pattern[str]] = re.compile(r"(\s*)(.*):\s*['\"](.*)\\n(.*)['\"]")
     # rattler-build@0.18.0 deprecates `min_pin` and `max_pin`
-    PRE_PROCESS_MIN_PIN_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"min_pin=")
-    PRE_PROCESS_MAX_PIN_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"max_pin=")
+    PRE_PROCESS_MIN_MAX_PIN_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"(min|max)_pin=")
 
     # Attempts to normalize compact nested list syntax into the equivalent expanded form.
     PRE_PROCESS_COMPACT_NESTED_LIST: Final[re.Pattern[str]] = re.compile(r"^([ \t]*)-[ \t]+-[ \t]+")
@@ -210,14 +220,16 @@ class Regex:
     )
 
     ## Selector Replacements ##
-    # Replaces Python version expressions with the newer V1 `match()` function
+    # Replaces Python version expressions with the newer V1 `match()` function. All supported variants are matched in
+    # a single pass. In order, the alternatives match:
+    #   - Comparisons, like `py<36` or `py != 310`
+    #   - Equality short-hand, like `py36`
+    #   - Major version short-hand, like `py2k`
     SELECTOR_PYTHON_VERSION_REPLACEMENT: Final[re.Pattern[str]] = re.compile(
-        r"py\s*(<|>|<=|>=|==|!=|~=)\s*(3|2)([0-9]+)"
+        r"py\s*(?P<op><|>|<=|>=|==|!=|~=)\s*(?P<major>3|2)(?P<minor>[0-9]+)"
+        r"|py(?P<eq_major>3|2)(?P<eq_minor>[0-9]+)"
+        r"|py(?P<k_major>3|2)k"
     )
-    SELECTOR_PYTHON_VERSION_EQ_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"py(3|2)([0-9]+)")
-    SELECTOR_PYTHON_VERSION_NE_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"not py(3|2)([0-9]+)")
-    SELECTOR_PYTHON_VERSION_PY2K_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"py2k")
-    SELECTOR_PYTHON_VERSION_PY3K_REPLACEMENT: Final[re.Pattern[str]] = re.compile(r"py3k")
 
     ## Jinja regular expressions ##
     JINJA_V0_SUB: Final[re.Pattern[str]] = re.compile(r"{{\s*" + _JINJA_VAR_FUNCTION_PATTERN + r"\s*}}")
@@ -231,14 +243,20 @@ class Regex:
     # Detects multi-line JINJA set statements.
     # re.DOTALL and '.+?' are used for the same reasons as above.
     # The named capture group 'jinja' is used to capture the JINJA statement,
-    # and allows for easier NodeVar construction.
+    # and allows for easier NodeVar construction. The named capture groups 'key' and 'value' capture the variable name
+    # (up to the first `=`) and the un-stripped value being set.
     JINJA_V0_SET_MULTI_LINE: Final[re.Pattern[str]] = re.compile(
-        r"^[ \t]*(?P<jinja>{%[ \t]*set[ \t]*"
+        r"^[ \t]*(?P<jinja>{%[ \t]*set[ \t]*(?P<key>"
         + _JINJA_VAR_FUNCTION_PATTERN
-        + r"[ \t]*=.+?%})"
+        + r"?)[ \t]*=(?P<value>.+?)%})"
         + _JINJA_OPTIONAL_EOL_COMMENT,
         flags=re.MULTILINE | re.DOTALL,
     )
+    # Detects the start of a string that may be a Python literal (numbers, strings, bytes, containers, and keywords).
+    # Anything else is not evaluated by `ast.literal_eval()`.
+    PY_LITERAL_PREFIX: Final[re.Pattern[str]] = re.compile(
+        r"[0-9\"'\[\{\(\-\+\.]|(?:True|False|None)$|[rRbBuU]{1,2}[\"']"
+    )
     # Useful for replacing the older `{{` JINJA substitution with the newer `${{` WITHOUT accidentally doubling-up the
     # newer syntax when multiple replacements are possible.
     JINJA_REPLACE_V0_STARTING_MARKER: Final[re.Pattern[str]] = re.compile(r"(?<!\$)\{\{")
@@ -276,6 +294,8 @@ class Regex:
         JINJA_FUNCTION_ADD_CONCAT,
         JINJA_FUNCTION_MATCH,
     }
+    # All patterns in `JINJA_FUNCTIONS_SET`, fused into one alternation so that a string can be checked in one search.
+    JINJA_FUNCTIONS_ANY: Final[re.Pattern[str]] = re.compile("|".join(f"(?:{r.pattern})" for r in JINJA_FUNCTIONS_SET))
 
     # Matches a JINJA variable's value that contains a ternary operation. Example value: 'm2-' if win else ''
     # Full support for evaluating is tracked in #285, but it is unclear if support for this in V1 is needed.
@@ -290,7 +310,9 @@ class Regex:
     #   - We use `[ \t]` over `\s` as YAML is pretty clear about delimiting by _space_ characters for multiline strings.
     #     Although tabs are not recognized by YAML, we support them in the off chance some have made their way into
     #     a recipe file by accident.
-    MULTILINE_RAW_LOOKAHEAD: Final[re.Pattern[str]] = re.compile(r":[ \t]+|:$|[ \t]+#|^#")
+    #   - A single whitespace character is enough to detect a match. Matching runs of whitespace takes quadratic time on
+    #     deeply indented lines.
+    MULTILINE_RAW_LOOKAHEAD: Final[re.Pattern[str]] = re.compile(r":[ \t]|:$|[ \t]#|^#")
     # Detects the special "raw" multiline strings.
     MULTILINE_RAW: Final[re.Pattern[str]] = re.compile(r"^[ \t]*(.*):[ \t]+(.*)$")
     MULTILINE_RAW_LIST: Final[re.Pattern[str]] = re.compile(r"^[ \t]*(-[ \t]+)(.*)$")
@@ -298,15 +320,25 @@ class Regex:
     MULTILINE_RAW_CAPTURE_GROUP_FIRST_VALUE: Final[int] = 2
     # Detects the 6 common variants (3 |'s, 3 >'s). See this guide for more info:
     #   https://stackoverflow.com/questions/3790454/how-do-i-break-a-string-in-yaml-over-multiple-lines/21699210
-    _BLOCK_SCALAR_GROUPS: Final[str] = r"(\||>)(\+|\-)?"
+    _BLOCK_SCALAR_GROUPS: Final[str] = r"((?:\||>)(?:\+|\-)?)"
     MULTILINE_VARIANT: Final[re.Pattern[str]] = re.compile(r"^[ \t]*.*:[ \t]+" + _BLOCK_SCALAR_GROUPS)
     MULTILINE_VARIANT_LIST: Final[re.Pattern[str]] = re.compile(r"^[ \t]*-[ \t]+" + _BLOCK_SCALAR_GROUPS)
-    # Group where the "variant" string is identified. These indices are the same, no matter which regex is used.
-    MULTILINE_VARIANT_CAPTURE_GROUP_CHAR: Final[int] = 1
-    MULTILINE_VARIANT_CAPTURE_GROUP_SUFFIX: Final[int] = 2
+    # Group where the full "variant" string (the marker and an optional sign) is identified. This index is the same, no
+    # matter which regex is used.
+    MULTILINE_VARIANT_CAPTURE_GROUP: Final[int] = 1
 
     DETECT_TRAILING_COMMENT: Final[re.Pattern[str]] = re.compile(r"([ \t])+(#)")
 
+    # Detects lines that are a `key:`, `key: value` or `- value` pairing of "plain" words that start with a letter. Such
+    # words can only be interpreted by a YAML parser as strings, booleans, or nulls.
+    _PLAIN_WORD: Final[str] = r"[a-zA-Z_][a-zA-Z0-9_\.\-/]*"
+    PLAIN_WORDS_LINE: Final[re.Pattern[str]] = re.compile(
+        rf"(?:(?P<key>{_PLAIN_WORD}):(?: (?P<value>{_PLAIN_WORD}))?|- (?P<item>{_PLAIN_WORD}))"
+    )
+    # Detects "plain" scalars made of space-separated words, starting with a plain word (i.e. `foo >=1.2,<2 *_0`). A
+    # YAML parser can only interpret a single word as a string, boolean, or null and multiple words as a string.
+    PLAIN_SCALAR: Final[re.Pattern[str]] = re.compile(rf"{_PLAIN_WORD}(?: +[a-zA-Z0-9_\.\-/\*<>=~,\+]+)*")
+
     # Regex to detect output section paths
     OUTPUT_SECTION_PATH: Final[re.Pattern[str]] = re.compile(r"^/outputs/\d+")
 
@@ -6,10 +6,11 @@ from __future__ import annotations
 
 import json
 import re
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from typing import Final, cast
 
 from conda_recipe_manager.parser._types import (
+    JINJA_FUNCTION_TRIGGER_CHARS,
     RECIPE_MANAGER_SUB_MARKER,
     ROOT_NODE_VALUE,
     Regex,
@@ -104,13 +105,8 @@ def num_tab_spaces(s: str) -> int:
     :param s: Target string
     :returns: Number of preceding spaces in a string
     """
-    cntr: int = 0
-    for c in s:
-        if c == " ":
-            cntr += 1
-        else:
-            break
-    return cntr
+    # Stripping is performed in C, which is much faster than counting characters in a Python loop.
+    return len(s) - len(s.lstrip(" "))
 
 
 def substitute_markers(s: str, subs: list[str]) -> str:
@@ -121,10 +117,15 @@ def substitute_markers(s: str, subs: list[str]) -> str:
     :param subs: List of substitutions to make, in order of appearance
     :returns: New string, with substitutions removed
     """
-    while s.find(RECIPE_MANAGER_SUB_MARKER) >= 0 and len(subs):
-        s = s.replace(RECIPE_MANAGER_SUB_MARKER, subs[0], 1)
-        subs.pop(0)
-    return s
+    # Splitting the string once avoids re-scanning the string for every marker. Substitutions are consumed from `subs`,
+    # as the list is shared across all the values parsed from a single line.
+    parts: Final = s.split(RECIPE_MANAGER_SUB_MARKER)
+    sub_cnt: Final = min(len(parts) - 1, len(subs))
+    if sub_cnt == 0:
+        return s
+    substituted: Final = "".join(part + sub for part, sub in zip(parts, subs[:sub_cnt]))
+    del subs[:sub_cnt]
+    return substituted + RECIPE_MANAGER_SUB_MARKER.join(parts[sub_cnt:])
 
 
 def _quote_special_str_startswith_check_all(s: str) -> bool:
@@ -285,3 +286,40 @@ def search_any_regex(re_set: Iterable[re.Pattern[str]], s: str) -> bool:
             return True
 
     return False
+
+
+def contains_jinja_function(s: str) -> bool:
+    """
+    Indicates if a string contains a recognized JINJA function. This is equivalent to checking `s` against every
+    pattern in `Regex.JINJA_FUNCTIONS_SET`, but strings that cannot possibly match are rejected without running any
+    regular expressions.
+
+    :param s: Target string
+    :returns: True if the string contains a JINJA function. False otherwise.
+    """
+    if JINJA_FUNCTION_TRIGGER_CHARS.isdisjoint(s):
+        return False
+    return Regex.JINJA_FUNCTIONS_ANY.search(s) is not None
+
+
+def iter_jinja_v0_set_statements(content: str) -> Iterator[re.Match[str]]:
+    """
+    Finds all the V0 JINJA set statements in a recipe file. This is equivalent to calling
+    `Regex.JINJA_V0_SET_MULTI_LINE.finditer()`, but the regular expression is only run on lines that start a JINJA
+    statement, which are found with (much faster) plain string searches.
+
+    :param content: Recipe file content to search
+    :returns: An iterator of matches, in order of appearance.
+    """
+    pos = 0
+    while (start_idx := content.find("{%", pos)) >= 0:
+        # Statements must start a line, ignoring indentation.
+        line_idx = content.rfind("\n", 0, start_idx) + 1
+        match = None
+        if not content[line_idx:start_idx].strip(" \t"):
+            match = Regex.JINJA_V0_SET_MULTI_LINE.match(content, line_idx)
+        if match is None:
+            pos = start_idx + 2
+            continue
+        yield match
+        pos = match.end()
@@ -12,9 +12,9 @@ from conda_recipe_manager.parser.platform_types import (
     ALL_OPERATING_SYSTEMS,
     ALL_PLATFORM_ALIASES,
     Platform,
-    get_platforms_by_alias,
-    get_platforms_by_arch,
-    get_platforms_by_os,
+    get_platforms_by_alias_canon,
+    get_platforms_by_arch_canon,
+    get_platforms_by_os_canon,
 )
 from conda_recipe_manager.types import Primitives
 
@@ -45,11 +45,11 @@ class BuildContext:
         context["build_platform"] = platform.value
         context["target_platform"] = platform.value
         for alias in ALL_PLATFORM_ALIASES:
-            context[alias.value] = platform in get_platforms_by_alias(alias)
+            context[alias.value] = platform in get_platforms_by_alias_canon(alias)
         for arch in ALL_ARCHITECTURES:
-            context[arch.value] = platform in get_platforms_by_arch(arch)
+            context[arch.value] = platform in get_platforms_by_arch_canon(arch)
         for os in ALL_OPERATING_SYSTEMS:
-            context[os.value] = platform in get_platforms_by_os(os)
+            context[os.value] = platform in get_platforms_by_os_canon(os)
         return context
 
     def _check_and_convert_to_int(self, key: BuildContextKey) -> int:
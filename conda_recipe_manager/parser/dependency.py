@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from enum import Enum, auto
+from functools import lru_cache
 from typing import NamedTuple, Optional, cast
 
 from conda.models.match_spec import InvalidMatchSpec, MatchSpec
@@ -157,6 +158,20 @@ class DependencyVariable:
 DependencyData = MatchSpec | DependencyVariable
 
 
+@lru_cache(maxsize=4096)  # type: ignore[misc]
+def match_spec_from_str(s: str) -> MatchSpec:
+    """
+    Constructs a `MatchSpec` from a dependency string. Parsing a `MatchSpec` is relatively expensive and recipes tend to
+    repeat the same dependencies across sections and outputs, so results are memoized. `MatchSpec` instances are
+    immutable, so they are safe to share.
+
+    :param s: String to process.
+    :raises InvalidMatchSpec: If the string could not be parsed.
+    :returns: A `MatchSpec` instance.
+    """
+    return MatchSpec(s)
+
+
 def dependency_data_from_str(s: str) -> DependencyData:
     """
     Constructs a `DependencyData` object from a dependency string in a recipe file.
@@ -168,7 +183,7 @@ def dependency_data_from_str(s: str) -> DependencyData:
         return DependencyVariable(s)
 
     try:
-        return MatchSpec(s)
+        return match_spec_from_str(s)
     except (ValueError, InvalidMatchSpec):
         # In an effort to be more resilient, fallback to the simpler type.
         return DependencyVariable(s)
@@ -8,8 +8,10 @@ Resources:
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from enum import StrEnum
-from typing import Final
+from functools import lru_cache
+from typing import Final, TypeVar
 
 
 class OperatingSystem(StrEnum):
@@ -91,6 +93,9 @@ class Platform(StrEnum):
 # Set of all Platform options
 ALL_PLATFORMS: Final[set[Platform]] = set(Platform)
 
+# Shared empty result, returned when a platform qualifier is not recognized.
+_EMPTY_PLATFORMS: Final[frozenset[Platform]] = frozenset()
+
 # No-arch indicates that there is no specific target platform.
 NO_ARCH: Final[str] = "noarch"
 
@@ -98,102 +103,197 @@ NO_ARCH: Final[str] = "noarch"
 PlatformQualifiers = Arch | OperatingSystem | PlatformAlias
 
 
-def get_platforms_by_arch(arch: Arch | str) -> set[Platform]:  # pylint: disable=too-complex
+# Generic type variable for the platform qualifier enumerations
+_QualifierT = TypeVar("_QualifierT", Arch, OperatingSystem, PlatformAlias)
+
+
+def _arch_to_platforms_match(arch: Arch) -> frozenset[Platform]:
     """
-    Given an architecture, return the list of supported build platforms.
+    Maps an architecture to the set of supported build platforms. Only used to construct `_ARCH_TO_PLATFORMS`.
 
     :param arch: Target architecture
-    :returns: Set of supported platforms for that architecture. An empty set is returned if no matching architecture
-        is found.
+    :returns: Set of supported platforms for that architecture.
     """
-    if isinstance(arch, str):
-        arch_sanitized: Final[str] = arch.strip().lower()
-        if not arch_sanitized in ALL_ARCHITECTURES:
-            return set()
-        arch = Arch(arch_sanitized)
-
-    x86_64_set: Final[set[Platform]] = {Platform.LINUX_64, Platform.OSX_64, Platform.WIN_64}
+    x86_64_set: Final[frozenset[Platform]] = frozenset({Platform.LINUX_64, Platform.OSX_64, Platform.WIN_64})
 
+    # NOTE: Cases are ordered by selector-frequency, not alphabetically.
     match arch:
-        case Arch.SYS_390:
-            return {Platform.LINUX_SYS_390}
-        case Arch.X_86:
-            return {Platform.LINUX_32, Platform.WIN_32} | x86_64_set
         case Arch.X_86_64:
             return x86_64_set
-        case Arch.AARCH_64:
-            return {Platform.LINUX_AARCH_64}
         case Arch.ARM_64:
-            return {Platform.OSX_ARM_64, Platform.WIN_ARM_64}
+            return frozenset({Platform.OSX_ARM_64, Platform.WIN_ARM_64})
+        case Arch.AARCH_64:
+            return frozenset({Platform.LINUX_AARCH_64})
+        case Arch.X_86:
+            return frozenset({Platform.LINUX_32, Platform.WIN_32}) | x86_64_set
+        case Arch.SYS_390:
+            return frozenset({Platform.LINUX_SYS_390})
         case Arch.ARM_V6L:
-            return {Platform.LINUX_ARM_V6L}
+            return frozenset({Platform.LINUX_ARM_V6L})
         case Arch.ARM_V7L:
-            return {Platform.LINUX_ARM_V7L}
+            return frozenset({Platform.LINUX_ARM_V7L})
         case Arch.PPC_64_LE:
-            return {Platform.LINUX_PPC_64_LE}
+            return frozenset({Platform.LINUX_PPC_64_LE})
 
 
-def get_platforms_by_os(os: OperatingSystem | str) -> set[Platform]:
+def _os_to_platforms_match(os: OperatingSystem) -> frozenset[Platform]:
     """
-    Given an Operating System, return the list of supported build platforms.
+    Maps an Operating System to the set of supported build platforms. Only used to construct `_OS_TO_PLATFORMS`.
 
     :param os: Target operating system
-    :returns: Set of supported platforms for that OS. An empty set is returned if no matching OS is found.
+    :returns: Set of supported platforms for that OS.
     """
-    if isinstance(os, str):
-        os_sanitized: Final[str] = os.strip().lower()
-        if not os_sanitized in ALL_OPERATING_SYSTEMS:
-            return set()
-        os = OperatingSystem(os_sanitized)
-
-    osx_set: Final[set[Platform]] = {
-        Platform.OSX_64,
-        Platform.OSX_ARM_64,
-    }
-    linux_set: Final[set[Platform]] = {
-        Platform.LINUX_32,
-        Platform.LINUX_64,
-        Platform.LINUX_AARCH_64,
-        Platform.LINUX_ARM_V6L,
-        Platform.LINUX_ARM_V7L,
-        Platform.LINUX_PPC_64_LE,
-        Platform.LINUX_SYS_390,
-    }
-
+    osx_set: Final[frozenset[Platform]] = frozenset(
+        {
+            Platform.OSX_64,
+            Platform.OSX_ARM_64,
+        }
+    )
+    linux_set: Final[frozenset[Platform]] = frozenset(
+        {
+            Platform.LINUX_32,
+            Platform.LINUX_64,
+            Platform.LINUX_AARCH_64,
+            Platform.LINUX_ARM_V6L,
+            Platform.LINUX_ARM_V7L,
+            Platform.LINUX_PPC_64_LE,
+            Platform.LINUX_SYS_390,
+        }
+    )
+
+    # NOTE: Cases are ordered by selector-frequency, not alphabetically.
     match os:
         case OperatingSystem.LINUX:
             return linux_set
         case OperatingSystem.OSX:
             return osx_set
+        case OperatingSystem.WINDOWS:
+            return frozenset(
+                {
+                    Platform.WIN_32,
+                    Platform.WIN_64,
+                    Platform.WIN_ARM_64,
+                }
+            )
         case OperatingSystem.UNIX:
             return osx_set | linux_set
-        case OperatingSystem.WINDOWS:
-            return {
-                Platform.WIN_32,
-                Platform.WIN_64,
-                Platform.WIN_ARM_64,
-            }
 
 
-def get_platforms_by_alias(alias: PlatformAlias | str) -> set[Platform]:
+def _alias_to_platforms_match(alias: PlatformAlias) -> frozenset[Platform]:
     """
-    Given a platform alias, return the list of supported build platforms.
+    Maps a platform alias to the set of supported build platforms. Only used to construct `_ALIAS_TO_PLATFORMS`.
 
     :param alias: Target platform alias
-    :returns: Set of supported platforms for that alias. An empty set is returned if no matching alias is found.
+    :returns: Set of supported platforms for that alias.
     """
-    if isinstance(alias, str):
-        alias_sanitized: Final[str] = alias.strip().lower()
-        if not alias_sanitized in ALL_PLATFORM_ALIASES:
-            return set()
-        alias = PlatformAlias(alias_sanitized)
-
+    # NOTE: Cases are ordered by selector-frequency, not alphabetically.
     match alias:
-        case PlatformAlias.LINUX_32:
-            return {Platform.LINUX_32}
         case PlatformAlias.LINUX_64:
-            return {Platform.LINUX_64}
-        case PlatformAlias.WIN_32:
-            return {Platform.WIN_32}
+            return frozenset({Platform.LINUX_64})
         case PlatformAlias.WIN_64:
-            return {Platform.WIN_64}
+            return frozenset({Platform.WIN_64})
+        case PlatformAlias.LINUX_32:
+            return frozenset({Platform.LINUX_32})
+        case PlatformAlias.WIN_32:
+            return frozenset({Platform.WIN_32})
+
+
+def _build_table(
+    enum_cls: type[_QualifierT], mapping_fn: Callable[[_QualifierT], frozenset[Platform]]
+) -> dict[str, frozenset[Platform]]:
+    """
+    Evaluates a mapping function once per enumeration member to produce a look-up table.
+
+    :param enum_cls: Platform qualifier enumeration to iterate over
+    :param mapping_fn: Function that maps an enumeration member to a set of platforms
+    :returns: Look-up table from each enumeration member to its set of platforms.
+    """
+    return {member: mapping_fn(member) for member in enum_cls}
+
+
+# Look-up tables, computed once at import time. As `StrEnum` members hash and compare like their string values, these
+# tables may be queried with either an enumeration member or a canonical string.
+_ARCH_TO_PLATFORMS: Final[dict[str, frozenset[Platform]]] = _build_table(Arch, _arch_to_platforms_match)
+_OS_TO_PLATFORMS: Final[dict[str, frozenset[Platform]]] = _build_table(OperatingSystem, _os_to_platforms_match)
+_ALIAS_TO_PLATFORMS: Final[dict[str, frozenset[Platform]]] = _build_table(PlatformAlias, _alias_to_platforms_match)
+
+# NOTE: The `get_platforms_by_*_canon()` functions trust that their input is already canonical (i.e. stripped and
+#       lower-cased), which is the case for enum members and for selector keys read from a recipe file. Internal
+#       callers should prefer these variants. The `get_platforms_by_*()` functions accept arbitrary user-provided
+#       strings, normalize them, and then delegate to the canonical variants. Those results are memoized. In both
+#       cases, the returned sets are immutable and shared between callers.
+
+
+def _canon(s: str) -> str:
+    """
+    Normalizes a user-provided platform qualifier string.
+
+    :param s: String to normalize
+    :returns: The canonical form of the string.
+    """
+    return s.strip().lower()
+
+
+def get_platforms_by_arch_canon(arch: Arch | str) -> frozenset[Platform]:
+    """
+    Given a canonical architecture, return the list of supported build platforms.
+
+    :param arch: Target architecture. Strings must already be stripped and lower-cased.
+    :returns: Set of supported platforms for that architecture. An empty set is returned if no matching architecture
+        is found.
+    """
+    return _ARCH_TO_PLATFORMS.get(arch, _EMPTY_PLATFORMS)
+
+
+def get_platforms_by_os_canon(os: OperatingSystem | str) -> frozenset[Platform]:
+    """
+    Given a canonical Operating System, return the list of supported build platforms.
+
+    :param os: Target operating system. Strings must already be stripped and lower-cased.
+    :returns: Set of supported platforms for that OS. An empty set is returned if no matching OS is found.
+    """
+    return _OS_TO_PLATFORMS.get(os, _EMPTY_PLATFORMS)
+
+
+def get_platforms_by_alias_canon(alias: PlatformAlias | str) -> frozenset[Platform]:
+    """
+    Given a canonical platform alias, return the list of supported build platforms.
+
+    :param alias: Target platform alias. Strings must already be stripped and lower-cased.
+    :returns: Set of supported platforms for that alias. An empty set is returned if no matching alias is found.
+    """
+    return _ALIAS_TO_PLATFORMS.get(alias, _EMPTY_PLATFORMS)
+
+
+@lru_cache(maxsize=64)  # type: ignore[misc]
+def get_platforms_by_arch(arch: Arch | str) -> frozenset[Platform]:
+    """
+    Given an architecture, return the list of supported build platforms.
+
+    :param arch: Target architecture
+    :returns: Set of supported platforms for that architecture. An empty set is returned if no matching architecture
+        is found.
+    """
+    return get_platforms_by_arch_canon(_canon(arch))
+
+
+@lru_cache(maxsize=64)  # type: ignore[misc]
+def get_platforms_by_os(os: OperatingSystem | str) -> frozenset[Platform]:
+    """
+    Given an Operating System, return the list of supported build platforms.
+
+    :param os: Target operating system
+    :returns: Set of supported platforms for that OS. An empty set is returned if no matching OS is found.
+    """
+    return get_platforms_by_os_canon(_canon(os))
+
+
+@lru_cache(maxsize=64)  # type: ignore[misc]
+def get_platforms_by_alias(alias: PlatformAlias | str) -> frozenset[Platform]:
+    """
+    Given a platform alias, return the list of supported build platforms.
+
+    :param alias: Target platform alias
+    :returns: Set of supported platforms for that alias. An empty set is returned if no matching alias is found.
+    """
+    return get_platforms_by_alias_canon(_canon(alias))
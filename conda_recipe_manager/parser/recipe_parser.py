@@ -21,9 +21,10 @@ import difflib
 import logging
 import re
 from collections.abc import Callable
+from functools import partial
 from typing import Final, Optional, TypeGuard, cast
 
-from jsonschema import validate as schema_validate
+from jsonschema.validators import validator_for
 
 from conda_recipe_manager.parser._node import Node
 from conda_recipe_manager.parser._node_var import NodeVar
@@ -31,15 +32,16 @@ from conda_recipe_manager.parser._traverse import (
     INVALID_IDX,
     remap_child_indices_virt_to_phys,
     traverse,
+    traverse_all_str_paths,
     traverse_with_index,
 )
 from conda_recipe_manager.parser._types import ROOT_NODE_VALUE, CanonicalSortOrder, Regex, StrStack
-from conda_recipe_manager.parser._utils import str_to_stack_path
+from conda_recipe_manager.parser._utils import str_to_stack_path, stringify_yaml
 from conda_recipe_manager.parser.enums import SelectorConflictMode
 from conda_recipe_manager.parser.exceptions import JsonPatchValidationException
 from conda_recipe_manager.parser.recipe_reader import RecipeReader
 from conda_recipe_manager.parser.selector_parser import SelectorParser
-from conda_recipe_manager.parser.types import JSON_PATCH_SCHEMA, OPPOSITE_OPS, PYTHON_SKIP_PATTERN
+from conda_recipe_manager.parser.types import JSON_PATCH_SCHEMA, OPPOSITE_OPS, PYTHON_SKIP_PATTERN, MultilineVariant
 from conda_recipe_manager.types import PRIMITIVES_TUPLE, JsonPatchType, JsonType
 
 # Callback that allows the caller to perform custom replacements using `search_and_patch_replace()`.
@@ -47,6 +49,10 @@ ReplacePatchFunc = Callable[[JsonType], JsonType]
 
 log: Final = logging.getLogger(__name__)
 
+# Pre-built JSON patch validator. `jsonschema.validate()` re-validates the schema itself and constructs a new validator
+# on every call, which dominated the cost of applying a patch.
+_JSON_PATCH_VALIDATOR: Final = validator_for(JSON_PATCH_SCHEMA)(JSON_PATCH_SCHEMA)
+
 
 class RecipeParser(RecipeReader):
     """
@@ -67,16 +73,95 @@ class RecipeParser(RecipeReader):
         :param tbl: Table describing how keys should be sorted. Lower-value key names appear towards the top of the list
         :param rename: (Optional) If specified, renames the top-level key
         """
-
-        def _comparison(n: Node) -> int:
-            return RecipeParser._canonical_sort_keys_comparison(n, tbl)
-
-        node = traverse(self._root, str_to_stack_path(sort_path))  # pylint: disable=protected-access
+        node = self._traverse_cached(sort_path)
         if node is None:
             return
         if rename:
             node.value = rename
-        node.children.sort(key=_comparison)
+            self._invalidate_caches(sort_path)
+        # The look-up tables already map keys to their rank, so each sort key is computed in constant time.
+        sorted_children: Final = sorted(
+            node.children, key=partial(RecipeParser._canonical_sort_keys_comparison, priority_tbl=tbl)
+        )
+        # Most sections are already in canonical order. In that case, there is no need to evict any memoized paths.
+        if all(old is new for old, new in zip(node.children, sorted_children)):
+            return
+        node.children[:] = sorted_children
+        self._invalidate_caches(RecipeParser.append_to_path(sort_path, "/-"))
+
+    def _wrap_in_key(self, path: str, key: str) -> bool:
+        """
+        Convenience function that nests the value found at a path under a new key, in-place. For example, wrapping
+        `/test/files` with `recipe` converts `files: [a, b]` to `files: {recipe: [a, b]}`. Comments and selectors on the
+        wrapped value are preserved. This is equivalent to, but cheaper than, removing the value and re-adding it under
+        a new path.
+
+        :param path: Path to a key whose value should be wrapped.
+        :param key: Name of the new key to nest the value under.
+        :returns: True if the value was wrapped. False if the path does not point to a key.
+        """
+        node: Final = self._traverse_cached(path)
+        if node is None or not node.is_key():
+            return False
+        node.children = [Node(value=key, children=node.children, key_flag=True)]
+        self._invalidate_caches(RecipeParser.append_to_path(path, "/-"))
+        # Existing selectors have been moved to new paths.
+        self._rebuild_selectors()
+        self._is_modified = True
+        return True
+
+    def _replace_scalar(self, path: str, value: str) -> bool:
+        """
+        Convenience function that replaces a single-line string value found at a key, in-place. This is equivalent to,
+        but cheaper than, a `replace` patch operation, as the new value does not need to be parsed into a new subtree.
+        Like the `replace` operation, any comment on the old value is dropped.
+
+        :param path: Path to a key that holds a single value.
+        :param value: Value to update with.
+        :returns: True if the value was replaced. False if the path does not point to a key with a single value or the
+            new value can not be stored directly in a node. In that case, the caller should fallback to `patch()`.
+        """
+        node: Final = self._traverse_cached(path)
+        if node is None or not node.is_single_key() or not RecipeReader._is_simple_scalar(value):
+            return False
+        node.children = [Node(value=value)]
+        self._invalidate_caches(RecipeParser.append_to_path(path, "/-"))
+        # The old value may have held a selector.
+        self._rebuild_selectors()
+        self._is_modified = True
+        return True
+
+    def _remove_children(self, parent_path: str, child_names: list[str]) -> list[str]:
+        """
+        Convenience function that removes several keys that share a parent, in-place. This is equivalent to, but
+        cheaper than, issuing a `remove` patch for every key, as the parent is only looked-up once.
+
+        :param parent_path: Path to the shared parent of the keys to remove.
+        :param child_names: Names of the keys to remove. Like the `remove` patch operation, only the first instance of
+            a duplicated key is removed.
+        :returns: Paths to the keys that were found and removed, in the order provided by `child_names`.
+        """
+        node: Final = self._traverse_cached(parent_path)
+        if node is None:
+            return []
+        remaining: Final[set[str]] = set(child_names)
+        removed: Final[set[str]] = set()
+        kept_children: Final[list[Node]] = []
+        for child in node.children:
+            if child.is_key() and isinstance(child.value, str) and child.value in remaining:
+                remaining.remove(child.value)
+                removed.add(child.value)
+                continue
+            kept_children.append(child)
+        if not removed:
+            return []
+
+        node.children[:] = kept_children
+        self._invalidate_caches(RecipeParser.append_to_path(parent_path, "/-"))
+        # Removed nodes may have held selectors.
+        self._rebuild_selectors()
+        self._is_modified = True
+        return [RecipeParser.append_to_path(parent_path, name) for name in child_names if name in removed]
 
     ## Pre-processing Recipe Text Functions ##
 
@@ -111,6 +196,7 @@ class RecipeParser(RecipeReader):
         :param value: Value to set
         """
         self._vars_tbl[var] = [NodeVar(value)]
+        self._invalidate_vars_context()
         self._is_modified = True
 
     def del_variable(self, var: str) -> None:
@@ -122,6 +208,7 @@ class RecipeParser(RecipeReader):
         if not var in self._vars_tbl:
             return
         del self._vars_tbl[var]
+        self._invalidate_vars_context()
         self._is_modified = True
 
     ## Selector Editing Functions ##
@@ -176,6 +263,7 @@ class RecipeParser(RecipeReader):
         if node.is_single_key():
             node.children[0].comment = comment
 
+        self._invalidate_caches(structure_changed=False)
         self._rebuild_selectors()
         self._is_modified = True
 
@@ -228,6 +316,7 @@ class RecipeParser(RecipeReader):
         if node.is_single_key():
             node.children[0].comment = new_comment
 
+        self._invalidate_caches(structure_changed=False)
         self._rebuild_selectors()
         self._is_modified = True
         return selector
@@ -273,6 +362,7 @@ class RecipeParser(RecipeReader):
         # on the same line as their children.
         if node.is_single_key():
             node.children[0].comment = comment
+        self._invalidate_caches(structure_changed=False)
         self._is_modified = True
 
     ## YAML Patching Functions ##
@@ -563,7 +653,7 @@ class RecipeParser(RecipeReader):
         """
         # Validate the patch schema
         try:
-            schema_validate(patch, JSON_PATCH_SCHEMA)
+            _JSON_PATCH_VALIDATOR.validate(patch)
         except Exception as e:
             raise JsonPatchValidationException(patch) from e
 
@@ -581,22 +671,31 @@ class RecipeParser(RecipeReader):
         # Both versions of the path are sent over so that the op can easily use both private and public functions
         # (without incurring even more conversions between path types).
         is_successful = self._call_patch_op(op, path, patch)
+        # A `move` removes the source before adding it to the target, so the tree may have been modified even if the
+        # operation failed.
+        is_tree_modified: Final[bool] = (is_successful and op != "test") or op == "move"
 
-        # Update the selector table and modified flag, if the operation succeeded.
-        if is_successful and op != "test":
-            # TODO this is not the most efficient way to update the selector table, but for now, it works.
-            self._rebuild_selectors()
+        # Update the modified flag, if the operation succeeded.
+        if is_successful and is_tree_modified:
             # TODO technically this doesn't handle a no-op.
             self._is_modified = True
 
+        # Update the selector table and memoized state, if the tree may have changed.
+        if is_tree_modified:
+            # TODO this is not the most efficient way to update the selector table, but for now, it works.
+            self._rebuild_selectors()
+            self._invalidate_caches(path)
+            if op == "move":
+                self._invalidate_caches(cast(str, patch["from"]))
+
         if is_successful and op == "add":
             # Re-sort the subtree keys if the operation was successful to keep the recipe in a "canonical" order.
             if match := Regex.OUTPUT_SECTION_PATH.match(path):
                 # If the path is an output section, sort the keys of the output section.
                 self._sort_subtree_keys(match.group(0), CanonicalSortOrder.TOP_LEVEL_KEY_SORT_ORDER)
-                return True
-            # If the path is not an output section, sort the keys of the root node to be safe.
-            self._sort_subtree_keys(ROOT_NODE_VALUE, CanonicalSortOrder.TOP_LEVEL_KEY_SORT_ORDER)
+            else:
+                # If the path is not an output section, sort the keys of the root node to be safe.
+                self._sort_subtree_keys(ROOT_NODE_VALUE, CanonicalSortOrder.TOP_LEVEL_KEY_SORT_ORDER)
 
         return is_successful
 
@@ -680,6 +779,7 @@ class RecipeParser(RecipeReader):
                 # The caller is unable to access the node and patch operations ignore comments/selectors.
                 node.comment = comment_selector
                 # When we add the comment back in, we MUST update the selector table.
+                self._invalidate_caches(structure_changed=False)
                 self._rebuild_selectors()
                 self._is_modified = True
             except KeyError:
@@ -689,6 +789,55 @@ class RecipeParser(RecipeReader):
 
         return summation
 
+    def search_and_mutate(
+        self,
+        regex: str | re.Pattern[str],
+        mutate_func: Callable[[str], str],
+        preserve_comments_and_selectors: bool = True,
+    ) -> list[str]:
+        """
+        Given a regex string, mutate every single-line string value that matches, in-place and in a single pass over the
+        tree. This is cheaper than `search_and_patch_replace()`, but it can only be used for edits that do not change
+        the structure of the tree.
+
+        Multiline strings are stored line-by-line, so they are not mutated by this function. The paths to these values
+        (and any other non-string values) are returned so that the caller may choose to patch them.
+
+        :param regex: Regular expression to match with. This only matches values on patch-able paths.
+        :param mutate_func: Callback that provides the original string value and returns the mutated string value.
+        :param preserve_comments_and_selectors: (Optional) Flag indicating if this function should preserve any existing
+            comments or selectors on the mutated values.
+        :returns: Returns the list of matching paths that could not be mutated in-place.
+        """
+        re_obj = re.compile(regex)
+        skipped_paths: list[str] = []
+        is_mutated = False
+        is_comment_removed = False
+
+        def _mutate(node: Node, path: str) -> None:
+            nonlocal is_mutated, is_comment_removed
+            if not node.is_strong_leaf() or not re_obj.search(str(stringify_yaml(node.value))):
+                return
+            if not isinstance(node.value, str) or node.multiline_variant != MultilineVariant.NONE:
+                skipped_paths.append(path)
+                return
+            node.value = mutate_func(node.value)
+            if not preserve_comments_and_selectors and node.comment:
+                node.comment = ""
+                is_comment_removed = True
+            is_mutated = True
+            self._is_modified = True
+
+        traverse_all_str_paths(self._root, _mutate)
+        # Only leaf values were modified, so the structure of the tree is unchanged.
+        if is_mutated:
+            self._invalidate_caches(structure_changed=False)
+        # Removing comments may remove selectors, so the table is only re-built once all mutations are complete.
+        if is_comment_removed:
+            self._rebuild_selectors()
+
+        return skipped_paths
+
     def diff(self) -> str:
         """
         Returns a git-like-styled diff of the current recipe state with original state of the recipe. Useful for
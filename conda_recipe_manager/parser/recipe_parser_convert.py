@@ -6,15 +6,22 @@
 
 from __future__ import annotations
 
+import re
+from functools import cache
 from typing import Final, Optional, cast
 
 from conda.models.match_spec import MatchSpec
 
 from conda_recipe_manager.licenses.spdx_utils import SpdxUtils
 from conda_recipe_manager.parser._message_table import MessageCategory, MessageTable
-from conda_recipe_manager.parser._types import ROOT_NODE_VALUE, CanonicalSortOrder, Regex
-from conda_recipe_manager.parser._utils import search_any_regex, set_key_conditionally, stack_path_to_str
-from conda_recipe_manager.parser.dependency import Dependency, DependencyConflictMode
+from conda_recipe_manager.parser._types import (
+    AMBIGUOUS_DEP_TRIGGER_CHARS,
+    ROOT_NODE_VALUE,
+    CanonicalSortOrder,
+    Regex,
+)
+from conda_recipe_manager.parser._utils import contains_jinja_function, set_key_conditionally, stack_path_to_str
+from conda_recipe_manager.parser.dependency import Dependency, DependencyConflictMode, match_spec_from_str
 from conda_recipe_manager.parser.enums import SchemaVersion, SelectorConflictMode
 from conda_recipe_manager.parser.recipe_parser import RecipeParser
 from conda_recipe_manager.parser.recipe_parser_deps import RecipeParserDeps
@@ -26,11 +33,63 @@ class RecipeParserConvert(RecipeParserDeps):
     """
     Extension of the base RecipeParseDeps class that enables upgrading recipes from the old to V1 format.
     This was originally part of the RecipeParserDeps class but was broken-out for easier maintenance.
+
+    NOTE: The conversion works on a copy of the recipe that is taken the first time it is needed (i.e. when
+          `render_to_v1_recipe_format()` is first called), NOT when the object is constructed. Any modifications made to
+          this recipe before then are included in the conversion. Modifications made afterwards are not.
     """
 
-    # "Static", one-time initialization of the the SPDX utility class. As this module is "read-only", we only need one
-    # instance allocated for all converter-parsers that are initialized.
-    _SPDX_UTILS: Final = SpdxUtils()
+    @staticmethod
+    @cache  # type: ignore[misc]
+    def _get_spdx_utils() -> SpdxUtils:
+        """
+        "Static", one-time initialization of the SPDX utility class. As this module is "read-only", we only need one
+        instance allocated for all converter-parsers that are initialized. The SPDX database is only read on first use,
+        as many recipes can be converted without it.
+
+        :returns: The shared SPDX utility instance.
+        """
+        return SpdxUtils()
+
+    # Test commands that are replaced by the `python/pip_check` attribute.
+    _PIP_CHECK_VARIANTS: Final[frozenset[str]] = frozenset(
+        {
+            "pip check",
+            "python -m pip check",
+            "python3 -m pip check",
+        }
+    )
+
+    # Commonly misspelled field names, keyed by the section (relative to a package path) that contains them. Within a
+    # section, corrections are applied in-order.
+    _COMMON_MISSPELLINGS: Final[dict[str, list[tuple[str, str]]]] = {
+        # "If I had a nickel for every time `skip` was misspelled, I would have several nickels. Which isn't a lot, but
+        #  it is weird that it has happened multiple times."
+        #                                                                 - Dr. Doofenshmirtz, probably
+        "/build": [
+            ("skipt", "skip"),
+            ("skips", "skip"),
+            ("Skip", "skip"),
+        ],
+        # Various misspellings of "license_file" and "license_family". Note that `license_family` is deprecated, but we
+        # fix the spelling so it can be removed at a later phase.
+        "/about": [
+            ("licence_file", "license_file"),
+            ("licensse_file", "license_file"),
+            ("license_filte", "license_file"),
+            ("licsense_file", "license_file"),
+            ("icense_file", "license_file"),
+            ("licence_family", "license_family"),
+            ("license_familiy", "license_family"),
+            ("license_familly", "license_family"),
+            # Other about fields
+            ("Description", "description"),
+        ],
+        # `/extras` -> `/extra`
+        "": [
+            ("extras", "extra"),
+        ],
+    }
 
     def __init__(self, content: str, flags: RecipeReaderFlags = RecipeReaderFlags.NONE):
         """
@@ -42,15 +101,34 @@ class RecipeParserConvert(RecipeParserDeps):
         :raises ParsingException: If the recipe file cannot be parsed for an unknown reason.
         """
         super().__init__(content, flags)
-        # `copy.deepcopy()` produced some bizarre artifacts, namely single-line comments were being incorrectly rendered
-        # as list members. Although inefficient, we have tests that validate round-tripping the parser and there
-        # is no development cost in utilizing tools we already must maintain.
-        self._v1_recipe: RecipeParserDeps = RecipeParserDeps(self.render(), flags)
+        # Working copy of the recipe that the conversion operates on. This is constructed on first use, so callers that
+        # never perform a conversion do not pay for copying the parse tree.
+        self._v1_recipe_cache: Optional[RecipeParserDeps] = None
 
         self._also_test_latest_python: Final[bool] = RecipeReaderFlags.ALSO_TEST_LATEST_PYTHON in flags
 
         self._msg_tbl = MessageTable()
 
+    @property
+    def _v1_recipe(self) -> RecipeParserDeps:
+        """
+        Lazily constructs the working copy of the recipe that is upgraded to the V1 format. The copy reflects the state
+        of this recipe when the copy is first requested.
+
+        :returns: The recipe being converted.
+        """
+        if self._v1_recipe_cache is None:
+            # `copy.deepcopy()` produced some bizarre artifacts, namely single-line comments were being incorrectly
+            # rendered as list members. Instead, the working copy is the result of round-tripping through `render()`.
+            # Re-parsing normalizes the tree, so the parse tree can only be copied structurally when it is known to
+            # survive the round trip: the recipe is unmodified and renders back to the text it was parsed from.
+            rendered: Final[str] = self.render()
+            if not self._is_modified and rendered == self._init_content:
+                self._v1_recipe_cache = RecipeParserDeps._structural_clone(self)
+            else:
+                self._v1_recipe_cache = RecipeParserDeps(rendered, self._flags)
+        return self._v1_recipe_cache
+
     ## Patch utility functions ##
 
     def _patch_and_log(self, patch: JsonPatchType) -> bool:
@@ -65,6 +143,15 @@ class RecipeParserConvert(RecipeParserDeps):
             self._msg_tbl.add_message(MessageCategory.ERROR, f"Failed to patch: {patch}")
         return result
 
+    def _patch_bulk_and_log(self, patches: list[JsonPatchType]) -> list[bool]:
+        """
+        Convenience function that applies several patches, in order, and logs any failures to the message table.
+
+        :param patches: Patch operations to perform, in order.
+        :returns: Forwards patch results for further logging/error handling
+        """
+        return [self._patch_and_log(patch) for patch in patches]
+
     def _comment_and_log(self, path: str, comment: str) -> bool:
         """
         Convenience function that logs failed comment additions to the message table.
@@ -125,23 +212,27 @@ class RecipeParserConvert(RecipeParserDeps):
         """
         if new_ext is None:
             new_ext = old_ext
-        if self._v1_recipe.contains_value(RecipeParser.append_to_path(base_path, old_ext)):
-            self._patch_add_missing_path(base_path, new_path)
-        self._patch_move_base_path(base_path, old_ext, RecipeParser.append_to_path(new_path, new_ext))
+        old_path: Final[str] = RecipeParser.append_to_path(base_path, old_ext)
+        if not self._v1_recipe.contains_value(old_path):
+            return
+        self._patch_add_missing_path(base_path, new_path)
+        self._patch_and_log(
+            {
+                "op": "move",
+                "from": old_path,
+                "path": RecipeParser.append_to_path(base_path, RecipeParser.append_to_path(new_path, new_ext)),
+            }
+        )
 
     def _patch_deprecated_fields(self, base_path: str, fields: list[str]) -> None:
         """
         Automatically deprecates fields found in a common path.
 
         :param base_path: Shared base path where fields can be found
-        :param fields: List of deprecated fields
+        :param fields: List of deprecated fields, relative to the base path
         """
-        for field in fields:
-            path = RecipeParser.append_to_path(base_path, field)
-            if not self._v1_recipe.contains_value(path):
-                continue
-            if self._patch_and_log({"op": "remove", "path": path}):
-                self._msg_tbl.add_message(MessageCategory.WARNING, f"Field at `{path}` is no longer supported.")
+        for path in self._v1_recipe._remove_children(base_path, fields):  # pylint: disable=protected-access
+            self._msg_tbl.add_message(MessageCategory.WARNING, "Field at `%s` is no longer supported.", path)
 
     ## Upgrade functions ##
 
@@ -189,9 +280,7 @@ class RecipeParserConvert(RecipeParserDeps):
             # See issue #271 for details about upgrading the `env.get(` function.
             # See issue #366 for details and fixes around escaping complex JINJA functions.
             # TODO Add support for #368
-            if isinstance(value, str) and (
-                search_any_regex(Regex.JINJA_FUNCTIONS_SET, value) or value.startswith("env.get(")
-            ):
+            if isinstance(value, str) and (value.startswith("env.get(") or contains_jinja_function(value)):
                 value = "{{ " + value + " }}"
             context_obj[name] = value
 
@@ -222,7 +311,17 @@ class RecipeParserConvert(RecipeParserDeps):
         # Swap all JINJA to use the new `${{ }}` format. A regex is used as `str.replace()` will replace all instances
         # and a value containing multiple variables could be visited multiple times, causing multiple `${{}}`
         # encapsulations.
-        jinja_sub_locations: Final[set[str]] = set(self._v1_recipe.search(Regex.JINJA_V0_SUB))
+        def _replace_starting_marker(value: str) -> str:
+            # Safely replace `{{` but not any existing `${{` instances
+            return Regex.JINJA_REPLACE_V0_STARTING_MARKER.sub("${{", value)
+
+        # Most replacements do not alter the structure of the tree, so they can be applied in-place in a single pass.
+        # Comments are dropped, just as they would be by a `replace` patch operation.
+        jinja_sub_locations: Final[list[str]] = self._v1_recipe.search_and_mutate(
+            Regex.JINJA_V0_SUB, _replace_starting_marker, preserve_comments_and_selectors=False
+        )
+        # The remaining (multiline) values are patched, which also normalizes their formatting.
+        jinja_sub_patches: list[JsonPatchType] = []
         for path in jinja_sub_locations:
             jinja_sub_value = self._v1_recipe.get_value(path)
             # Values that match the regex should only be strings. This prevents crashes that should not occur.
@@ -231,9 +330,10 @@ class RecipeParserConvert(RecipeParserDeps):
                     MessageCategory.WARNING, f"A non-string value was found as a JINJA substitution: {jinja_sub_value}"
                 )
                 continue
-            # Safely replace `{{` but not any existing `${{` instances
-            jinja_sub_value = Regex.JINJA_REPLACE_V0_STARTING_MARKER.sub("${{", jinja_sub_value)
-            self._patch_and_log({"op": "replace", "path": path, "value": jinja_sub_value})
+            jinja_sub_patches.append(
+                {"op": "replace", "path": path, "value": _replace_starting_marker(jinja_sub_value)}
+            )
+        self._patch_bulk_and_log(jinja_sub_patches)
 
     def _upgrade_ambiguous_deps(self) -> None:
         """
@@ -270,15 +370,17 @@ class RecipeParserConvert(RecipeParserDeps):
                     continue
 
                 spec_str = dep.data.original_spec_str
-                # Corrects fairly common typos when dealing with >= and <= operators in dependency version selection
-                # statements.
-                spec_str = Regex.AMBIGUOUS_DEP_VERSION_GE_TYPO.sub(r"\1>=\2", spec_str)
-                spec_str = Regex.AMBIGUOUS_DEP_VERSION_LE_TYPO.sub(r"\1<=\2", spec_str)
-                # Corrects cases where two operators are used (i.e. `foo >=1.2.*`). We can't rely on MatchSpec to detect
-                # multiple operators, so we fall back to using a regular expression. We drop the trailing `.*` to be
-                # in alignment with `rattler-build`'s preferences:
-                # https://github.com/conda/rattler/blob/main/crates/rattler_conda_types/src/version_spec/parse.rs#L224
-                spec_str = Regex.AMBIGUOUS_DEP_MULTI_OPERATOR.sub(r"\1\2\3", spec_str)
+                # Most dependencies do not use any operators, in which case none of the following corrections apply.
+                if not AMBIGUOUS_DEP_TRIGGER_CHARS.isdisjoint(spec_str):
+                    # Corrects fairly common typos when dealing with >= and <= operators in dependency version
+                    # selection statements.
+                    spec_str = Regex.AMBIGUOUS_DEP_VERSION_GE_TYPO.sub(r"\1>=\2", spec_str)
+                    spec_str = Regex.AMBIGUOUS_DEP_VERSION_LE_TYPO.sub(r"\1<=\2", spec_str)
+                    # Corrects cases where two operators are used (i.e. `foo >=1.2.*`). We can't rely on MatchSpec to
+                    # detect multiple operators, so we fall back to using a regular expression. We drop the trailing
+                    # `.*` to be in alignment with `rattler-build`'s preferences:
+                    # https://github.com/conda/rattler/blob/main/crates/rattler_conda_types/src/version_spec/parse.rs#L224
+                    spec_str = Regex.AMBIGUOUS_DEP_MULTI_OPERATOR.sub(r"\1\2\3", spec_str)
 
                 # Add a trailing `.*` to ambiguous dependencies that lack an operator. This is not that easy as
                 # `VersionSpec` does not make a distinction between a version that contains a `==` operator and a
@@ -299,7 +401,7 @@ class RecipeParserConvert(RecipeParserDeps):
                         required_by=dep.required_by,
                         path=dep.path,
                         type=dep.type,
-                        data=MatchSpec(spec_str),
+                        data=match_spec_from_str(spec_str),
                         selector=dep.selector,
                     ),
                     dep_mode=DependencyConflictMode.EXACT_POSITION,
@@ -307,6 +409,43 @@ class RecipeParserConvert(RecipeParserDeps):
                 )
                 self._msg_tbl.add_message(MessageCategory.WARNING, f"Version on dependency changed to: {spec_str}")
 
+    @staticmethod
+    def _upgrade_python_version_selector(match: re.Match[str]) -> str:
+        """
+        Substitution callback that converts a V0 Python version selector expression to the V1 `match()` function.
+
+        :param match: Match produced by `Regex.SELECTOR_PYTHON_VERSION_REPLACEMENT`.
+        :returns: The equivalent `match()` function call.
+        """
+        if match.group("op") is not None:
+            return f'match(python, "{match.group("op")}{match.group("major")}.{match.group("minor")}")'
+        if match.group("eq_major") is not None:
+            return f'match(python, "=={match.group("eq_major")}.{match.group("eq_minor")}")'
+        major: Final[int] = int(match.group("k_major"))
+        return f'match(python, ">={major},<{major + 1}")'
+
+    @staticmethod
+    def _upgrade_selector_expression(selector: str) -> str:
+        """
+        Converts a V0 selector to the equivalent V1 boolean expression.
+
+        :param selector: V0 selector, including the surrounding brackets.
+        :returns: The upgraded boolean expression.
+        """
+        # Strip the []'s around the selector
+        bool_expression: Final[str] = selector[1:-1]
+        # Some commonly used selectors (like `py<36`) need to be upgraded. Otherwise, these expressions will be
+        # interpreted as strings. See this CEP PR for more details: https://github.com/conda/ceps/pull/71
+        # This also upgrades the less common `py36`, `not py27`, `py2k`, and `py3k` selectors. All of these contain
+        # `py`, so the vast majority of selectors (`unix`, `win`, etc) can skip the regular expression entirely.
+        if "py" not in bool_expression:
+            return bool_expression
+        # TODO other common selectors to support:
+        # - GPU variants (see pytorch and llama.cpp feedstocks)
+        return Regex.SELECTOR_PYTHON_VERSION_REPLACEMENT.sub(
+            RecipeParserConvert._upgrade_python_version_selector, bool_expression
+        )
+
     def _upgrade_selectors_to_conditionals(self) -> None:
         """
         Upgrades the proprietary comment-based selector syntax to equivalent conditional logic statements.
@@ -317,47 +456,28 @@ class RecipeParserConvert(RecipeParserDeps):
           https://docs.conda.io/projects/conda-build/en/latest/resources/define-metadata.html#preprocessing-selectors
         """
         selector_path_map: dict[str, str] = {}
-        for selector, instances in self._v1_recipe._selector_tbl.items():  # pylint: disable=protected-access
+        # Each instance is patched and has its selector removed, both of which discard the selector table. A snapshot of
+        # the table is iterated over, as the table is replaced when it is re-built.
+        selector_tbl: Final = list(self._v1_recipe._selector_tbl.items())  # pylint: disable=protected-access
+        for selector, instances in selector_tbl:
+            # The upgraded expression only depends on the selector, so it is computed once for all instances.
+            bool_expression = RecipeParserConvert._upgrade_selector_expression(selector)
+            ternary_value = f"${{{{ true if {bool_expression} }}}}"
             for info in instances:
-                # Selectors can be applied to the parent node if they appear on the same line. We'll ignore these when
-                # building replacements.
+                # Selectors can be applied to the parent node if they appear on the same line. We'll ignore these
+                # when building replacements.
                 if not info.node.is_leaf():
                     continue
 
-                # Strip the []'s around the selector
-                bool_expression = selector[1:-1]
                 # Convert to a public-facing path representation
                 selector_path = stack_path_to_str(info.path)
 
-                # Some commonly used selectors (like `py<36`) need to be upgraded. Otherwise, these expressions will be
-                # interpreted as strings. See this CEP PR for more details: https://github.com/conda/ceps/pull/71
-                bool_expression = Regex.SELECTOR_PYTHON_VERSION_REPLACEMENT.sub(
-                    r'match(python, "\1\2.\3")', bool_expression
-                )
-                # Upgrades for less common `py36` and `not py27` selectors
-                bool_expression = Regex.SELECTOR_PYTHON_VERSION_EQ_REPLACEMENT.sub(
-                    r'match(python, "==\1.\2")', bool_expression
-                )
-                bool_expression = Regex.SELECTOR_PYTHON_VERSION_NE_REPLACEMENT.sub(
-                    r'match(python, "!=\1.\2")', bool_expression
-                )
-                # Upgrades for less common `py2k` and `py3k` selectors
-                bool_expression = Regex.SELECTOR_PYTHON_VERSION_PY2K_REPLACEMENT.sub(
-                    r'match(python, ">=2,<3")', bool_expression
-                )
-                bool_expression = Regex.SELECTOR_PYTHON_VERSION_PY3K_REPLACEMENT.sub(
-                    r'match(python, ">=3,<4")', bool_expression
-                )
-
-                # TODO other common selectors to support:
-                # - GPU variants (see pytorch and llama.cpp feedstocks)
-
                 # For now, if a selector lands on a boolean value, use a ternary statement. Otherwise use the
                 # conditional logic.
                 patch: JsonPatchType = {
                     "op": "replace",
                     "path": selector_path,
-                    "value": "${{ true if " + bool_expression + " }}",
+                    "value": ternary_value,
                 }
                 # `skip` is special and can be a single boolean expression or a list of boolean expressions.
                 if selector_path.endswith("/build/skip"):
@@ -406,31 +526,16 @@ class RecipeParserConvert(RecipeParserDeps):
         :param base_package_paths: Set of base paths to process that could contain this section.
         """
         for base_path in base_package_paths:
-            build_path = RecipeParser.append_to_path(base_path, "/build")
-            about_path = RecipeParser.append_to_path(base_path, "/about")
-            # "If I had a nickel for every time `skip` was misspelled, I would have several nickels. Which isn't a lot,
-            #  but it is weird that it has happened multiple times."
-            #                                                             - Dr. Doofenshmirtz, probably
-            self._patch_move_base_path(build_path, "skipt", "skip")
-            self._patch_move_base_path(build_path, "skips", "skip")
-            self._patch_move_base_path(build_path, "Skip", "skip")
-
-            # Various misspellings of "license_file" and "license_family". Note that `license_family` is deprecated,
-            # but we fix the spelling so it can be removed at a later phase.
-            self._patch_move_base_path(about_path, "licence_file", "license_file")
-            self._patch_move_base_path(about_path, "licensse_file", "license_file")
-            self._patch_move_base_path(about_path, "license_filte", "license_file")
-            self._patch_move_base_path(about_path, "licsense_file", "license_file")
-            self._patch_move_base_path(about_path, "icense_file", "license_file")
-            self._patch_move_base_path(about_path, "licence_family", "license_family")
-            self._patch_move_base_path(about_path, "license_familiy", "license_family")
-            self._patch_move_base_path(about_path, "license_familly", "license_family")
-
-            # Other about fields
-            self._patch_move_base_path(about_path, "Description", "description")
-
-            # `/extras` -> `/extra`
-            self._patch_move_base_path(base_path, "extras", "extra")
+            for section, corrections in RecipeParserConvert._COMMON_MISSPELLINGS.items():
+                section_path = RecipeParser.append_to_path(base_path, section) if section else base_path
+                section_node = self._v1_recipe._traverse_cached(section_path)  # pylint: disable=protected-access
+                if section_node is None:
+                    continue
+                # Collect the section's keys once, instead of looking up every possible misspelling individually.
+                section_keys = {child.value for child in section_node.children if child.is_key()}
+                for old_ext, new_ext in corrections:
+                    if old_ext in section_keys:
+                        self._patch_move_base_path(section_path, old_ext, new_ext)
 
     def _upgrade_source_section(self, base_package_paths: list[str]) -> None:
         """
@@ -439,20 +544,30 @@ class RecipeParserConvert(RecipeParserDeps):
         :param base_package_paths: Set of base paths to process that could contain this section.
         :raises SentinelTypeEvaluationException: If a node value with a sentinel type is evaluated.
         """
+        # Basic renaming transformations, followed by `git` source transformations (`conda` does not appear to support
+        # all of the new features)
+        source_renames: Final[tuple[tuple[str, str], ...]] = (
+            ("/fn", "/file_name"),
+            ("/folder", "/target_directory"),
+            ("/git_url", "/git"),
+            ("/git_tag", "/tag"),
+            ("/git_rev", "/rev"),
+            ("/git_depth", "/depth"),
+        )
+
         for base_path in base_package_paths:
             source_path = RecipeParser.append_to_path(base_path, "/source")
-            if not self._v1_recipe.contains_value(source_path):
+            source_node = self._v1_recipe._traverse_cached(source_path)  # pylint: disable=protected-access
+            if source_node is None:
                 continue
 
             # The `source` field can contain a list of elements or a single element (not encapsulated in a list).
-            # This logic sets up a list to iterate through that will handle both cases.
-            source_data = self._v1_recipe.get_value(source_path)
-            source_paths = []
-            if isinstance(source_data, list):
-                for x in range(len(source_data)):
-                    source_paths.append(RecipeParser.append_to_path(source_path, f"/{x}"))
-            else:
-                source_paths.append(source_path)
+            # This logic sets up the paths to iterate through that will handle both cases. The parse tree is inspected
+            # directly, as there is no need to render the `source` section to count the list elements.
+            source_paths: list[str] = [source_path]
+            if source_node.contains_list():
+                source_len = sum(1 for child in source_node.children if child.list_member_flag)
+                source_paths = [f"{source_path}/{x}" for x in range(source_len)]
 
             for src_path in source_paths:
                 # SVN and HG source options are no longer supported. This seems to have been deprecated a long
@@ -466,15 +581,8 @@ class RecipeParserConvert(RecipeParserDeps):
                         MessageCategory.WARNING, "HG (Mercurial) packages are no longer supported in the V1 format"
                     )
 
-                # Basic renaming transformations
-                self._patch_move_base_path(src_path, "/fn", "/file_name")
-                self._patch_move_base_path(src_path, "/folder", "/target_directory")
-
-                # `git` source transformations (`conda` does not appear to support all of the new features)
-                self._patch_move_base_path(src_path, "/git_url", "/git")
-                self._patch_move_base_path(src_path, "/git_tag", "/tag")
-                self._patch_move_base_path(src_path, "/git_rev", "/rev")
-                self._patch_move_base_path(src_path, "/git_depth", "/depth")
+                for old, new in source_renames:
+                    self._patch_move_base_path(src_path, old, new)
 
                 # Canonically sort this section
                 self._v1_recipe._sort_subtree_keys(  # pylint: disable=protected-access
@@ -511,8 +619,7 @@ class RecipeParserConvert(RecipeParserDeps):
                         MessageCategory.ERROR, f"Could not parse dictionary `{item}` found in {script_env_path}"
                     )
                     continue
-                tokens = [i.strip() for i in item["then"].split("=")]
-                if len(tokens) == 1:
+                if "=" not in item["then"]:
                     new_secrets.append(item)
                 else:
                     # The spec does not support conditional statements in a dictionary. As per discussions with the
@@ -524,13 +631,12 @@ class RecipeParserConvert(RecipeParserDeps):
                     )
                 continue
 
-            tokens = [i.strip() for i in item.split("=")]
-            if len(tokens) == 1:
-                new_secrets.append(tokens[0])
-            elif len(tokens) >= 2:
-                new_env[tokens[0]] = "=".join(tokens[1:])
+            # Only the first `=` separates the variable name from its value. Whitespace around every `=` is dropped.
+            key, sep, value = item.partition("=")
+            if not sep:
+                new_secrets.append(key.strip())
             else:
-                self._msg_tbl.add_message(MessageCategory.ERROR, f"Could not parse `{item}` found in {script_env_path}")
+                new_env[key.strip()] = "=".join(i.strip() for i in value.split("="))
 
         set_key_conditionally(cast(dict[str, JsonType], new_script_obj), "env", cast(JsonType, new_env))
         set_key_conditionally(cast(dict[str, JsonType], new_script_obj), "secrets", cast(JsonType, new_secrets))
@@ -564,17 +670,18 @@ class RecipeParserConvert(RecipeParserDeps):
             "rpaths_patcher",
             "post-link",
             "pre-unlink",
-            "pre-link",
         ]
 
         for base_path in base_package_paths:
+            build_path = RecipeParser.append_to_path(base_path, "/build")
+            requirements_path = RecipeParser.append_to_path(base_path, "/requirements")
+
             # Move `run_exports` and `ignore_run_exports` from `build` to `requirements`
 
             # `run_exports`
-            old_re_path = RecipeParser.append_to_path(base_path, "/build/run_exports")
+            old_re_path = RecipeParser.append_to_path(build_path, "/run_exports")
             if self._v1_recipe.contains_value(old_re_path):
-                requirements_path = RecipeParser.append_to_path(base_path, "/requirements")
-                new_re_path = RecipeParser.append_to_path(base_path, "/requirements/run_exports")
+                new_re_path = RecipeParser.append_to_path(requirements_path, "/run_exports")
                 if not self._v1_recipe.contains_value(requirements_path):
                     self._patch_and_log({"op": "add", "path": requirements_path, "value": None})
                 self._patch_and_log({"op": "move", "from": old_re_path, "path": new_re_path})
@@ -592,8 +699,7 @@ class RecipeParserConvert(RecipeParserDeps):
                 ("ignore_run_exports", "by_name"),
                 ("ignore_run_exports_from", "from_package"),
             ]:
-                old_ire_path = RecipeParser.append_to_path(base_path, f"/build/{old_ire_name}")
-                if self._v1_recipe.contains_value(old_ire_path):
+                if self._v1_recipe.contains_value(RecipeParser.append_to_path(build_path, old_ire_name)):
                     self._patch_add_missing_path(base_path, "/requirements")
                     self._patch_move_new_path(
                         base_path,
@@ -603,7 +709,6 @@ class RecipeParserConvert(RecipeParserDeps):
                     )
 
             # Perform internal section changes per `build/` section
-            build_path = RecipeParser.append_to_path(base_path, "/build")
             if not self._v1_recipe.contains_value(build_path):
                 continue
 
@@ -677,7 +782,7 @@ class RecipeParserConvert(RecipeParserDeps):
             self._msg_tbl.add_message(MessageCategory.WARNING, f"No `license` provided in `{about_path}`")
             return
 
-        corrected_license: Final[Optional[str]] = RecipeParserConvert._SPDX_UTILS.find_closest_license_match(
+        corrected_license: Final[Optional[str]] = RecipeParserConvert._get_spdx_utils().find_closest_license_match(
             old_license
         )
 
@@ -690,8 +795,11 @@ class RecipeParserConvert(RecipeParserDeps):
             return
 
         # Alert the user that a patch was made, in case it needs manual verification. This warning will not emit if
-        # the patch failed (failure will generate an arguably more important message)
-        if self._patch_and_log({"op": "replace", "path": license_path, "value": corrected_license}):
+        # the patch failed (failure will generate an arguably more important message). The license node was found
+        # above, so the value is updated in-place when possible.
+        if self._v1_recipe._replace_scalar(  # pylint: disable=protected-access
+            license_path, corrected_license
+        ) or self._patch_and_log({"op": "replace", "path": license_path, "value": corrected_license}):
             self._msg_tbl.add_message(
                 MessageCategory.WARNING, f"Changed {license_path} from `{old_license}` to `{corrected_license}`"
             )
@@ -734,12 +842,12 @@ class RecipeParserConvert(RecipeParserDeps):
 
             # R packages like to use multiline strings without multiline markers, which get interpreted as list members
             # TODO address this at parse-time, adding a new multiline mode
+            # Most summaries are plain strings, so the node is inspected before rendering the value.
             summary_path = RecipeParser.append_to_path(about_path, "/summary")
-            summary = self._v1_recipe.get_value(summary_path, "")
-            if isinstance(summary, list):
-                self._patch_and_log(
-                    {"op": "replace", "path": summary_path, "value": "\n".join(cast(list[str], summary))}
-                )
+            summary_node = self._v1_recipe._traverse_cached(summary_path)  # pylint: disable=protected-access
+            if summary_node is not None and summary_node.contains_list():
+                summary = cast(list[str], self._v1_recipe.get_value(summary_path))
+                self._patch_and_log({"op": "replace", "path": summary_path, "value": "\n".join(summary)})
 
             # Remove deprecated `about` fields
             self._patch_deprecated_fields(about_path, about_deprecated)
@@ -752,12 +860,6 @@ class RecipeParserConvert(RecipeParserDeps):
         :param test_path: Test path for the build target to upgrade
         :raises SentinelTypeEvaluationException: If a node value with a sentinel type is evaluated.
         """
-        pip_check_variants: Final[set[str]] = {
-            "pip check",
-            "python -m pip check",
-            "python3 -m pip check",
-        }
-
         commands_path: Final[str] = RecipeParser.append_to_path(test_path, "/commands")
         commands = cast(Optional[list[str]], self._v1_recipe.get_value(commands_path, []))
         # Normalize the rare edge case where the list may be null (usually caused by commented-out code)
@@ -766,7 +868,7 @@ class RecipeParserConvert(RecipeParserDeps):
         pip_check = False
         for i, command in enumerate(commands):
             # TODO Future: handle selector cases (pip check will be in the `then` section of a dictionary object)
-            if not isinstance(command, str) or command not in pip_check_variants:
+            if not isinstance(command, str) or command not in RecipeParserConvert._PIP_CHECK_VARIANTS:
                 continue
             # For now, we will only patch-out the first instance when no selector is attached
             self._patch_and_log({"op": "remove", "path": RecipeParser.append_to_path(commands_path, f"/{i}")})
@@ -834,21 +936,10 @@ class RecipeParserConvert(RecipeParserDeps):
                 continue
 
             # Moving `files` to `files/recipe` is not possible in a single `move` operation as a new path has to be
-            # created in the path being moved.
+            # created in the path being moved. Instead, the existing value is wrapped in-place.
             test_files_path = RecipeParser.append_to_path(test_path, "/files")
             if self._v1_recipe.contains_value(test_files_path):
-                test_files_value = self._v1_recipe.get_value(test_files_path)
-                # TODO: Fix, replace does not work here, produces `- null`, Issue #20
-                # self._patch_and_log({"op": "replace", "path": test_files_path, "value": None})
-                self._patch_and_log({"op": "remove", "path": test_files_path})
-                self._patch_and_log({"op": "add", "path": test_files_path, "value": None})
-                self._patch_and_log(
-                    {
-                        "op": "add",
-                        "path": RecipeParser.append_to_path(test_files_path, "/recipe"),
-                        "value": test_files_value,
-                    }
-                )
+                self._v1_recipe._wrap_in_key(test_files_path, "recipe")  # pylint: disable=protected-access
             # Edge case: `/source_files` exists but `/files` does not
             elif self._v1_recipe.contains_value(RecipeParser.append_to_path(test_path, "/source_files")):
                 self._patch_add_missing_path(test_path, "/files")
@@ -880,14 +971,11 @@ class RecipeParserConvert(RecipeParserDeps):
                 continue
             test_array: list[JsonType] = []
             # There are 3 types of test elements. We break them out of the original object, if they exist.
-            # `Python` Test Element
-            if "python" in test_element:
-                test_array.append({"python": test_element["python"]})
-                del test_element["python"]
-            # `Downstream` Test Element
-            if "downstream" in test_element:
-                test_array.append({"downstream": test_element["downstream"]})
-                del test_element["downstream"]
+            # `Python` and `Downstream` Test Elements
+            for test_type in ("python", "downstream"):
+                test_type_value = test_element.pop(test_type, self._sentinel)
+                if not isinstance(test_type_value, SentinelType):
+                    test_array.append({test_type: test_type_value})
             # What remains should be the `Command` Test Element type
             if test_element:
                 test_array.append(test_element)
@@ -948,51 +1036,57 @@ class RecipeParserConvert(RecipeParserDeps):
         :param content: Recipe file contents to pre-process
         :returns: Pre-processed recipe file contents
         """
+        # Each pass scans the entire file, so passes are skipped when the file cannot contain a match. Substring checks
+        # are significantly cheaper than running the regular expressions.
+
         # Some recipes use `foo.<function()>` instead of `{{ foo | <function()> }}` in JINJA statements. This causes
         # rattler-build to fail with `invalid operation: object has no method named <function()>`
         # NOTE: This is currently done BEFORE converting to use `env.get()` to wipe-out those changes.
-        content = Regex.PRE_PROCESS_JINJA_DOT_FUNCTION_IN_ASSIGNMENT.sub(r"\1 | \2", content)
-        content = Regex.PRE_PROCESS_JINJA_DOT_FUNCTION_IN_SUBSTITUTION.sub(r"\1 | \2", content)
+        if "{%" in content:
+            content = Regex.PRE_PROCESS_JINJA_DOT_FUNCTION_IN_ASSIGNMENT.sub(r"\1 | \2", content)
+        if "{{" in content:
+            content = Regex.PRE_PROCESS_JINJA_DOT_FUNCTION_IN_SUBSTITUTION.sub(r"\1 | \2", content)
         # Strip any problematic parenthesis that may be left over from the previous operations.
-        content = Regex.PRE_PROCESS_JINJA_DOT_FUNCTION_STRIP_EMPTY_PARENTHESIS.sub(r"\1", content)
+        if "()" in content:
+            content = Regex.PRE_PROCESS_JINJA_DOT_FUNCTION_STRIP_EMPTY_PARENTHESIS.sub(r"\1", content)
         # Attempt to normalize quoted multiline strings into the common `|` syntax.
         # TODO: Handle multiple escaped newlines (very uncommon)
-        content = Regex.PRE_PROCESS_QUOTED_MULTILINE_STRINGS.sub(r"\1\2: |\1  \3\1  \4", content)
+        if "\\n" in content:
+            content = Regex.PRE_PROCESS_QUOTED_MULTILINE_STRINGS.sub(r"\1\2: |\1  \3\1  \4", content)
 
         # rattler-build@0.18.0: Introduced checks for deprecated `max_pin` and `min_pin` fields. This replacement
         # addresses the change in numerous JINJA functions that use this nomenclature.
-        content = Regex.PRE_PROCESS_MIN_PIN_REPLACEMENT.sub("lower_bound=", content)
-        content = Regex.PRE_PROCESS_MAX_PIN_REPLACEMENT.sub("upper_bound=", content)
+        def _replace_pin(match: re.Match[str]) -> str:
+            return "lower_bound=" if cast(str, match.group(1)) == "min" else "upper_bound="
+
+        if "_pin=" in content:
+            content = Regex.PRE_PROCESS_MIN_MAX_PIN_REPLACEMENT.sub(_replace_pin, content)
 
         # Convert the old JINJA `environ[""]` variable usage to the new `get.env("")` syntax.
         # NOTE:
         #   - This is mostly used by Bioconda recipes and R-based-packages in the `license_file` field.
         #   - From our search, it looks like we never deal with more than one set of outer quotes within the brackets
-        replacements: list[tuple[str, str]] = []
-        for groups in cast(list[tuple[str, ...]], Regex.PRE_PROCESS_ENVIRON.findall(content)):
+        def _replace_environ(match: re.Match[str]) -> str:
             # Each match should return ["<quote char>", "<key>", "<quote_char>"]
-            quote_char = groups[0]
-            key = groups[1]
-            replacements.append(
-                (
-                    f"environ[{quote_char}{key}{quote_char}]",
-                    f"env.get({quote_char}{key}{quote_char})",
-                )
+            quote_char: Final = cast(str, match.group(1))
+            key: Final = cast(str, match.group(2))
+            return match.group(0).replace(
+                f"environ[{quote_char}{key}{quote_char}]", f"env.get({quote_char}{key}{quote_char})", 1
             )
 
-        for groups in cast(list[tuple[str, ...]], Regex.PRE_PROCESS_ENVIRON_GET.findall(content)):
-            environ_key = f"{groups[0]}{groups[1]}{groups[2]}"
-            environ_default = f"{groups[3]}{groups[4]}{groups[5]}"
-
-            replacements.append(
-                (
-                    f"environ | get({environ_key}, {environ_default})",
-                    f"env.get({environ_key}, default={environ_default})",
-                )
+        def _replace_environ_get(match: re.Match[str]) -> str:
+            environ_key: Final = "".join(cast(tuple[str, str, str], match.group(1, 2, 3)))
+            environ_default: Final = "".join(cast(tuple[str, str, str], match.group(4, 5, 6)))
+            return match.group(0).replace(
+                f"environ | get({environ_key}, {environ_default})",
+                f"env.get({environ_key}, default={environ_default})",
+                1,
             )
 
-        for old, new in replacements:
-            content = content.replace(old, new, 1)
+        # Each match is replaced in-place, in a single pass over the file.
+        if "environ" in content:
+            content = Regex.PRE_PROCESS_ENVIRON.sub(_replace_environ, content)
+            content = Regex.PRE_PROCESS_ENVIRON_GET.sub(_replace_environ_get, content)
 
         # Replace `{{ hash_type }}:` with the value of `hash_type`, which is likely `sha256`. This is an uncommon
         # practice that is not part of the V1 specification. Currently, about 70 AnacondaRecipes and conda-forge files
@@ -1008,6 +1102,7 @@ class RecipeParserConvert(RecipeParserDeps):
           - https://github.com/conda/ceps/blob/main/cep-0013.md
           - https://github.com/conda/ceps/blob/main/cep-0014.md
 
+        :raises ParsingException: If the working copy of the recipe cannot be parsed from the rendered recipe.
         :returns: Returns a tuple containing: - The converted recipe, as a string - A `MessageTbl` instance that
             contains error logging - Converted recipe file debug string. USE FOR DEBUGGING PURPOSES ONLY!
         """
@@ -1031,6 +1126,10 @@ class RecipeParserConvert(RecipeParserDeps):
         # recipes in 1 loop construct.
         base_package_paths: Final[list[str]] = self._v1_recipe.get_package_paths()
 
+        # The section upgrades perform many path look-ups across the whole recipe. Index every path up-front, in a
+        # single traversal, instead of traversing the tree for each new path. Patches evict affected paths as needed.
+        self._v1_recipe._index_path_cache()  # pylint: disable=protected-access
+
         # TODO Fix: comments are not preserved with patch operations (add a flag to `patch()`?)
 
         # There are a number of recipe files that contain the same misspellings. This is an attempt to
@@ -1050,11 +1149,8 @@ class RecipeParserConvert(RecipeParserDeps):
         # TODO: Comment tracking may need improvement. The "correct way" of tracking comments with patch changes is a
         #       fairly big engineering effort and refactor.
         # Alert the user which comments have been dropped.
-        new_comments: Final[dict[str, str]] = self._v1_recipe.get_comments_table()
-        diff_comments: Final[dict[str, str]] = {k: v for k, v in old_comments.items() if k not in new_comments}
-        for path, comment in diff_comments.items():
-            if not self._v1_recipe.contains_value(path):
-                self._msg_tbl.add_message(MessageCategory.WARNING, f"Could not relocate comment: {comment}")
+        for comment in self._v1_recipe.get_dropped_comments(old_comments).values():
+            self._msg_tbl.add_message(MessageCategory.WARNING, "Could not relocate comment: %s", comment)
 
         # TODO Complete: move operations may result in empty fields we can eliminate. This may require changes to
         #                `contains_value()`
@@ -1063,6 +1159,7 @@ class RecipeParserConvert(RecipeParserDeps):
 
         # Hack: Wipe the existing table so the JINJA `set` statements don't render the final form
         self._v1_recipe._vars_tbl = {}  # pylint: disable=protected-access
+        self._v1_recipe._invalidate_vars_context()  # pylint: disable=protected-access
 
         # Sort the top-level keys to a "canonical" ordering. This should make previous patch operations look more
         # "sensible" to a human reader.
@@ -11,20 +11,28 @@ import logging
 import re
 import sys
 import warnings
-from collections.abc import Callable
-from typing import Final, Optional, cast, no_type_check
+from collections.abc import Callable, Iterator
+from functools import lru_cache
+from typing import Final, Optional, Self, cast, no_type_check
 
 import yaml
 from jinja2 import Environment, StrictUndefined
+from jinja2.environment import TemplateExpression
 
 from conda_recipe_manager.parser._is_modifiable import IsModifiable
 from conda_recipe_manager.parser._node import CommentPosition, Node
 from conda_recipe_manager.parser._node_var import NodeVar
 from conda_recipe_manager.parser._selector_info import SelectorInfo
-from conda_recipe_manager.parser._traverse import traverse, traverse_all
+from conda_recipe_manager.parser._traverse import (
+    remap_child_indices_phys_to_virt,
+    traverse,
+    traverse_all,
+    traverse_all_str_paths,
+)
 from conda_recipe_manager.parser._types import (
     RECIPE_MANAGER_SUB_MARKER,
     ROOT_NODE_VALUE,
+    YAML_NON_STR_PLAIN_WORDS,
     ForceIndentDumper,
     Regex,
     SafeLoader,
@@ -33,8 +41,8 @@ from conda_recipe_manager.parser._types import (
 )
 from conda_recipe_manager.parser._utils import (
     dedupe_and_preserve_order,
+    iter_jinja_v0_set_statements,
     normalize_multiline_strings,
-    num_tab_spaces,
     quote_special_strings,
     stack_path_to_str,
     str_to_stack_path,
@@ -69,6 +77,14 @@ from conda_recipe_manager.utils.typing import optional_str
 
 log: Final = logging.getLogger(__name__)
 
+# Shared environment used to evaluate JINJA expressions. Environments are not modified by compiling expressions.
+_JINJA_ENV: Final = Environment(undefined=StrictUndefined)  # type: ignore[misc]
+
+# Look-up table for multiline variants, by their string value. Indexing a dictionary skips the `Enum` constructor.
+_MULTILINE_VARIANTS_BY_VALUE: Final[dict[str, MultilineVariant]] = {
+    variant.value: variant for variant in MultilineVariant
+}
+
 # Type for the internal recipe variables table. Although relatively uncommon, variables may be defined multiple times
 # (in V0), usually in the context of string concatenation. Hence why the table contains a list of `NodeVar`s.
 # NOTE:
@@ -92,7 +108,8 @@ class RecipeReader(IsModifiable):
     @staticmethod
     def _parse_yaml_recursive_sub(data: JsonType, modifier: Callable[[str], JsonType]) -> JsonType:
         """
-        Recursive helper function used when we need to perform variable substitutions.
+        Helper function used when we need to perform variable substitutions. Nested data is traversed with an explicit
+        stack, instead of recursion, so deeply nested data does not exhaust the call stack.
 
         :param data: Data to substitute values in
         :param modifier: Modifier function that performs some kind of substitution.
@@ -101,14 +118,69 @@ class RecipeReader(IsModifiable):
         # Add the substitutions back in
         if isinstance(data, str):
             data = modifier(quote_special_strings(data))
-        if isinstance(data, dict):
-            for key in data.keys():
-                data[key] = RecipeReader._parse_yaml_recursive_sub(cast(str, data[key]), modifier)
-        elif isinstance(data, list):
-            for i in range(len(data)):
-                data[i] = RecipeReader._parse_yaml_recursive_sub(cast(str, data[i]), modifier)
+        if not isinstance(data, (dict, list)):
+            return data
+
+        # Modifiers may depend on the order in which values are visited, so values are visited depth-first, in order.
+        # Each stack entry tracks a collection and an iterator over the keys/indices that have yet to be visited.
+        stack: Final[list[tuple[dict[str, JsonType] | list[JsonType], Iterator[str | int]]]] = [
+            (data, iter(list(data)) if isinstance(data, dict) else iter(range(len(data))))
+        ]
+        while stack:
+            collection, keys = stack[-1]
+            # Lists are only ever indexed by integers and dictionaries by strings.
+            container = cast(dict[str | int, JsonType], collection)
+            for key in keys:
+                value = container[key]
+                if isinstance(value, str):
+                    value = modifier(quote_special_strings(value))
+                    container[key] = value
+                if isinstance(value, dict):
+                    stack.append((value, iter(list(value))))
+                    break
+                if isinstance(value, list):
+                    stack.append((value, iter(range(len(value)))))
+                    break
+            else:
+                stack.pop()
         return data
 
+    @staticmethod
+    def _load_yaml_line(s: str, yaml_loader: type[SafeLoader]) -> JsonType:
+        """
+        Loads a line (or multiple) of YAML into a Pythonic data structure. Most lines in a recipe file are simple
+        pairings of plain strings, which are constructed directly instead of invoking the YAML parser.
+
+        :param s: String to parse
+        :param yaml_loader: The YAML loader to use.
+        :returns: Pythonic data corresponding to the line of YAML
+        """
+        plain_match: Final = Regex.PLAIN_WORDS_LINE.fullmatch(s)
+        if plain_match is None or any(
+            word is not None and word.lower() in YAML_NON_STR_PLAIN_WORDS
+            for word in cast(tuple[Optional[str], ...], plain_match.groups())
+        ):
+            return cast(JsonType, yaml.load(s, Loader=yaml_loader))
+
+        key: Final = plain_match.group("key")
+        if key is None:
+            return [cast(str, plain_match.group("item"))]
+        return {cast(str, key): cast(Optional[str], plain_match.group("value"))}
+
+    @staticmethod
+    def _load_yaml_scalar(s: str, yaml_loader: type[SafeLoader]) -> JsonType:
+        """
+        Loads a YAML scalar into a Pythonic value. Plain strings (like most dependencies) are returned as-is instead of
+        invoking the YAML parser.
+
+        :param s: String to parse
+        :param yaml_loader: The YAML loader to use.
+        :returns: Pythonic value corresponding to the YAML scalar
+        """
+        if Regex.PLAIN_SCALAR.fullmatch(s) and (" " in s or s.lower() not in YAML_NON_STR_PLAIN_WORDS):
+            return s
+        return cast(JsonType, yaml.load(s, Loader=yaml_loader))
+
     @staticmethod
     def _parse_yaml(
         s: str, parser: Optional[RecipeReader] = None, yaml_loader: type[SafeLoader] = SafeLoader
@@ -138,7 +210,7 @@ class RecipeReader(IsModifiable):
         # then we fall back to performing JINJA substitutions.
         try:
             try:
-                output = _sub_jinja(cast(JsonType, yaml.load(s, Loader=yaml_loader)))
+                output = _sub_jinja(RecipeReader._load_yaml_line(s, yaml_loader))
             except yaml.scanner.ScannerError:
                 # We quote-escape here for problematic YAML strings that are non-JINJA, like `**/lib.so`. Parsing
                 # invalid YAML containing V0 JINJA statements should cause an exception and fallback to the other
@@ -151,12 +223,18 @@ class RecipeReader(IsModifiable):
             # substitution.
             sub_list: list[str] = Regex.JINJA_V0_SUB.findall(s)
             s = Regex.JINJA_V0_SUB.sub(RECIPE_MANAGER_SUB_MARKER, s)
-            # Because we leverage PyYaml to parse the data structures, we need to perform a second pass to perform
-            # variable substitutions.
-            output = _sub_jinja(
-                RecipeReader._parse_yaml_recursive_sub(
-                    cast(JsonType, yaml.load(s, Loader=yaml_loader)), lambda d: substitute_markers(d, sub_list)
-                )
+
+            # Because we leverage PyYaml to parse the data structures, we need to perform variable substitutions after
+            # the markers are re-injected. Both are applied to each value in a single pass over the data. Markers are
+            # consumed in order of appearance, which is the order in which values are visited.
+            def _sub_markers(d: str) -> JsonType:
+                unmarked: Final = substitute_markers(d, sub_list)
+                if parser is None:
+                    return unmarked
+                return parser._render_jinja_vars(quote_special_strings(unmarked))  # pylint: disable=protected-access
+
+            output = RecipeReader._parse_yaml_recursive_sub(
+                cast(JsonType, yaml.load(s, Loader=yaml_loader)), _sub_markers
             )
         return output
 
@@ -170,6 +248,9 @@ class RecipeReader(IsModifiable):
         """
         # There is a comment at the end of the line if a `#` symbol is found with leading whitespace before it. If it is
         # "touching" a character on the left-side, it is just part of a string.
+        # Most lines do not contain a `#` at all, which is much cheaper to check for than running the regex.
+        if "#" not in s:
+            return None
         comment_re_result: Final = Regex.DETECT_TRAILING_COMMENT.search(s)
         if comment_re_result is None:
             return None
@@ -179,7 +260,12 @@ class RecipeReader(IsModifiable):
 
     @staticmethod
     def _accumulate_multiline_str(
-        multiline_node: Node, lines: list[str], line_idx: int, new_indent: int, lst_indent: Optional[int] = None
+        multiline_node: Node,
+        lines: list[str],
+        indents: list[int],
+        line_idx: int,
+        new_indent: int,
+        lst_indent: Optional[int] = None,
     ) -> int:
         """
         Helper function that accumulates multiline strings into the parse tree. Used by both `_parse_multiline_node*()`
@@ -187,6 +273,7 @@ class RecipeReader(IsModifiable):
 
         :param multiline_node: "Multiline" node that will accumulate multiple lines.
         :param lines: Array of all lines in the file.
+        :param indents: Array of the indentation levels of all lines in the file, as computed by `num_tab_spaces()`.
         :param line_idx: Current index into the `lines` array, representing the current parser position. This may be
             incremented by this function. This starts by pointing to the line after `line`.
         :param new_indent: Current indentation level to track.
@@ -196,7 +283,7 @@ class RecipeReader(IsModifiable):
         :returns: The new `line_idx` value, to be used by the reset of the parsing logic.
         """
         multiline = lines[line_idx]
-        multiline_indent = num_tab_spaces(multiline)
+        multiline_indent = indents[line_idx]
         if lst_indent:
             multiline_indent += lst_indent
         lines_len: Final[int] = len(lines)
@@ -206,23 +293,25 @@ class RecipeReader(IsModifiable):
         #   - Blank lines are valid in multiline strings, occasionally found in `/about/summary` sections.
         #   - `.render()` handles interpretation of how newlines are displayed, depending on the `MultilineVariant`
         #     setting.
-        value = cast(list[str], multiline_node.value)
+        start_idx: Final[int] = line_idx
         while multiline_indent > new_indent or multiline == "":
-            value.append(multiline.strip())
             line_idx += 1
             # Ensure we stop looking if we have reached the end of the file.
             if line_idx >= lines_len:
                 break
             multiline = lines[line_idx]
-            multiline_indent = num_tab_spaces(multiline)
+            multiline_indent = indents[line_idx]
 
+        # The captured lines are added in a single operation, once the extent of the multiline string is known.
+        value = cast(list[str], multiline_node.value)
+        value.extend([line.strip() for line in lines[start_idx:line_idx]])
         multiline_node.value = value
 
         return line_idx
 
     @staticmethod
     def _parse_multiline_node_raw(
-        line: str, lines: list[str], line_idx: int, new_indent: int
+        line: str, lines: list[str], indents: list[int], line_idx: int, new_indent: int
     ) -> tuple[int, Optional[Node]]:
         """
         Parses a "raw" (flow-scalar) multiline string. These strings are special as the key is defined on the same
@@ -230,6 +319,7 @@ class RecipeReader(IsModifiable):
 
         :param line: Current line to scan/parse.
         :param lines: Array of all lines in the file.
+        :param indents: Array of the indentation levels of all lines in the file, as computed by `num_tab_spaces()`.
         :param line_idx: Current index into the `lines` array, representing the current parser position. This may be
             incremented by this function. This starts by pointing to the line after `line`.
         :param new_indent: Current indentation level to track.
@@ -242,9 +332,9 @@ class RecipeReader(IsModifiable):
 
         # "Raw" multiline strings are indicated by having the next line be at a greater indentation level. Look-ahead
         # and bail if that is not the case.
-        look_ahead: Final = lines[line_idx]
-        if num_tab_spaces(look_ahead) <= new_indent:
+        if indents[line_idx] <= new_indent:
             return line_idx, None
+        look_ahead: Final = lines[line_idx]
 
         # `:` and `#` characters can't be used in a multiline string if they are followed or proceeded by whitespace.
         # This is how YAML discerns between keys/comments against multiline strings.
@@ -261,19 +351,19 @@ class RecipeReader(IsModifiable):
 
         # Filter-out any known "block scalar" multiline markers. Those will be handled by `_parse_multiline_node()` as
         # they require a starting `new_node` generated by standard line-parsing process.
-        if init_value and init_value != MultilineVariant.RAW and init_value in set(MultilineVariant):
+        if init_value and init_value != MultilineVariant.RAW and init_value in _MULTILINE_VARIANTS_BY_VALUE:
             return line_idx, None
 
         new_node = Node(value=init_key, key_flag=True)
         multiline_node = Node(value=[init_value], multiline_variant=MultilineVariant.RAW)
-        line_idx = RecipeReader._accumulate_multiline_str(multiline_node, lines, line_idx, new_indent)
+        line_idx = RecipeReader._accumulate_multiline_str(multiline_node, lines, indents, line_idx, new_indent)
         new_node.children = [multiline_node]
 
         return line_idx, new_node
 
     @staticmethod
     def _parse_multiline_node_raw_list(
-        line: str, lines: list[str], line_idx: int, new_indent: int, new_node: Node
+        line: str, lines: list[str], indents: list[int], line_idx: int, new_indent: int, new_node: Node
     ) -> int:
         """
         Parses a "raw" (flow-scalar) multiline string in a list. These strings are special as the value is defined on
@@ -286,6 +376,7 @@ class RecipeReader(IsModifiable):
 
         :param line: Current line to scan/parse.
         :param lines: Array of all lines in the file.
+        :param indents: Array of the indentation levels of all lines in the file, as computed by `num_tab_spaces()`.
         :param line_idx: Current index into the `lines` array, representing the current parser position. This may be
             incremented by this function. This starts by pointing to the line after `line`.
         :param new_indent: Current indentation level to track.
@@ -299,9 +390,9 @@ class RecipeReader(IsModifiable):
 
         # "Raw" multiline strings are indicated by having the next line be at a greater indentation level.
         # Look-ahead and bail if that is not the case.
-        look_ahead: Final = lines[line_idx]
-        if num_tab_spaces(look_ahead) <= new_indent:
+        if indents[line_idx] <= new_indent:
             return line_idx
+        look_ahead: Final = lines[line_idx]
 
         # `:` and `#` characters can't be used in a multiline string if they are followed or proceeded by
         # whitespace. This is how YAML discerns between keys/comments against multiline strings.
@@ -322,12 +413,14 @@ class RecipeReader(IsModifiable):
         new_node.list_member_flag = True
         new_node.value = [init_value]
         # NOTE: We MUST account for the list marker (i.e. `- `) increasing the leading indentation.
-        line_idx = RecipeReader._accumulate_multiline_str(new_node, lines, line_idx, new_indent, len(line_marker))
+        line_idx = RecipeReader._accumulate_multiline_str(
+            new_node, lines, indents, line_idx, new_indent, len(line_marker)
+        )
 
         return line_idx
 
     @staticmethod
-    def _parse_multiline_extract_block_scalar(s: str) -> tuple[Optional[bool], Optional[str], Optional[str]]:
+    def _parse_multiline_extract_block_scalar(s: str) -> tuple[Optional[bool], Optional[str]]:
         """
         Helper function for `_parse_multiline_node()` that picks the applicable regex to match a potential starting
         multiline string with. This helper function normalizes data between list and non-list scalar multiline strings.
@@ -335,58 +428,48 @@ class RecipeReader(IsModifiable):
         :param s: String to match block scalar markers with.
         :returns: A tuple containing:
             - A boolean indicating if the line is part of a list or `None` if there was no match.
-            - The primary component of the block scalar or `None` if there was no match.
-            - The secondary component of the block scalar, if one is present.
+            - The block scalar marker, including its optional sign, or `None` if there was no match.
         """
         if match := Regex.MULTILINE_VARIANT.match(s):
-            return (
-                False,
-                cast(str, match.group(Regex.MULTILINE_VARIANT_CAPTURE_GROUP_CHAR)),
-                cast(str | None, match.group(Regex.MULTILINE_VARIANT_CAPTURE_GROUP_SUFFIX)),
-            )
+            return False, cast(str, match.group(Regex.MULTILINE_VARIANT_CAPTURE_GROUP))
         if match := Regex.MULTILINE_VARIANT_LIST.match(s):
-            return (
-                True,
-                cast(str, match.group(Regex.MULTILINE_VARIANT_CAPTURE_GROUP_CHAR)),
-                cast(str | None, match.group(Regex.MULTILINE_VARIANT_CAPTURE_GROUP_SUFFIX)),
-            )
-        return None, None, None
+            return True, cast(str, match.group(Regex.MULTILINE_VARIANT_CAPTURE_GROUP))
+        return None, None
 
     @staticmethod
-    def _parse_multiline_node(line: str, lines: list[str], line_idx: int, new_indent: int, new_node: Node) -> int:
+    def _parse_multiline_node(
+        line: str, lines: list[str], indents: list[int], line_idx: int, new_indent: int, new_node: Node
+    ) -> int:
         """
         Parses all multiline strings within lists and block-scalar multiline string. These 3 kinds of multiline
         strings require a key node to be defined on the previous line.
 
         :param line: Current line to scan/parse.
         :param lines: Array of all lines in the file.
+        :param indents: Array of the indentation levels of all lines in the file, as computed by `num_tab_spaces()`.
         :param line_idx: Current index into the `lines` array, representing the current parser position. This may be
             incremented by this function. This starts by pointing to the line after `line`.
         :param new_indent: Current indentation level to track.
         :param new_node: Current parse-tree node to operate on.
         :returns: The new `line_idx` value, to be used by the reset of the parsing logic.
         """
-        is_lst, variant_capture, variant_sign = RecipeReader._parse_multiline_extract_block_scalar(line)
+        is_lst, variant_capture = RecipeReader._parse_multiline_extract_block_scalar(line)
 
         # If required fields are `None`, we know that no "block scalar" pattern could be matched. So we attempt to
         # handle listed raw/"flow scalar" multiline strings.
         if is_lst is None or variant_capture is None:
-            return RecipeReader._parse_multiline_node_raw_list(line, lines, line_idx, new_indent, new_node)
-
-        # Calculate which multiline symbol is used. The first character must be matched, the second is optional.
-        if variant_sign is not None:
-            variant_capture += variant_sign
+            return RecipeReader._parse_multiline_node_raw_list(line, lines, indents, line_idx, new_indent, new_node)
 
         # List members that start with "block scalars" (i.e. `- |`) are rendered as `['']` by PyYaml. To help correct
         # this issue, we take the original node and patch-in the multiline string data.
         if is_lst:
-            new_node.multiline_variant = MultilineVariant(variant_capture)
+            new_node.multiline_variant = _MULTILINE_VARIANTS_BY_VALUE[variant_capture]
             new_node.list_member_flag = True
             new_node.value = []
-            return RecipeReader._accumulate_multiline_str(new_node, lines, line_idx, new_indent)
+            return RecipeReader._accumulate_multiline_str(new_node, lines, indents, line_idx, new_indent)
 
-        multiline_node = Node(value=[], multiline_variant=MultilineVariant(variant_capture))
-        line_idx = RecipeReader._accumulate_multiline_str(multiline_node, lines, line_idx, new_indent)
+        multiline_node = Node(value=[], multiline_variant=_MULTILINE_VARIANTS_BY_VALUE[variant_capture])
+        line_idx = RecipeReader._accumulate_multiline_str(multiline_node, lines, indents, line_idx, new_indent)
         new_node.children = [multiline_node]
 
         return line_idx
@@ -403,15 +486,15 @@ class RecipeReader(IsModifiable):
         :param yaml_loader: The YAML loader to use.
         :returns: A Node representing a line of the conda-formatted YAML.
         """
-        # Use PyYaml to safely/easily/correctly parse single lines of YAML.
-        output = RecipeReader._parse_yaml(s, yaml_loader=yaml_loader)
-
-        # The full line is a comment
+        # The full line is a comment. There is nothing for the YAML parser to read.
         if s.startswith("#"):
             return Node(
                 comment=s, comment_pos=CommentPosition.TOP_OF_FILE if only_seen_comments else CommentPosition.DEFAULT
             )
 
+        # Use PyYaml to safely/easily/correctly parse single lines of YAML.
+        output = RecipeReader._parse_yaml(s, yaml_loader=yaml_loader)
+
         # Attempt to parse-out comments. Fully commented lines are not ignored to preserve context when the text is
         # rendered. Their order in the list of child nodes will preserve their location. Fully commented lines just have
         # a value of "None".
@@ -420,14 +503,16 @@ class RecipeReader(IsModifiable):
         #   - https://github.com/yaml/pyyaml/issues/90
         # TODO Future: Node comments should be Optional. That would simplify this logic and prevent empty string
         # allocations.
+        # Trailing comments are mostly selectors, which repeat throughout a recipe. Interning them allows every node to
+        # share a single copy of each comment.
         opt_comment: Final = RecipeReader._parse_trailing_comment(s)
-        comment: Final = "" if opt_comment is None else opt_comment
+        comment: Final = "" if opt_comment is None else sys.intern(opt_comment)
 
         # If a dictionary is returned, we have a line containing a key and potentially a value. There should only be 1
         # key/value pairing in 1 line. Nodes representing keys should be flagged for handling edge cases.
         if isinstance(output, dict):
             children: list[Node] = []
-            key = list(output.keys())[0]
+            key = next(iter(output))
             # If the value returned is None, there is no leaf node to set
             if output[key] is not None:
                 # As the line is shared by both parent and child, the comment gets tagged to both.
@@ -450,7 +535,7 @@ class RecipeReader(IsModifiable):
             if isinstance(output[0], dict):
                 # Build up the key-and-potentially-value pair nodes first
                 key_children: list[Node] = []
-                key = list(output[0].keys())[0]
+                key = next(iter(output[0]))
                 if output[0][key] is not None:
                     key_children.append(Node(cast(Primitives, output[0][key]), comment))
                 key_node = Node(value=key, comment=comment, children=key_children, key_flag=True)
@@ -481,6 +566,70 @@ class RecipeReader(IsModifiable):
         recipe_reader._private_init(content=content, internal_call=True)  # pylint: disable=protected-access
         return recipe_reader
 
+    def _reset_caches(self) -> None:
+        """
+        Declares (or resets) all state memoized from the parse tree and variables table. This is the only place memoized
+        state should be declared, so that newly constructed and cloned instances start with the same, empty, caches.
+        """
+        # Memoizes path look-ups into the parse tree. Operations that modify the tree's structure must invalidate this
+        # (see `_invalidate_caches()`).
+        self._path_cache: dict[str, Optional[Node]] = {}
+        # Memoizes `render()` output for recipes that have not been modified. Keyed on every input to the rendering
+        # process that is not stored in the parse tree or variables table. Every edit to the parse tree or variables
+        # table must invalidate this (see `_invalidate_caches()`).
+        self._render_cache: dict[tuple[bool, SchemaVersion, bool], str] = {}
+        # Memoizes `get_package_paths()`. Like path look-ups, this must be invalidated when the tree's structure
+        # changes.
+        self._package_paths_cache: Optional[list[str]] = None
+        # Selector look-up table, which references nodes in the tree. It is built when it is first read (see
+        # `_selector_tbl`) and discarded by `_rebuild_selectors()`.
+        self._selector_tbl_cache: Optional[dict[str, list[SelectorInfo]]] = None
+        # Memoizes the evaluated variables, used as the default Jinja context. Any modification to the variables table
+        # must invalidate this (see `_invalidate_vars_context()`).
+        self._vars_context_cache: Optional[dict[str, JsonType]] = None
+        # Memoizes the evaluation of variables with multiple definitions. Invalidated alongside the Jinja context.
+        self._eval_var_cache: dict[str, JsonType] = {}
+
+    @classmethod
+    def _structural_clone(cls, other: RecipeReader) -> Self:
+        """
+        Creates a new instance of this class that is an independent copy of another recipe. The parse tree is copied
+        node-by-node, avoiding the cost of rendering the other recipe to text and re-parsing it.
+
+        NOTE: The copy is NOT normalized the way a re-parse of the rendered recipe is. Callers that need a round trip
+              equivalent must only use this on recipes that render back to the text they were parsed from.
+
+        :param other: Recipe to copy.
+        :returns: A new recipe instance, equivalent to `other`.
+        """
+        clone = cls.__new__(cls)
+        IsModifiable.__init__(clone)
+        # pylint: disable=protected-access
+        clone._init_content = other._init_content
+        clone._flags = other._flags
+        clone._yaml_loader = other._yaml_loader
+        clone._is_cbc = other._is_cbc
+        clone._schema_version = other._schema_version
+        clone._root = other._root.clone()
+        # `NodeVar`s are not modified in-place, so they may be shared between the two variable tables.
+        clone._vars_tbl = {key: list(node_vars) for key, node_vars in other._vars_tbl.items()}
+        # pylint: enable=protected-access
+        # Memoized state (including the selector table) references nodes in the original tree, so none of it is copied.
+        clone._reset_caches()
+        return clone
+
+    @staticmethod
+    def _is_simple_scalar(value: JsonType) -> bool:
+        """
+        Indicates if a value is a scalar that is represented in the parse tree exactly as-is.
+
+        :param value: Value to check.
+        :returns: True if the value can be stored directly in a node. False otherwise.
+        """
+        if isinstance(value, str):
+            return "#" not in value and value.isprintable()
+        return isinstance(value, PRIMITIVES_NO_NONE_TUPLE)
+
     @staticmethod
     def _generate_subtree(value: JsonType) -> list[Node]:
         """
@@ -498,6 +647,26 @@ class RecipeReader(IsModifiable):
                 )
             ]
 
+        # Lists of simple scalars (commonly, lists of dependencies) map directly to list member nodes. This avoids the
+        # cost of dumping and re-parsing the list as YAML. Strings that may contain comments or special characters are
+        # excluded, as they are transformed by the parser.
+        if isinstance(value, list) and value and all(RecipeReader._is_simple_scalar(item) for item in value):
+            return [Node(value=cast(Primitives, item), list_member_flag=True) for item in value]
+
+        # Similarly, mappings of simple scalars map directly to key nodes that each hold a single value.
+        if (
+            isinstance(value, dict)
+            and value
+            and all(
+                RecipeReader._is_simple_scalar(key) and RecipeReader._is_simple_scalar(item)
+                for key, item in value.items()
+            )
+        ):
+            return [
+                Node(value=key, children=[Node(value=cast(Primitives, item))], key_flag=True)
+                for key, item in value.items()
+            ]
+
         # For complex types, generate the YAML equivalent and build a new tree.
         if not isinstance(value, PRIMITIVES_TUPLE):
             # Although not technically required by YAML, we add the optional spacing for human readability.
@@ -524,6 +693,35 @@ class RecipeReader(IsModifiable):
             case SchemaVersion.V1:
                 return 3, Regex.JINJA_V1_SUB
 
+    @staticmethod
+    @lru_cache(maxsize=4096)  # type: ignore[misc]
+    def _compile_jinja_expression(expression: str) -> TemplateExpression:
+        """
+        Compiles a Jinja expression. The same expressions are evaluated many times while parsing a recipe, so compiled
+        expressions are memoized.
+
+        :param expression: The Jinja expression to compile.
+        :raises jinja2.TemplateSyntaxError: If the expression is invalid.
+        :returns: The compiled expression, which can be called with a context to render the expression.
+        """
+        return _JINJA_ENV.compile_expression(expression, undefined_to_none=False)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)  # type: ignore[misc]
+    def _compile_var_reference_re(schema_version: SchemaVersion, var: str) -> re.Pattern[str]:
+        """
+        Compiles a regular expression that finds JINJA substitutions that reference a variable. Recipes are often
+        queried for the same variables, so compiled expressions are memoized.
+
+        :param schema_version: Schema version of the recipe being searched.
+        :param var: Variable of interest. Any special characters in the name are matched literally.
+        :returns: The compiled regular expression.
+        """
+        # The regular expression between the braces is very forgiving to match JINJA expressions like
+        # `{{ name | lower }}`
+        prefix: Final = r"\$" if schema_version == SchemaVersion.V1 else ""
+        return re.compile(prefix + r"{{.*?" + re.escape(var) + r".*?}}")
+
     @no_type_check
     @staticmethod
     def _render_jinja_expression(expression: str, context: dict[str, JsonType]) -> tuple[bool, JsonType]:
@@ -536,9 +734,7 @@ class RecipeReader(IsModifiable):
             the rendered value, or the original expression if it cannot be rendered.
         """
         try:
-            env = Environment(undefined=StrictUndefined)
-            compiled_expression = env.compile_expression(expression, undefined_to_none=False)
-            result = compiled_expression(**context)
+            result = RecipeReader._compile_jinja_expression(expression)(**context)
             if isinstance(result, StrictUndefined):
                 return False, expression
             return True, result
@@ -556,6 +752,9 @@ class RecipeReader(IsModifiable):
             case SchemaVersion.V0:
                 if len(self._vars_tbl[key]) == 1:
                     return self._vars_tbl[key][0].get_value()
+                # Concatenations require rendering every definition, so their results are memoized.
+                if key in self._eval_var_cache:
+                    return self._eval_var_cache[key]
                 # Support recursive concatenation here.
                 context: dict[str, JsonType] = {}
                 for node_var in self._vars_tbl[key]:
@@ -569,6 +768,7 @@ class RecipeReader(IsModifiable):
                             context,
                         )
                     context = {key: result}
+                self._eval_var_cache[key] = result
                 return result
             case SchemaVersion.V1:
                 return self._vars_tbl[key][0].get_value()
@@ -588,33 +788,40 @@ class RecipeReader(IsModifiable):
 
         start_idx, sub_regex = self._set_on_schema_version()
 
-        if context is None:
-            context = {k: self.get_variable(k) for k in self._vars_tbl}
-
-        # Search the string, replacing all substitutions we can recognize
-        for match in cast(list[str], sub_regex.findall(s)):
+        def _render_sub(match: re.Match[str]) -> str:
+            nonlocal context
+            # Most values contain no substitutions, so the evaluation context is only built once it is needed.
+            if context is None:
+                context = self._get_vars_context()
             # The regex guarantees the string starts and ends with double braces
-            expression = match[start_idx:-2].strip()
+            expression = match.group(0)[start_idx:-2].strip()
             # If the expression can't be evaluated, skip it.
             success, result = cast(tuple[bool, JsonType], self._render_jinja_expression(expression, context))
             if not success:
                 log.warning("The recipe parser was unable to evaluate the JINJA expression: %s", expression)
-                continue
+                return match.group(0)
             # Do not replace the match if the result is not a primitive type. None signals an undefined expression.
             if not isinstance(result, PRIMITIVES_NO_NONE_TUPLE):
                 log.warning("The recipe parser was unable to evaluate the JINJA expression: %s", expression)
-                continue
+                return match.group(0)
             result = str(result)
-            if Regex.JINJA_VAR_VALUE_TERNARY.match(result):
-                result = "${{" + result + "}}"
-            s = s.replace(match, result)
+            # Ternaries are rare, so the regex only runs on results that contain both keywords. The keywords are checked
+            # without surrounding spaces, as the regex accepts any whitespace around them.
+            if "if" in result and "else" in result and Regex.JINJA_VAR_VALUE_TERNARY.match(result):
+                return "${{" + result + "}}"
+            return result
+
+        # Replace all substitutions we can recognize, in a single pass over the string. Both the V0 and V1 patterns
+        # require double braces, so most strings can skip the regular expression search entirely.
+        if "{{" in s:
+            s = sub_regex.sub(_render_sub, s)
 
         # If there is leading V0 (unescaped) JINJA that was not able to be fully rendered, it will not be able to be
         # parsed by PyYaml. So it is best to just return the value as a string, without evaluating the type (which, to
         # be clear, should be a string).
         if self._schema_version == SchemaVersion.V0 and s[:2] == "{{":
             return s
-        return cast(JsonType, yaml.load(s, Loader=self._yaml_loader))
+        return RecipeReader._load_yaml_scalar(s, self._yaml_loader)
 
     def _init_vars_tbl(self) -> None:
         """
@@ -625,26 +832,27 @@ class RecipeReader(IsModifiable):
         """
         # Tracks Jinja variables set by the file
         self._vars_tbl: _VarTable = {}
+        # The table may be re-initialized on an existing instance.
+        self._invalidate_vars_context()
 
         match self._schema_version:
             case SchemaVersion.V0:
                 # Find all the set statements and record the values
-                for set_match in cast(list[re.Match[str]], Regex.JINJA_V0_SET_MULTI_LINE.finditer(self._init_content)):
-                    jinja_match: str = set_match.group("jinja")
-                    key = jinja_match[jinja_match.find("set") + len("set") : jinja_match.find("=")].strip()
-                    value: str | JsonType = jinja_match[
-                        jinja_match.find("=") + len("=") : jinja_match.find("%}")
-                    ].strip()
+                for set_match in iter_jinja_v0_set_statements(self._init_content):
+                    key = cast(str, set_match.group("key")).strip()
+                    value: str | JsonType = cast(str, set_match.group("value")).strip()
                     # Fall-back to string interpretation.
                     # TODO: Ideally we use `_parse_yaml()` in the future. However, as discovered in the work to solve
                     # issue #366, that is easier said than done. `_parse_yaml()` was never expected to run on V0 JINJA
                     # variable initialization lines. This causes a lot of conversion problems if the value being set is
                     # a string that is invalid YAML.
                     # Example: {% set soversion = ".".join(version.split(".")[:3]) %}
-                    try:
-                        value = cast(JsonType, ast.literal_eval(cast(str, value)))
-                    except Exception:  # pylint: disable=broad-exception-caught
-                        value = str(value)
+                    # Most values are JINJA expressions that can't be Python literals, so the evaluation is skipped.
+                    if Regex.PY_LITERAL_PREFIX.match(cast(str, value)):
+                        try:
+                            value = cast(JsonType, ast.literal_eval(cast(str, value)))
+                        except Exception:  # pylint: disable=broad-exception-caught
+                            value = str(value)
                     raw_comment: Optional[str] = set_match.group("comment")
                     comment: Optional[str] = raw_comment.rstrip() if isinstance(raw_comment, str) else None
                     node_var = NodeVar(value, comment)
@@ -666,22 +874,148 @@ class RecipeReader(IsModifiable):
                     # V1 does not support multiple definitions in `/context` because YAML keys must be unique.
                     self._vars_tbl[key] = [NodeVar(value, comments_tbl.get(var_path, None))]
 
+    def _get_vars_context(self) -> dict[str, JsonType]:
+        """
+        Returns the evaluated recipe variables, for use as a Jinja context. The result is memoized until the variables
+        table is modified. Callers must not modify the returned dictionary.
+
+        :returns: Mapping of variable names to their evaluated values.
+        """
+        if self._vars_context_cache is None:
+            self._vars_context_cache = {k: self.get_variable(k) for k in self._vars_tbl}
+        return self._vars_context_cache
+
+    def _invalidate_vars_context(self) -> None:
+        """
+        Evicts the memoized Jinja context and variable evaluations. This needs to be called when the variables table is
+        modified.
+        """
+        self._vars_context_cache = None
+        self._eval_var_cache.clear()
+        # V0 variables are rendered with the recipe.
+        self._invalidate_caches(structure_changed=False)
+
     def _rebuild_selectors(self) -> None:
         """
-        Re-builds the selector look-up table. This table allows quick access to tree nodes that have a selector
-        specified. This needs to be called when the tree or selectors are modified.
+        Re-builds the selector look-up table. This needs to be called when the tree or selectors are modified. The work
+        of re-building the table is postponed until the next time the table is read.
+
+        NOTE: This does not invalidate any other memoized state. Callers must also call `_invalidate_caches()`.
         """
-        self._selector_tbl: dict[str, list[SelectorInfo]] = {}
+        self._selector_tbl_cache = None
+
+    @property
+    def _selector_tbl(self) -> dict[str, list[SelectorInfo]]:
+        """
+        Selector look-up table. This table allows quick access to tree nodes that have a selector specified. Many
+        readers never query selectors, so the table is only built when it is first needed.
+
+        :returns: Table mapping selectors to the nodes (and paths to those nodes) that use them.
+        """
+        if self._selector_tbl_cache is not None:
+            return self._selector_tbl_cache
+
+        selector_tbl: Final[dict[str, list[SelectorInfo]]] = {}
 
         def _collect_selectors(node: Node, path: StrStack) -> None:
             selector: Final = SelectorParser._v0_extract_selector(node.comment)  # pylint: disable=protected-access
             if selector is None:
                 return
-            selector_info = SelectorInfo(node, list(path))
-            self._selector_tbl.setdefault(selector, [])
-            self._selector_tbl[selector].append(selector_info)
+            # `traverse_all()` provides a new path list for every node, so it does not need to be copied.
+            selector_tbl.setdefault(selector, []).append(SelectorInfo(node, path))
 
         traverse_all(self._root, _collect_selectors)
+        self._selector_tbl_cache = selector_tbl
+        return selector_tbl
+
+    def _traverse_cached(self, path: str) -> Optional[Node]:
+        """
+        Memoized equivalent of `traverse()` for string paths. Repeated look-ups of the same path (including paths that
+        do not exist) are resolved without walking the parse tree.
+
+        :param path: JSON patch (RFC 6902)-style path to a value.
+        :returns: `Node` object if a node is found in the parse tree at that path. Otherwise returns `None`.
+        """
+        # Only absolute paths are memoized, so that cache invalidation can be performed with simple prefix checks.
+        if not path.startswith(ROOT_NODE_VALUE):
+            return traverse(self._root, str_to_stack_path(path))
+        if path not in self._path_cache:
+            # Paths are frequently re-built from the same fragments. Interning the keys ensures the cache only holds one
+            # copy of each path and allows interned look-ups to be resolved by identity.
+            self._path_cache[sys.intern(path)] = traverse(self._root, str_to_stack_path(path))
+        return self._path_cache[path]
+
+    def _invalidate_caches(self, path: str = ROOT_NODE_VALUE, structure_changed: bool = True) -> None:
+        """
+        Evicts memoized results that may have been affected by a modification to the parse tree at `path`. This is the
+        single invalidation point for in-place edits: EVERY function that edits the parse tree (including values and
+        comments) MUST call this, whether or not it marks the recipe as modified.
+
+        Memoized renderings are always evicted. If the structure of the tree changed (nodes were added, removed,
+        re-ordered or had their keys renamed), memoized path look-ups that may have been affected are also evicted.
+        This includes the siblings of the modified node, as list indices may have shifted. If the modified node's parent
+        is a list member, the siblings of the parent are also evicted, as adding a key to a scalar list member inserts a
+        new member into the list. By default, the entire cache is evicted.
+
+        :param path: (Optional) Path that was modified.
+        :param structure_changed: (Optional) Set to False if only values of leaves or comments were modified.
+        """
+        self._render_cache.clear()
+        if not structure_changed:
+            return
+        # The number of outputs may have changed.
+        self._package_paths_cache = None
+        prefix: str = path.rstrip(ROOT_NODE_VALUE).rpartition(ROOT_NODE_VALUE)[0]
+        grandparent_prefix, _, parent_key = prefix.rpartition(ROOT_NODE_VALUE)
+        if parent_key.isdigit():
+            prefix = grandparent_prefix
+        if not prefix:
+            self._path_cache.clear()
+            return
+        for key in [key for key in self._path_cache if key.startswith(prefix)]:
+            del self._path_cache[key]
+
+    def _index_path_cache(self) -> None:
+        """
+        Populates the memoized path look-ups with every path in the parse tree, in a single traversal. This is useful
+        prior to performing many look-ups across the whole tree. Look-ups of paths not found in the tree are still
+        memoized on demand.
+
+        Only paths that `traverse()` resolves to the same node are indexed. Keys that can't be expressed as a path
+        segment (keys containing `/`, all-digit keys that would be read as list indices, non-string keys) and keys that
+        are shadowed by an earlier sibling are skipped, along with everything beneath them.
+        """
+        # Each entry tracks a node and its (string) path. The root's path is the empty string.
+        stack: Final[list[tuple[Node, str]]] = [(self._root, "")]
+        while stack:
+            node, path = stack.pop()
+            mapping = remap_child_indices_phys_to_virt(node.children)
+            # `traverse()` resolves a key segment to the first child with a matching value, including list members.
+            seen_values: set[Primitives] = set()
+            for i, child in enumerate(node.children):
+                if child.is_comment():
+                    continue
+                value = child.value
+                child_path: Optional[str] = None
+                if child.list_member_flag:
+                    child_path = f"{path}/{mapping[i]}"
+                # Strong leaves share the path of their parent key. Similarly, nodes without a value are not
+                # addressable unless they are list members.
+                elif (
+                    isinstance(value, str)
+                    and not child.is_strong_leaf()
+                    and value
+                    and ROOT_NODE_VALUE not in value
+                    and not value.isdigit()
+                    and value not in seen_values
+                ):
+                    child_path = f"{path}/{value}"
+                if isinstance(value, PRIMITIVES_TUPLE):
+                    seen_values.add(value)
+                if child_path is None:
+                    continue
+                self._path_cache.setdefault(sys.intern(child_path), child)
+                stack.append((child, child_path))
 
     def _init_schema_version_and_sanitize_v0_yaml(
         self, internal_call: bool, force_remove_jinja: bool
@@ -727,23 +1061,36 @@ class RecipeReader(IsModifiable):
         fmt_str: Final = str(fmt)
 
         # For V0 recipe files, count the number of comment-only lines at the start, before the canonical "variables
-        # section"
-        tof_comment_cntr = 0
-        while fmt_str.splitlines()[tof_comment_cntr].startswith("#"):
-            tof_comment_cntr += 1
+        # section". Every formatted line ends in a newline, so the comment block is counted by its newlines.
+        tof_comment_cntr: Final = fmt_str.count(
+            "\n", 0, cast(re.Match[str], Regex.V0_FMT_TOF_COMMENTS.match(fmt_str)).end()
+        )
+
+        # The JINJA statements are found once, to be both validated and removed. Statements and comments require their
+        # opening delimiters, so the regex search can be skipped when neither is present.
+        jinja_matches: Final = (
+            list(Regex.JINJA_V0_MULTI_LINE.finditer(fmt_str)) if "{%" in fmt_str or "{#" in fmt_str else []
+        )
 
         # Before removing JINJA statements, we need to ensure that they are all set statements.
         # Unless we are forcefully removing JINJA statements.
-        if not force_remove_jinja:
-            set_statements: set[str] = {match.group() for match in Regex.JINJA_V0_SET_MULTI_LINE.finditer(fmt_str)}
-            for match in Regex.JINJA_V0_MULTI_LINE.finditer(fmt_str):
-                if match.group() not in set_statements:
+        if not force_remove_jinja and jinja_matches:
+            set_spans: Final = {match.span() for match in iter_jinja_v0_set_statements(fmt_str)}
+            for match in jinja_matches:
+                if match.span() not in set_spans:
                     raise ParsingJinjaException(match.group())
 
         # Replace all JINJA lines and fix excessive indentation. Then traverse line-by-line.
-        sanitized_yaml_unfixed: Final = Regex.JINJA_V0_MULTI_LINE.sub("", fmt_str)
-        # We then must call for a second kind of text formatting, now that the JINJA has been removed.
-        sanitized_fmt = V0RecipeFormatter(sanitized_yaml_unfixed)
+        unfixed_parts: Final[list[str]] = []
+        prev_end = 0
+        for match in jinja_matches:
+            unfixed_parts.append(fmt_str[prev_end : match.start()])
+            prev_end = match.end()
+        unfixed_parts.append(fmt_str[prev_end:])
+        sanitized_yaml_unfixed: Final = "".join(unfixed_parts)
+        # We then must call for a second kind of text formatting, now that the JINJA has been removed. If there was no
+        # JINJA to remove, the text is unchanged and the existing formatter can be re-used.
+        sanitized_fmt = V0RecipeFormatter(sanitized_yaml_unfixed) if jinja_matches else fmt
         if not sanitized_fmt.fix_excessive_indentation():
             log.error("The recipe parser was unable to correct indentation level in a V0 recipe file.")
 
@@ -767,33 +1114,47 @@ class RecipeReader(IsModifiable):
         # both at column 0). When True, we pop the stack on the next non-list
         # sibling at the same indent.
         same_indent_list_active = False
+        # Tracks the values of the children of parent nodes that keys have been added to, so that duplicate keys can be
+        # detected without scanning every sibling. `Node`s are not hashable, so parents are tracked by identity.
+        # Multiline values (lists) and flow mappings (dicts) are never equal to a key and are not hashable, so they are
+        # not tracked.
+        sibling_values_tbl: Final[dict[int, set[Primitives | SentinelType]]] = {}
+        # Instance state used inside the loop is looked up once, up-front.
+        yaml_loader: Final = self._yaml_loader
+        allow_duplicate_keys: Final = RecipeReaderFlags.ALLOW_DUPLICATE_KEYS in self._flags
 
         # Iterate with an index variable, so we can handle multiline values
         line_idx = 0
         lines: Final = sanitized_yaml.splitlines()
         num_lines: Final = len(lines)
+        # Indentation is computed once per line, as the multiline parsing functions look ahead at subsequent lines.
+        # Leading spaces are stripped once to measure indentation. The stripped line is also kept: it rarely has any
+        # other surrounding whitespace, so stripping it again usually returns the same string instead of a new one.
+        space_stripped_lines: Final = [line.lstrip(" ") for line in lines]
+        indents: Final = [len(line) - len(stripped) for line, stripped in zip(lines, space_stripped_lines)]
         while line_idx < num_lines:
-            line = lines[line_idx]
+            clean_line = space_stripped_lines[line_idx].strip()
             # Increment here, so that the inner multiline processing loop doesn't cause a skip of the line following the
             # multiline value.
             line_idx += 1
             # Ignore empty lines
-            clean_line = line.strip()
             if clean_line == "":
                 continue
 
-            new_indent = num_tab_spaces(line)
+            new_indent = indents[line_idx - 1]
             # Special multiline case. This will initialize `new_node` if a "raw" multiline string is found.
-            line_idx, new_node = RecipeReader._parse_multiline_node_raw(clean_line, lines, line_idx, new_indent)
+            line_idx, new_node = RecipeReader._parse_multiline_node_raw(
+                clean_line, lines, indents, line_idx, new_indent
+            )
             if new_node is None:
-                new_node = RecipeReader._parse_line_node(
-                    clean_line, tof_comment_cntr > 0, yaml_loader=self._yaml_loader
-                )
+                new_node = RecipeReader._parse_line_node(clean_line, tof_comment_cntr > 0, yaml_loader=yaml_loader)
                 tof_comment_cntr -= 1
                 # In the general case (which does not create a `new_node`), we ignore the returned `new_node` value and
                 # rely on the object being modified by the reference we pass-in. As a small optimization, we only run
                 # checks on the other multiline variants if the special case fails.
-                line_idx = RecipeReader._parse_multiline_node(clean_line, lines, line_idx, new_indent, new_node)
+                line_idx = RecipeReader._parse_multiline_node(
+                    clean_line, lines, indents, line_idx, new_indent, new_node
+                )
             # Insurance policy: If we miscounted, force-drop the ToF-comment state.
             if tof_comment_cntr > 0 and not new_node.is_comment():
                 tof_comment_cntr = -1
@@ -827,19 +1188,27 @@ class RecipeReader(IsModifiable):
                 #     fizz: buzz
                 # baz: blah
                 # Tab-depth is guaranteed because of fix_excessive_indentation() above.
+                # The levels are dropped with a single slice deletion. Note that `del node_stack[-0:]` would clear the
+                # entire stack.
                 depth_to_pop = (cur_indent - new_indent) // TAB_SPACE_COUNT
-                for _ in range(depth_to_pop):
-                    node_stack.pop()
+                if depth_to_pop > 0:
+                    del node_stack[-depth_to_pop:]
             cur_indent = new_indent
             # Look at the stack to determine the parent Node and then append the current node to the new parent.
             parent = node_stack[-1]
+            parent_id = id(parent)
+            sibling_values = sibling_values_tbl.get(parent_id)
             # Check for duplicate keys and bail if found.
-            if (
-                new_node.is_key()
-                and not new_node.list_member_flag
-                and new_node.value in [child.value for child in parent.children]
-            ):
-                if RecipeReaderFlags.ALLOW_DUPLICATE_KEYS not in self._flags:
+            is_duplicate_key = False
+            if new_node.key_flag and not new_node.list_member_flag:
+                if sibling_values is None:
+                    sibling_values = {
+                        child.value for child in parent.children if not isinstance(child.value, (list, dict))
+                    }
+                    sibling_values_tbl[parent_id] = sibling_values
+                is_duplicate_key = new_node.value in sibling_values
+            if is_duplicate_key:
+                if not allow_duplicate_keys:
                     raise DuplicateKeyException(line_idx, str(new_node.value))
 
                 # This warning is disabled in conda-recipe-manager by default and up to the client to enable if needed.
@@ -855,6 +1224,8 @@ class RecipeReader(IsModifiable):
                 # Log the warning to actual logs.
                 log.warning("Duplicate %s keys found, ALLOW_DUPLICATE_KEYS enabled, allowing...", new_node.value)
             parent.children.append(new_node)
+            if sibling_values is not None and not isinstance(new_node.value, (list, dict)):
+                sibling_values.add(new_node.value)
             # Update the last node for the next line interpretation
             last_node = new_node
 
@@ -889,17 +1260,14 @@ class RecipeReader(IsModifiable):
             internal_call, force_remove_jinja
         )
 
+        self._reset_caches()
         # Construct the parse tree from the sanitized YAML.
         self._root = Node(value=ROOT_NODE_VALUE)
         self._construct_parse_tree(sanitized_yaml, tof_comment_cntr)
         # Initialize the variables table. This behavior changes per `schema_version`
         self._init_vars_tbl()
-
-        # Now that the tree is built, construct a selector look-up table that tracks all the nodes that use a particular
-        # selector. This will make it easier to.
-        #
-        # This table will have to be re-built or modified when the tree is modified with `patch()`.
-        self._rebuild_selectors()
+        # NOTE: The selector look-up table, which tracks all the nodes that use a particular selector, is built when it
+        # is first read. It will have to be re-built when the tree is modified with `patch()`.
 
     def __init__(
         self, content: str, flags: RecipeReaderFlags = RecipeReaderFlags.NONE
@@ -971,25 +1339,26 @@ class RecipeReader(IsModifiable):
 
         :returns: String representation of the recipe file
         """
-        s = "--------------------\n"
-        tree_lines: list[str] = []
-        RecipeReader._str_tree_recurse(self._root, 0, tree_lines)
-        s += f"{self.__class__.__name__} Instance\n"
-        s += f"- Schema Version: {self._schema_version}\n"
-        s += "- Variables Table:\n"
+        lines: Final[list[str]] = [
+            "--------------------",
+            f"{self.__class__.__name__} Instance",
+            f"- Schema Version: {self._schema_version}",
+            "- Variables Table:",
+        ]
         for key, node_vars in self._vars_tbl.items():
             for node_var in node_vars:
-                s += f"{TAB_AS_SPACES}- {key}: {node_var.render_v0_value()}{node_var.render_comment()}\n"
-        s += "- Selectors Table:\n"
+                lines.append(f"{TAB_AS_SPACES}- {key}: {node_var.render_v0_value()}{node_var.render_comment()}")
+        lines.append("- Selectors Table:")
         for key, val in self._selector_tbl.items():
-            s += f"{TAB_AS_SPACES}{key}\n"
+            lines.append(f"{TAB_AS_SPACES}{key}")
             for info in val:
-                s += f"{TAB_AS_SPACES}{TAB_AS_SPACES}- {info}\n"
-        s += f"- is_modified?: {self._is_modified}\n"
-        s += "- Tree:\n" + "\n".join(tree_lines) + "\n"
-        s += "--------------------\n"
+                lines.append(f"{TAB_AS_SPACES}{TAB_AS_SPACES}- {info}")
+        lines.append(f"- is_modified?: {self._is_modified}")
+        lines.append("- Tree:")
+        RecipeReader._str_tree_recurse(self._root, 0, lines)
+        lines.append("--------------------")
 
-        return s
+        return "\n".join(lines) + "\n"
 
     def __eq__(self, other: object) -> bool:
         """
@@ -1002,6 +1371,13 @@ class RecipeReader(IsModifiable):
             raise TypeError
         if self._schema_version != other._schema_version:
             return False
+        # Recipes with a different number of top-level nodes can't render to the same text. Neither can V0 recipes that
+        # set different variables, as the V0 variable table is rendered directly. These cheap checks avoid rendering
+        # both recipes when they obviously differ.
+        if len(self._root.children) != len(other._root.children):
+            return False
+        if self._schema_version == SchemaVersion.V0 and self._vars_tbl.keys() != other._vars_tbl.keys():
+            return False
         return self.render() == other.render()
 
     def get_schema_version(self) -> SchemaVersion:
@@ -1021,57 +1397,72 @@ class RecipeReader(IsModifiable):
         raise NotImplementedError
 
     @staticmethod
-    def _render_tree(
-        node: Node,
-        depth: int,
-        lines: list[str],
-        schema_version: SchemaVersion,
-        is_cbc: bool,
-        omit_trailing_newline: bool,
-        parent: Optional[Node] = None,
-    ) -> None:
-        # pylint: disable=too-complex
-        # TODO This function REALLY needs to be refactored and simplified ^
+    def _render_comment_suffix(comment: str) -> str:
         """
-        Recursive helper function that traverses the parse tree to generate a file.
+        Renders the portion of a line that follows a node's key or value, sans any trailing whitespace.
 
-        :param node: Current node in the tree.
-        :param depth: Current depth of the recursion.
+        :param comment: Comment string stored on a node.
+        :returns: Two spaces and the comment, or an empty string if there is no comment to render.
+        """
+        comment = comment.rstrip()
+        return f"  {comment}" if comment else ""
+
+    @staticmethod
+    def _render_multiline_lst(n: Node, spaces: str, lines: list[str]) -> bool:
+        """
+        Helper function that renders multiline strings within lists.
+
+        :param n: List member node to render.
+        :param spaces: Indentation of the list that contains the node.
         :param lines: Accumulated list of lines in the recipe file.
-        :param schema_version: Target recipe schema version.
-        :param is_cbc: Flag indicating if this file is being interpreted as a CBC file.
-        :param omit_trailing_newline: User-supplied flag indicating if the trailing newline should NOT be included. This
-            is a strong preference for various groups of the Conda Community.
-        :param parent: (Optional) Parent node to the current node. Set by recursive calls only.
+        :returns: True if lines were added. False if the node does not contain a multiline string.
         """
-        spaces = TAB_AS_SPACES * depth
+        multi_variant_lst = n.multiline_variant
+        if multi_variant_lst == MultilineVariant.NONE:
+            return False
 
-        # Helper function that renders multiline strings within lists.
-        def _render_multiline_lst(n: Node) -> bool:
-            multi_variant_lst = n.multiline_variant
-            if multi_variant_lst == MultilineVariant.NONE:
-                return False
+        # Raw/"flow scalar" multiline strings start rendering on the same line. "Block scalars" render
+        # the block marker on the same line.
+        multi_start_idx = 0
+        if multi_variant_lst == MultilineVariant.RAW:
+            lines.append(f"{spaces}{TAB_AS_SPACES}- {cast(list[str], n.value)[0]}".rstrip())
+            multi_start_idx = 1
+        else:
+            lines.append(f"{spaces}{TAB_AS_SPACES}- {multi_variant_lst}".rstrip())
+        for mulit_line in cast(list[str], n.value)[multi_start_idx:]:
+            lines.append(f"{spaces}{TAB_AS_SPACES}  {mulit_line}".rstrip())
 
-            # Raw/"flow scalar" multiline strings start rendering on the same line. "Block scalars" render
-            # the block marker on the same line.
-            multi_start_idx = 0
-            if multi_variant_lst == MultilineVariant.RAW:
-                lines.append(f"{spaces}{TAB_AS_SPACES}- {cast(list[str], n.value)[0]}".rstrip())
-                multi_start_idx = 1
-            else:
-                lines.append(f"{spaces}{TAB_AS_SPACES}- {multi_variant_lst}".rstrip())
-            for mulit_line in cast(list[str], n.value)[multi_start_idx:]:
-                lines.append(f"{spaces}{TAB_AS_SPACES}  {mulit_line}".rstrip())
+        return True
+
+    @staticmethod
+    def _render_node(
+        node: Node, depth: int, lines: list[str], parent: Optional[Node], indents: list[str]
+    ) -> Optional[int]:
+        # pylint: disable=too-complex
+        # TODO This function REALLY needs to be refactored and simplified ^
+        """
+        Helper function that renders the lines that belong to a node, ahead of any of the node's children.
 
-            return True
+        :param node: Current node in the tree.
+        :param depth: Current depth of the traversal.
+        :param lines: Accumulated list of lines in the recipe file.
+        :param parent: Parent node to the current node. `None` for the root node.
+        :param indents: Indentation strings, indexed by depth. Must cover the depth of the current node.
+        :returns: The number of levels to indent the node's children by, relative to the node. `None` if the node and
+            all of its children have already been rendered.
+        """
+        spaces = indents[depth] if depth >= 0 else ""
+        # Key lines end in a `:` mark, so only a comment can contribute trailing whitespace. Building the suffix once
+        # per node lets those lines skip an `.rstrip()` over the whole rendered line.
+        comment_suffix: Final = RecipeReader._render_comment_suffix(node.comment)
 
         # Edge case: A list of lists needs to be indicated with an additional `-` before subsequent list items are
         # shown. In CBC files, these list indicator lines may also contain selectors.
         if node.is_collection_element() and node.children and node.children[0].list_member_flag:
-            lines.append(f"{TAB_AS_SPACES * (depth)}-  {node.comment}".rstrip())
+            lines.append(f"{spaces}-{comment_suffix}")
 
         # Edge case: The first element of dictionary in a list has a list `- ` prefix. Subsequent keys in the dictionary
-        # just have a tab.
+        # just have a tab. Collection elements are never the root, so such a child is always at least one level deep.
         is_first_collection_child: Final = (
             parent is not None and parent.is_collection_element() and node == parent.children[0]
         )
@@ -1081,24 +1472,24 @@ class RecipeReader(IsModifiable):
             # Edge case: Handle a list containing 1 member
             if node.children[0].list_member_flag:
                 if is_first_collection_child:
-                    lines.append(f"{TAB_AS_SPACES * (depth-1)}- {node.value}:  {node.comment}".rstrip())
+                    lines.append(f"{indents[depth - 1]}- {node.value}:{comment_suffix}")
                 else:
-                    lines.append(f"{spaces}{node.value}:  {node.comment}".rstrip())
+                    lines.append(f"{spaces}{node.value}:{comment_suffix}")
                 # Handle multiline strings that are contained within a list. This returns `True` if lines are added.
-                if not _render_multiline_lst(node.children[0]):
+                if not RecipeReader._render_multiline_lst(node.children[0], spaces, lines):
                     value_str = stringify_yaml(
                         node.children[0].value, multiline_variant=node.children[0].multiline_variant
                     )
                     lines.append(f"{spaces}{TAB_AS_SPACES}- " f"{value_str}  " f"{node.children[0].comment}".rstrip())
-                return
+                return None
 
             if is_first_collection_child:
                 lines.append(
-                    f"{TAB_AS_SPACES * (depth-1)}- {node.value}: "
+                    f"{indents[depth - 1]}- {node.value}: "
                     f"{stringify_yaml(node.children[0].value)}  "
                     f"{node.children[0].comment}".rstrip()
                 )
-                return
+                return None
 
             # Handle multiline strings. By the language spec, # symbols do not indicate comments on most multiline
             # strings.
@@ -1116,14 +1507,14 @@ class RecipeReader(IsModifiable):
                         f"{spaces}{TAB_AS_SPACES}"
                         f"{stringify_yaml(val_line, multiline_variant=multi_variant)}".rstrip()
                     )
-                return
+                return None
 
             lines.append(
                 f"{spaces}{node.value}: "
                 f"{stringify_yaml(node.children[0].value)}  "
                 f"{node.children[0].comment}".rstrip()
             )
-            return
+            return None
 
         depth_delta = 1
         # Don't render a `:` for the non-visible root node. Also don't render invisible collection nodes.
@@ -1145,51 +1536,113 @@ class RecipeReader(IsModifiable):
                 tmp_spaces = tmp_spaces[TAB_SPACE_COUNT:]
 
             # Nodes representing collections in a list have nothing to render
-            lines.append(f"{tmp_spaces}{list_prefix}{node.value}:  {node.comment}".rstrip())
+            lines.append(f"{tmp_spaces}{list_prefix}{node.value}:{comment_suffix}")
 
-        for child in node.children:
-            # Top-level empty-key edge case: Top level keys should have no additional indentation.
-            extra_tab = "" if depth < 0 else TAB_AS_SPACES
-            # Comments in a list are indented to list-level, but do not include a list `-` mark
-            if child.is_comment():
-                # Top-of-file comments are rendered at the top-level `render()` call in V0. We skip them here to prevent
-                # duplicating comments and accidentally rendering values on a comment block.
-                if schema_version == SchemaVersion.V0 and child.is_tof_comment():
-                    continue
-                lines.append(f"{spaces}{extra_tab}" f"{child.comment}".rstrip())
-            # Empty keys can be easily confused for leaf nodes. The difference is these nodes render with a "dangling"
-            # `:` mark
-            elif child.is_empty_key():
-                lines.append(f"{spaces}{extra_tab}" f"{stringify_yaml(child.value)}:  " f"{child.comment}".rstrip())
-            # Leaf nodes are rendered as members in a list
-            elif child.is_strong_leaf():
-                # Handle multiline strings that are contained within a list. This returns `True` if lines are added.
-                if not _render_multiline_lst(child):
-                    lines.append(
-                        f"{spaces}{extra_tab}- " f"{stringify_yaml(child.value)}  " f"{child.comment}".rstrip()
-                    )
-            else:
-                RecipeReader._render_tree(
-                    child, depth + depth_delta, lines, schema_version, is_cbc, omit_trailing_newline, node
-                )
+        return depth_delta
+
+    @staticmethod
+    def _render_tree(
+        node: Node,
+        depth: int,
+        lines: list[str],
+        schema_version: SchemaVersion,
+        is_cbc: bool,
+        omit_trailing_newline: bool,
+    ) -> None:
+        # pylint: disable=too-complex
+        """
+        Helper function that traverses the parse tree to generate a file. The tree is walked with an explicit stack, so
+        deeply nested recipes do not pay for (or overflow) Python's call stack.
 
+        :param node: Node to start rendering from.
+        :param depth: Depth of the starting node.
+        :param lines: Accumulated list of lines in the recipe file.
+        :param schema_version: Target recipe schema version.
+        :param is_cbc: Flag indicating if this file is being interpreted as a CBC file.
+        :param omit_trailing_newline: User-supplied flag indicating if the trailing newline should NOT be included. This
+            is a strong preference for various groups of the Conda Community.
+        """
+
+        def _render_section_break(parent: Node, parent_depth: int, child: Node) -> None:
             # Unless overridden by the `omit_trailing_newline` preference, by convention, recipes have a blank line
             # after every top-level section, unless:
             #   - They are a comment. Comments should be left where they are without additional blank lines.
             #   - The file being read-in is a CBC file. It is common practice to omit blank lines in these files, EXCEPT
             #     for a final trailing blank line at the end of the file.
-            is_last_line = depth < 0 and child == node.children[-1]
+            is_last_line = parent_depth < 0 and child == parent.children[-1]
             if is_last_line and omit_trailing_newline:
                 return
-            if (is_cbc and is_last_line) or (not is_cbc and depth < 0 and not child.is_comment()):
+            if (is_cbc and is_last_line) or (not is_cbc and parent_depth < 0 and not child.is_comment()):
                 lines.append("")
 
+        is_v0: Final = schema_version == SchemaVersion.V0
+        # Indentation strings are built once per depth and shared by every node rendered at that depth.
+        indents: Final = [TAB_AS_SPACES * d for d in range(max(depth, 0) + 1)]
+
+        depth_delta = RecipeReader._render_node(node, depth, lines, None, indents)
+        if depth_delta is None:
+            return
+
+        # Each frame tracks a node whose children are being rendered, the node's depth, the depth offset of its
+        # children, the index of the next child to render, and whether the previous child was rendered in its own frame
+        # (and, therefore, still needs to be followed by a section break).
+        stack: Final[list[tuple[Node, int, int, int, bool]]] = [(node, depth, depth_delta, 0, False)]
+        while stack:
+            cur, cur_depth, depth_delta, idx, is_resumed = stack.pop()
+            if is_resumed:
+                _render_section_break(cur, cur_depth, cur.children[idx - 1])
+
+            spaces = indents[cur_depth] if cur_depth >= 0 else ""
+            # Top-level empty-key edge case: Top level keys should have no additional indentation.
+            extra_tab = "" if cur_depth < 0 else TAB_AS_SPACES
+            while idx < len(cur.children):
+                child = cur.children[idx]
+                idx += 1
+                # Comments in a list are indented to list-level, but do not include a list `-` mark
+                if child.is_comment():
+                    # Top-of-file comments are rendered at the top-level `render()` call in V0. We skip them here to
+                    # prevent duplicating comments and accidentally rendering values on a comment block.
+                    if is_v0 and child.is_tof_comment():
+                        continue
+                    lines.append(f"{spaces}{extra_tab}" f"{child.comment}".rstrip())
+                # Empty keys can be easily confused for leaf nodes. The difference is these nodes render with a
+                # "dangling" `:` mark
+                elif child.is_empty_key():
+                    lines.append(
+                        f"{spaces}{extra_tab}{stringify_yaml(child.value)}:"
+                        f"{RecipeReader._render_comment_suffix(child.comment)}"
+                    )
+                # Leaf nodes are rendered as members in a list
+                elif child.is_strong_leaf():
+                    # Handle multiline strings that are contained within a list. This returns `True` if lines are added.
+                    if not RecipeReader._render_multiline_lst(child, spaces, lines):
+                        lines.append(
+                            f"{spaces}{extra_tab}- " f"{stringify_yaml(child.value)}  " f"{child.comment}".rstrip()
+                        )
+                else:
+                    child_depth = cur_depth + depth_delta
+                    while len(indents) <= child_depth:
+                        indents.append(indents[-1] + TAB_AS_SPACES)
+                    child_delta = RecipeReader._render_node(child, child_depth, lines, cur, indents)
+                    # Children of this node are rendered before we resume rendering the siblings of this node.
+                    if child_delta is not None:
+                        stack.append((cur, cur_depth, depth_delta, idx, True))
+                        stack.append((child, child_depth, child_delta, 0, False))
+                        break
+
+                _render_section_break(cur, cur_depth, child)
+
     def render(self, omit_trailing_newline: bool = False) -> str:
         """
         Takes the current state of the parse tree and returns the recipe file as a string.
 
         :returns: String representation of the recipe file
         """
+        # Rendering an unmodified recipe always produces the same text, so it is only done once.
+        cache_key: Final = (omit_trailing_newline, self._schema_version, self._is_cbc)
+        if not self._is_modified and cache_key in self._render_cache:
+            return self._render_cache[cache_key]
+
         lines: list[str] = []
 
         # Render variable set section for V0 recipes. V1 recipes have variables stored in the parse tree under
@@ -1214,7 +1667,10 @@ class RecipeReader(IsModifiable):
         # implied.
         RecipeReader._render_tree(self._root, -1, lines, self._schema_version, self._is_cbc, omit_trailing_newline)
 
-        return "\n".join(lines)
+        rendered: Final = "\n".join(lines)
+        if not self._is_modified:
+            self._render_cache[cache_key] = rendered
+        return rendered
 
     def _preprocess_node_value(self, node: Node, replace_variables: bool) -> JsonType:
         """
@@ -1227,6 +1683,9 @@ class RecipeReader(IsModifiable):
         """
         if isinstance(node.value, SentinelType):
             raise SentinelTypeEvaluationException(node)
+        # Most values are single-line and are returned as-is when no substitutions are requested.
+        if not replace_variables and node.multiline_variant == MultilineVariant.NONE:
+            return cast(JsonType, node.value)
         value: Final = normalize_multiline_strings(node.value, node.multiline_variant)
         if isinstance(value, str):
             if replace_variables:
@@ -1240,66 +1699,71 @@ class RecipeReader(IsModifiable):
         # pylint: disable=too-complex
         # TODO Refactor and simplify ^
         """
-        Recursive helper function that traverses the parse tree to generate a Pythonic data object.
+        Helper function that traverses the parse tree to generate a Pythonic data object.
 
         :param node: Current node in the tree
         :param replace_variables: If set to True, this replaces all variable substitutions with their set values.
         :param data: Accumulated data structure
         :raises SentinelTypeEvaluationException: If a node value with a sentinel type is evaluated.
         """
+        # Each entry pairs a node with the data structure it renders into, along with that structure's type. The type is
+        # determined once per structure, instead of once per node rendered into it. Children are pushed in reverse so
+        # that nodes are visited in the same order as a depth-first recursive traversal. Collections are attached to
+        # their parent before their children are rendered into them.
+        stack: Final = [(node, data, type(data))]
+        while stack:
+            cur, cur_data, cur_data_type = stack.pop()
 
-        # Ignore comment-only nodes
-        if node.is_comment():
-            return
-
-        # Handle terminal nodes
-        if node.is_empty_key():
-            if isinstance(data, list):
-                data.append({node.value: None})
-            elif isinstance(data, dict):
-                data[node.value] = None
-            return
+            # Ignore comment-only nodes
+            if cur.is_comment():
+                continue
 
-        if node.is_single_key():
-            child_value = self._preprocess_node_value(node.children[0], replace_variables)
-            if node.children[0].list_member_flag:
-                child_value = [child_value]
-            if isinstance(data, list):
-                data.append({node.value: child_value})
-            elif isinstance(data, dict):
-                data[node.value] = child_value
-            return
+            # With comments ruled out, a node without children is a leaf.
+            children = cur.children
+            if not children:
+                # Handle terminal nodes
+                if cur.key_flag:
+                    if cur_data_type is list:
+                        cur_data.append({cur.value: None})
+                    elif cur_data_type is dict:
+                        cur_data[cur.value] = None
+                else:
+                    # At this point, we know the data is a list
+                    cur_data.append(self._preprocess_node_value(cur, replace_variables))
+                continue
 
-        if node.is_strong_leaf():
-            # At this point, we know the data is a list
-            data.append(self._preprocess_node_value(node, replace_variables))
-            return
+            if cur.is_single_key():
+                child_value = self._preprocess_node_value(children[0], replace_variables)
+                if children[0].list_member_flag:
+                    child_value = [child_value]
+                if cur_data_type is list:
+                    cur_data.append({cur.value: child_value})
+                elif cur_data_type is dict:
+                    cur_data[cur.value] = child_value
+                continue
 
-        # Process collection nodes (lists or dicts that are list members)
-        if node.is_collection_element():
-            if node.contains_list():
-                elem_json = []
+            # Process collection nodes (lists or dicts that are list members)
+            if cur.is_collection_element():
+                elem_json = [] if cur.contains_list() else {}
+                cur_data.append(elem_json)
+            # List nodes (lists that are not list members)
+            elif cur.contains_list():
+                elem_json = cur_data.setdefault(cur.value, [])
+            # What should remain is dicts that are not list members
             else:
-                elem_json = {}
-            for element in node.children:
-                self._render_object_tree(element, replace_variables, elem_json)
-            data.append(elem_json)
-            return
-
-        # List nodes (lists that are not list members)
-        if node.contains_list():
-            key = node.value
-            data.setdefault(key, [])
-            for element in node.children:
-                self._render_object_tree(element, replace_variables, data[key])
-            return
-
-        # What should remain is dicts that are not list members
-        key = node.value
-        data.setdefault(key, {})
-        for element in node.children:
-            self._render_object_tree(element, replace_variables, data[key])
-        return
+                elem_json = cur_data.setdefault(cur.value, {})
+
+            elem_json_type = type(elem_json)
+            # Fast path: Lists of plain values (like most dependency lists) are rendered in a single pass, instead of
+            # pushing every member onto the stack.
+            if elem_json_type is list and all(not child.children and not child.key_flag for child in children):
+                elem_json.extend(
+                    self._preprocess_node_value(child, replace_variables)
+                    for child in children
+                    if not child.is_comment()
+                )
+                continue
+            stack.extend((child, elem_json, elem_json_type) for child in reversed(children))
 
     def _render_to_object(self, replace_variables: bool = False, root_node: Optional[Node] = None) -> JsonType:
         """
@@ -1357,11 +1821,11 @@ class RecipeReader(IsModifiable):
         """
         lst: list[str] = []
 
-        def _find_paths(node: Node, path_stack: StrStack) -> None:
+        def _find_paths(node: Node, path: str) -> None:
             if node.is_leaf():
-                lst.append(stack_path_to_str(path_stack))
+                lst.append(path)
 
-        traverse_all(self._root, _find_paths)
+        traverse_all_str_paths(self._root, _find_paths)
         return lst
 
     def contains_value(self, path: str) -> bool:
@@ -1372,8 +1836,7 @@ class RecipeReader(IsModifiable):
         :param path: JSON patch (RFC 6902)-style path to a value.
         :returns: True if the path exists. False otherwise.
         """
-        path_stack = str_to_stack_path(path)
-        return traverse(self._root, path_stack) is not None
+        return self._traverse_cached(path) is not None
 
     def get_value(self, path: str, default: JsonType | SentinelType = _sentinel, sub_vars: bool = False) -> JsonType:
         """
@@ -1387,8 +1850,7 @@ class RecipeReader(IsModifiable):
         :raises SentinelTypeEvaluationException: If a node value with a sentinel type is evaluated.
         :returns: If found, the value in the recipe at that path. Otherwise, the caller-specified default value.
         """
-        path_stack = str_to_stack_path(path)
-        node = traverse(self._root, path_stack)
+        node = self._traverse_cached(path)
 
         # Handle if the path was not found or is an empty key
         if node is None:
@@ -1413,7 +1875,7 @@ class RecipeReader(IsModifiable):
 
         paths: list[str] = []
 
-        def _find_value_paths(node: Node, path_stack: StrStack) -> None:
+        def _find_value_paths(node: Node, path: str) -> None:
             # Special cases:
             #   - Empty keys imply a null value, although they don't contain a null child.
             #   - Types are checked so bools aren't simplified to "truthiness" evaluations.
@@ -1422,9 +1884,9 @@ class RecipeReader(IsModifiable):
                 and type(node.value) == type(value)  # pylint: disable=unidiomatic-typecheck
                 and node.value == value
             ):
-                paths.append(stack_path_to_str(path_stack))
+                paths.append(path)
 
-        traverse_all(self._root, _find_value_paths)
+        traverse_all_str_paths(self._root, _find_value_paths)
 
         return paths
 
@@ -1485,12 +1947,14 @@ class RecipeReader(IsModifiable):
                 # a type issue. We do not check which schema the current recipe for the sake of the recipe converter,
                 # which uses this function in the upgrade process.
                 # TODO Improve V1 selector check (when more utilities are built). Checking for
-                if not isinstance(dep, str):
+                # Parsing a dependency is expensive. A dependency named `python` must contain that name, so most
+                # dependencies can be rejected with a substring check.
+                if not isinstance(dep, str) or "python" not in dep.lower():
                     continue
                 if "python" == cast(str, dependency_data_from_str(dep).name).lower():
                     # The V0 selector check is more costly and it can be delayed until we've determined we have found
                     # a python host dependency.
-                    if self.contains_selector_at_path(RecipeReader.append_to_path(host_path, f"/{i}")):
+                    if self.contains_selector_at_path(f"{host_path}/{i}"):
                         continue
                     return True
         return False
@@ -1523,13 +1987,19 @@ class RecipeReader(IsModifiable):
 
         :raises SentinelTypeEvaluationException: If a node value with a sentinel type is evaluated.
         """
+        # The paths are computed once per tree structure, as many queries start by listing the package paths. A copy is
+        # returned so that callers can't modify the memoized list.
+        if self._package_paths_cache is not None:
+            return list(self._package_paths_cache)
+
         paths: list[str] = ["/"]
 
         outputs: Final[list[str]] = cast(list[str], self.get_value("/outputs", []))
         for i in range(len(outputs)):
             paths.append(f"/outputs/{i}")
 
-        return paths
+        self._package_paths_cache = paths
+        return list(paths)
 
     @staticmethod
     def append_to_path(base_path: str, ext_path: str) -> str:
@@ -1542,15 +2012,32 @@ class RecipeReader(IsModifiable):
         :param ext_path: Path to append to the end of the `base_path`
         :returns: A normalized path constructed by the two provided paths.
         """
-        # Ensure the base path always ends in a `/`
-        if not base_path:
-            base_path = "/"
-        if base_path[-1] != "/":
-            base_path += "/"
         # Ensure the extended path never starts with a `/`
-        if ext_path and ext_path[0] == "/":
+        if ext_path.startswith("/"):
             ext_path = ext_path[1:]
-        return f"{base_path}{ext_path}"
+        # Ensure the base path always ends in a `/`. This also handles an empty base path, which represents the root.
+        if base_path.endswith("/"):
+            return base_path + ext_path
+        return f"{base_path}/{ext_path}"
+
+    @staticmethod
+    @lru_cache(maxsize=len(SchemaVersion))  # type: ignore[misc]
+    def _get_requirements_section_suffixes(schema_version: SchemaVersion) -> tuple[str, ...]:
+        """
+        Returns the path suffixes of the dependency sections under `/requirements`, which only vary by schema.
+
+        :param schema_version: Schema version of the recipe.
+        :returns: Path suffixes, relative to the package path, of the dependency sections.
+        """
+        return tuple(
+            f"/requirements/{dependency_section_to_str(section, schema_version)}"
+            for section in (
+                DependencySection.BUILD,
+                DependencySection.HOST,
+                DependencySection.RUN,
+                DependencySection.RUN_CONSTRAINTS,
+            )
+        )
 
     def get_dependency_paths(self) -> list[str]:
         """
@@ -1560,17 +2047,12 @@ class RecipeReader(IsModifiable):
         :returns: A list of all paths in a recipe file that point to dependencies.
         """
         paths: list[str] = []
-        req_sections: Final[list[str]] = [
-            dependency_section_to_str(DependencySection.BUILD, self._schema_version),
-            dependency_section_to_str(DependencySection.HOST, self._schema_version),
-            dependency_section_to_str(DependencySection.RUN, self._schema_version),
-            dependency_section_to_str(DependencySection.RUN_CONSTRAINTS, self._schema_version),
-        ]
+        req_section_suffixes: Final = RecipeReader._get_requirements_section_suffixes(self._schema_version)
 
         # Convenience function that reduces repeated logic between regular and multi-output recipes
         def _scan_requirements(path_prefix: str = "") -> None:
-            for section in req_sections:
-                section_path = f"{path_prefix}/requirements/{section}"
+            for suffix in req_section_suffixes:
+                section_path = path_prefix + suffix
                 # Relying on `get_value()` ensures that we will only examine literal values and ignore comments
                 # in-between dependencies.
                 value = self.get_value(section_path, [])
@@ -1637,24 +2119,15 @@ class RecipeReader(IsModifiable):
             return []
 
         path_list: list[str] = []
+        var_re: Final = RecipeReader._compile_var_reference_re(self._schema_version, var)
 
-        # The regular expression between the braces is very forgiving to match JINJA expressions like
-        # `{{ name | lower }}`
-        def _init_re() -> re.Pattern[str]:
-            match self._schema_version:
-                case SchemaVersion.V0:
-                    return re.compile(r"{{.*" + var + r".*}}")
-                case SchemaVersion.V1:
-                    return re.compile(r"\${{.*" + var + r".*}}")
-
-        var_re: Final[re.Pattern[str]] = _init_re()
+        def _collect_var_refs(node: Node, path: str) -> None:
+            # Variables can only be found inside string values. Most strings don't mention the variable at all, which is
+            # determined much faster with a substring check than with a regular expression search.
+            if isinstance(node.value, str) and var in node.value and var_re.search(node.value):
+                path_list.append(path)
 
-        def _collect_var_refs(node: Node, path: StrStack) -> None:
-            # Variables can only be found inside string values.
-            if isinstance(node.value, str) and var_re.search(node.value):
-                path_list.append(stack_path_to_str(path))
-
-        traverse_all(self._root, _collect_var_refs)
+        traverse_all_str_paths(self._root, _collect_var_refs)
         return dedupe_and_preserve_order(path_list)
 
     ## Selector Functions ##
@@ -1753,7 +2226,7 @@ class RecipeReader(IsModifiable):
         """
         comments_tbl: dict[str, str] = {}
 
-        def _track_comments(node: Node, path_stack: StrStack) -> None:
+        def _track_comments(node: Node, path: str) -> None:
             if node.is_comment() or node.comment == "":
                 return
             comment = node.comment
@@ -1769,12 +2242,28 @@ class RecipeReader(IsModifiable):
                 if comment[0] != "#":
                     comment = f"# {comment}"
 
-            path = stack_path_to_str(path_stack)
             comments_tbl[path] = comment
 
-        traverse_all(self._root, _track_comments)
+        traverse_all_str_paths(self._root, _track_comments)
         return comments_tbl
 
+    def get_dropped_comments(self, old_comments: dict[str, str]) -> dict[str, str]:
+        """
+        Given a comments table from an earlier state of this recipe, determines which comments no longer have a
+        location in the current recipe. This is cheaper than building and diffing a second comments table, as only the
+        previously recorded paths need to be checked.
+
+        :param old_comments: Comments table, as produced by `get_comments_table()`, from an earlier recipe state.
+        :returns: Dictionary of paths that no longer exist mapped to the comment that was found at that path.
+        """
+        # Comments on root-level scalars are recorded under the empty path, which refers to the root. The root always
+        # exists, and only rooted paths can be looked up.
+        return {
+            path: comment
+            for path, comment in old_comments.items()
+            if path.startswith(ROOT_NODE_VALUE) and not self.contains_value(path)
+        }
+
     def search(self, regex: str | re.Pattern[str], include_comment: bool = False) -> list[str]:
         """
         Given a regex string, return the list of paths that match the regex.
@@ -1789,14 +2278,17 @@ class RecipeReader(IsModifiable):
         re_obj = re.compile(regex)
         paths: list[str] = []
 
-        def _search_paths(node: Node, path_stack: StrStack) -> None:
+        def _search_paths(node: Node, path: str) -> None:
+            # Only leaf values are searched, so other nodes are rejected before their values are converted.
+            if not node.is_strong_leaf():
+                return
             value = str(stringify_yaml(node.value))
             if include_comment and node.comment:
                 value = f"{value}{TAB_AS_SPACES}{node.comment}"
-            if node.is_strong_leaf() and re_obj.search(value):
-                paths.append(stack_path_to_str(path_stack))
+            if re_obj.search(value):
+                paths.append(path)
 
-        traverse_all(self._root, _search_paths)
+        traverse_all_str_paths(self._root, _search_paths)
 
         return paths
 
@@ -122,13 +122,15 @@ class RecipeReaderDeps(RecipeReader):
             if section is None or deps is None:
                 continue
 
+            # NOTE: `get_dependency_paths()` uses the same approach for calculating dependency paths. The section path
+            #       is normalized once, so each dependency path only needs the index appended.
+            section_path = RecipeReader.append_to_path(path, f"/requirements/{section_str}")
             for i, dep in enumerate(deps):
                 dep = RecipeReaderDeps._sanitize_dep(dep)
                 if dep is None:
                     continue
 
-                # NOTE: `get_dependency_paths()` uses the same approach for calculating dependency paths.
-                dep_path = RecipeReader.append_to_path(path, f"/requirements/{section_str}/{i}")
+                dep_path = f"{section_path}/{i}"
                 dep_map[package].append(
                     Dependency(
                         required_by=package,
@@ -150,12 +152,13 @@ class RecipeReaderDeps(RecipeReader):
         :param path: The path to the test requirements section.
         :param package: The package to add the dependencies to.
         """
+        # TODO add V1 support, the test section is different.
+        test_requires_path: Final = RecipeReader.append_to_path(path, "/test/requires")
         for i, dep in enumerate(test_requirements):
             dep = RecipeReaderDeps._sanitize_dep(dep)
             if dep is None:
                 continue
-            # TODO add V1 support, the test section is different.
-            dep_path = RecipeReader.append_to_path(path, f"/test/requires/{i}")
+            dep_path = f"{test_requires_path}/{i}"
             dep_map[package].append(
                 Dependency(
                     required_by=package,
@@ -10,7 +10,7 @@ This class is intended to be used in the context of the VariantsManager class.
 
 from __future__ import annotations
 
-from typing import Final, cast
+from typing import Final, Optional, cast
 
 from conda_recipe_manager.parser._node import Node
 from conda_recipe_manager.parser.build_context import BuildContext
@@ -26,6 +26,21 @@ class RecipeVariant(RecipeReaderDeps):
     Class that represents a recipe variant, filtered by selectors and evaluated for Jinja expressions.
     """
 
+    def _does_selector_apply(self, selector: str, build_context: BuildContext, selector_cache: dict[str, bool]) -> bool:
+        """
+        Determines if a selector applies to the build context, memoizing the result in the provided cache.
+
+        :param selector: Selector string to evaluate.
+        :param build_context: Build context to evaluate the selector against.
+        :param selector_cache: Previously evaluated selectors, keyed by selector string.
+        :returns: True if the selector applies to the build context. False otherwise.
+        """
+        applies = selector_cache.get(selector)
+        if applies is None:
+            applies = SelectorParser(selector, self.get_schema_version()).does_selector_apply(build_context)
+            selector_cache[selector] = applies
+        return applies
+
     def _filter_by_selectors(self, build_context: BuildContext) -> None:
         """
         Filters the recipe by the selectors in the build context.
@@ -34,19 +49,26 @@ class RecipeVariant(RecipeReaderDeps):
 
         :param build_context: Build context to filter the recipe by.
         """
+        # Many nodes share the same selector (e.g. `[unix]`), so each distinct selector string is only evaluated once.
+        selector_cache: Final[dict[str, bool]] = {}
+
         # Remove all jinja variables that do not apply to the build context
         for variable, values in self._vars_tbl.items():
             new_values = []
             for val in values:
-                if not val.contains_selector() or cast(SelectorParser, val.get_selector()).does_selector_apply(
-                    build_context
+                if not val.contains_selector() or self._does_selector_apply(
+                    cast(SelectorParser, val.get_selector()).render(), build_context, selector_cache
                 ):
                     new_values.append(val)
             self._vars_tbl[variable] = new_values
         self._vars_tbl = {k: v for k, v in self._vars_tbl.items() if len(v) > 0}
+        self._invalidate_vars_context()
 
-        def _filter_selectors_and_paths(node: Node) -> None:
-            # Filters selectors and paths in the node's children.
+        # Filter selectors and paths with an explicit stack, instead of recursion, to handle deeply nested recipes.
+        # Children are pushed in reverse, so they are visited in order.
+        stack: Final[list[Node]] = [self._root]
+        while stack:
+            node = stack.pop()
             new_children = []
             for child in node.children:
                 if child.is_comment():
@@ -55,17 +77,14 @@ class RecipeVariant(RecipeReaderDeps):
                 child_selector = SelectorParser._v0_extract_selector(child.comment)  # pylint: disable=protected-access
                 if not child_selector:
                     new_children.append(child)
-                elif SelectorParser(child_selector, self.get_schema_version()).does_selector_apply(build_context):
+                elif self._does_selector_apply(child_selector, build_context, selector_cache):
                     child.comment, _ = RecipeParser._remove_selector_from_comment(  # pylint: disable=protected-access
                         child.comment
                     )
                     new_children.append(child)
-                else:
-                    continue
-                _filter_selectors_and_paths(child)
             node.children = new_children
-
-        _filter_selectors_and_paths(self._root)
+            stack.extend(reversed(new_children))
+        self._invalidate_caches()
 
         self._rebuild_selectors()
         self._is_modified = True
@@ -79,24 +98,29 @@ class RecipeVariant(RecipeReaderDeps):
         :param build_context: Build context to evaluate the Jinja expressions for.
         :raises ValueError: If the JINJA expression evaluation result is not a primitive type.
         """
-        recipe_vars_context: Final[dict[str, JsonType]] = {k: self.get_variable(k) for k in self._vars_tbl}
-        context: Final = {**build_context.get_context(), **recipe_vars_context}
+        # Evaluating the recipe variables can be costly, so the context is only built once a node needs it.
+        context: Optional[dict[str, JsonType]] = None
         _, sub_regex = self._set_on_schema_version()
 
-        def _evaluate_jinja_expression_in_node(node: Node) -> None:
-            # Evaluates JINJA expression in the node value if applicable.
-            if isinstance(node.value, str) and sub_regex.search(node.value):
+        # Evaluate JINJA expressions in node values, visiting nodes in order with an explicit stack.
+        stack: Final[list[Node]] = [self._root]
+        while stack:
+            node = stack.pop()
+            # Both the V0 and V1 substitution patterns require double braces, so most values can skip the regex search.
+            if isinstance(node.value, str) and "{{" in node.value and sub_regex.search(node.value):
+                if context is None:
+                    context = {**build_context.get_context(), **self._get_vars_context()}
                 rendered_value = self._render_jinja_vars(node.value, context)
                 if not isinstance(rendered_value, PRIMITIVES_NO_NONE_TUPLE):
                     raise ValueError(
                         f"JINJA expression evaluation result is not a primitive type: {type(rendered_value)}"
                     )
                 node.value = rendered_value
-            for child in node.children:
-                _evaluate_jinja_expression_in_node(child)
-
-        _evaluate_jinja_expression_in_node(self._root)
+            stack.extend(reversed(node.children))
+        # Keys may have been re-written by the evaluation.
+        self._invalidate_caches()
         self._vars_tbl.clear()
+        self._invalidate_vars_context()
         self._is_modified = True
 
     def __init__(
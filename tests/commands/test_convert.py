@@ -2,6 +2,7 @@
 :Description: Tests the `convert` CLI
 """
 
+from pathlib import Path
 from typing import Final
 
 from click.testing import CliRunner
@@ -56,3 +57,34 @@ def test_convert_fail_on_unsupported_jinja() -> None:
     # Don't fail without flag.
     result_success: Final = runner.invoke(convert, [str(get_test_path() / "jinja2_statements/pdfium-binaries.yaml")])
     assert result_success.exit_code == ExitCode.RENDER_WARNINGS
+
+
+def test_convert_unparsable_working_copy() -> None:
+    """
+    Ensures that a recipe that can be parsed, but whose rendered text can not be re-parsed for the conversion, is
+    reported as a parsing failure.
+    """
+    runner: Final = CliRunner()
+    result: Final = runner.invoke(convert, [str(get_test_path() / "cbc_files/zero_indent_list_of_objects_cbc.yaml")])
+    assert result.exit_code == ExitCode.PARSE_EXCEPTION
+
+
+def test_convert_single_file_with_cache(tmp_path: Path) -> None:
+    """
+    Ensures that cached conversion results are identical to the results of a full conversion.
+
+    :param tmp_path: Temporary directory to store the cache in
+    """
+    runner: Final = CliRunner()
+    recipe_path: Final = str(get_test_path() / "simple-recipe.yaml")
+    expected: Final = load_file("v1_format/v1_simple-recipe.yaml") + "\n"
+
+    result_miss: Final = runner.invoke(convert, [recipe_path, "--cache-dir", str(tmp_path)])
+    assert result_miss.exit_code == ExitCode.RENDER_WARNINGS
+    assert result_miss.stdout == expected
+    assert len(list(tmp_path.iterdir())) == 1
+
+    result_hit: Final = runner.invoke(convert, [recipe_path, "--cache-dir", str(tmp_path)], catch_exceptions=False)
+    assert result_hit.exit_code == ExitCode.RENDER_WARNINGS
+    assert result_hit.stdout == expected
+    assert result_hit.stderr == result_miss.stderr
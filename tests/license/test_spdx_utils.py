@@ -4,6 +4,10 @@
 
 from __future__ import annotations
 
+import difflib
+from typing import Final
+from unittest.mock import patch
+
 import pytest
 
 from conda_recipe_manager.licenses.spdx_utils import SpdxUtils
@@ -73,3 +77,40 @@ def test_find_closest_license_match_failed_to_find_match(license_field: str) ->
     # TODO fixture
     spdx_utils = SpdxUtils()
     assert spdx_utils.find_closest_license_match(license_field) is None
+
+
+@pytest.mark.parametrize(
+    "license_field",
+    [
+        "",
+        "MIT",
+        "Apache",
+        "Public Domain",
+        "BSD-like",
+        "MIT/X11",
+        "GNU General Public License v3",
+        "Mozila Public Licence 2",
+        "robin",
+    ],
+)
+def test_get_closest_matching_key_matches_difflib(license_field: str) -> None:
+    """
+    Validates that the pruned approximate-match search produces the same results as `difflib.get_close_matches()`
+    """
+    # TODO fixture
+    spdx_utils = SpdxUtils()
+    # pylint: disable=protected-access
+    expected: Final = difflib.get_close_matches(license_field, spdx_utils._license_matching_table.keys(), 1)
+    assert spdx_utils._get_closest_matching_key(license_field) == (expected[0] if expected else None)
+
+
+def test_find_closest_license_match_is_memoized() -> None:
+    """
+    Validates that repeated license look-ups do not repeat the approximate-match search
+    """
+    spdx_utils = SpdxUtils()
+    # pylint: disable=protected-access
+    with patch.object(spdx_utils, "_get_closest_matching_key", wraps=spdx_utils._get_closest_matching_key) as mock:
+        assert spdx_utils.find_closest_license_match("Apache Licence 2.0") == "Apache-2.0"
+        assert spdx_utils.find_closest_license_match("Apache Licence 2.0") == "Apache-2.0"
+        assert mock.call_count == 1
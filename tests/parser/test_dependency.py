@@ -14,6 +14,7 @@ from conda_recipe_manager.parser.dependency import (
     dependency_data_from_str,
     dependency_data_render_as_str,
     dependency_section_to_str,
+    match_spec_from_str,
     str_to_dependency_section,
 )
 from conda_recipe_manager.parser.types import SchemaVersion
@@ -99,6 +100,16 @@ def test_dependency_data_from_str(s: str, expected: DependencyData) -> None:
     assert dependency_data_from_str(s) == expected  # type: ignore[misc]
 
 
+def test_match_spec_from_str_is_memoized() -> None:
+    """
+    Ensures that repeated dependency strings share a single `MatchSpec` instance.
+    """
+    spec = match_spec_from_str("openssl >=4.2.1")
+    assert spec == MatchSpec("openssl >=4.2.1")  # type: ignore[misc]
+    assert match_spec_from_str("openssl >=4.2.1") is spec
+    assert dependency_data_from_str("openssl >=4.2.1") is spec
+
+
 @pytest.mark.parametrize(
     "d,expected",
     [
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from typing import Final
+
 import pytest
 
 from conda_recipe_manager.parser._message_table import MessageCategory, MessageTable
@@ -152,3 +154,24 @@ def test_message_table_clear(
     message_table.clear_messages()
     assert message_table.get_totals_message() == ""
     assert message_table.get_message_count(category) == 0
+
+
+def test_message_table_deferred_formatting() -> None:
+    """
+    Tests that messages provided with arguments are formatted when they are read, and that messages without arguments
+    are stored verbatim.
+    """
+    message_table = MessageTable()
+    message_table.add_message(MessageCategory.WARNING, "Field at `%s` is no longer supported.", "/build/features")
+    message_table.add_message(MessageCategory.WARNING, "100% verbatim")
+    message_table.add_message(MessageCategory.WARNING, "%s of %d", "1", 2)
+
+    assert message_table.get_message_count(MessageCategory.WARNING) == 3
+    expected: Final[list[str]] = [
+        "Field at `/build/features` is no longer supported.",
+        "100% verbatim",
+        "1 of 2",
+    ]
+    assert message_table.get_messages(MessageCategory.WARNING) == expected
+    # Reading the messages again yields the same results.
+    assert message_table.get_messages(MessageCategory.WARNING) == expected
@@ -12,8 +12,11 @@ from conda_recipe_manager.parser.platform_types import (
     Platform,
     PlatformAlias,
     get_platforms_by_alias,
+    get_platforms_by_alias_canon,
     get_platforms_by_arch,
+    get_platforms_by_arch_canon,
     get_platforms_by_os,
+    get_platforms_by_os_canon,
 )
 
 
@@ -112,3 +115,72 @@ def test_get_platforms_by_alias(alias: PlatformAlias | str, expected: set[Platfo
     :param expected: Expected value to return
     """
     assert get_platforms_by_alias(alias) == expected
+
+
+def test_get_platforms_by_are_memoized() -> None:
+    """
+    Ensures that repeated platform look-ups return the same immutable set instance.
+    """
+    assert get_platforms_by_arch(Arch.X_86) is get_platforms_by_arch(Arch.X_86)
+    assert get_platforms_by_os(OperatingSystem.UNIX) is get_platforms_by_os(OperatingSystem.UNIX)
+    assert get_platforms_by_alias(PlatformAlias.WIN_64) is get_platforms_by_alias(PlatformAlias.WIN_64)
+    assert isinstance(get_platforms_by_arch("fake_arch"), frozenset)
+
+
+@pytest.mark.parametrize(
+    "qualifier,expected",
+    [
+        ("x86_64", {Platform.LINUX_64, Platform.OSX_64, Platform.WIN_64}),
+        (Arch.AARCH_64, {Platform.LINUX_AARCH_64}),
+        # Canonical variants do not normalize their input
+        (" x86_64", set()),
+        ("X86_64", set()),
+        ("fake_arch", set()),
+    ],
+)
+def test_get_platforms_by_arch_canon(qualifier: Arch | str, expected: set[Platform]) -> None:
+    """
+    Ensures the canonical architecture look-up trusts (and does not normalize) its input.
+
+    :param qualifier: Target Architecture
+    :param expected: Expected value to return
+    """
+    assert get_platforms_by_arch_canon(qualifier) == expected
+
+
+@pytest.mark.parametrize(
+    "qualifier,expected",
+    [
+        ("osx", {Platform.OSX_64, Platform.OSX_ARM_64}),
+        (OperatingSystem.WINDOWS, {Platform.WIN_32, Platform.WIN_64, Platform.WIN_ARM_64}),
+        ("OSX", set()),
+        ("fake_os", set()),
+    ],
+)
+def test_get_platforms_by_os_canon(qualifier: OperatingSystem | str, expected: set[Platform]) -> None:
+    """
+    Ensures the canonical OS look-up trusts (and does not normalize) its input.
+
+    :param qualifier: Target Operating System
+    :param expected: Expected value to return
+    """
+    assert get_platforms_by_os_canon(qualifier) == expected
+
+
+@pytest.mark.parametrize(
+    "qualifier,expected",
+    [
+        ("win64", {Platform.WIN_64}),
+        (PlatformAlias.LINUX_32, {Platform.LINUX_32}),
+        ("Win64 ", set()),
+        ("fake_alias", set()),
+    ],
+)
+def test_get_platforms_by_alias_canon(qualifier: PlatformAlias | str, expected: set[Platform]) -> None:
+    """
+    Ensures the canonical platform alias look-up trusts (and does not normalize) its input.
+
+    :param qualifier: Target Platform Alias
+    :param expected: Expected value to return
+    """
+    assert get_platforms_by_alias_canon(qualifier) == expected
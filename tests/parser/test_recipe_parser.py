@@ -6,7 +6,7 @@ from __future__ import annotations
 
 import re
 from collections.abc import Callable
-from typing import cast
+from typing import Final, cast
 
 import pytest
 
@@ -82,6 +82,30 @@ def test_del_variable(file: str) -> None:
         parser.get_variable("name")
 
 
+def test_variable_edits_update_substitutions() -> None:
+    """
+    Ensures that variable substitutions reflect edits made to the variables table after a substitution has been made.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert parser.get_value("/package/name", sub_vars=True) == "types-toml"
+    parser.set_variable("name", "FooBar")
+    assert parser.get_value("/package/name", sub_vars=True) == "foobar"
+    parser.del_variable("name")
+    assert parser.get_value("/package/name", sub_vars=True) == "{{ name|lower }}"
+
+
+def test_set_variable_with_multiple_definitions() -> None:
+    """
+    Ensures that replacing a variable with multiple (concatenated) definitions is reflected in later evaluations.
+    """
+    parser = load_recipe("parser_regressions/issue-407_duplicate_jinja_vars_input_streamlit.yaml", RecipeParser)
+    tests_to_skip: Final = parser.get_variable("tests_to_skip")
+    assert isinstance(tests_to_skip, str)
+    assert tests_to_skip.startswith("test_run_warning_absence or test_user_login")
+    parser.set_variable("tests_to_skip", "test_foo")
+    assert parser.get_variable("tests_to_skip") == "test_foo"
+
+
 ## Selectors ##
 
 
@@ -885,6 +909,128 @@ def test_patch_remove() -> None:
     assert parser.render() == load_file("simple-recipe_test_patch_remove.yaml")
 
 
+def test_patch_invalidates_path_look_ups() -> None:
+    """
+    Ensures that memoized path look-ups reflect the state of the recipe after patch operations.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    # Populate the cache with hits and misses.
+    assert parser.get_value("/multi_level/list_2/0") == "cat"
+    assert parser.get_value("/multi_level/list_2/2") == "mat"
+    assert not parser.contains_value("/multi_level/list_4")
+    assert not parser.contains_value("/multi_level/list_4/0")
+
+    # Removing a list member shifts the indices of its siblings.
+    assert parser.patch({"op": "remove", "path": "/multi_level/list_2/0"})
+    assert parser.get_value("/multi_level/list_2/0") == "bat"
+    assert not parser.contains_value("/multi_level/list_2/2")
+
+    # Adding a subtree should make previously missing descendants available.
+    assert parser.patch({"op": "add", "path": "/multi_level/list_4", "value": ["dog"]})
+    assert parser.get_value("/multi_level/list_4/0") == "dog"
+
+    # Moves affect both the source and destination paths.
+    assert parser.patch({"op": "move", "from": "/multi_level/list_4", "path": "/about/list_4"})
+    assert not parser.contains_value("/multi_level/list_4/0")
+    assert parser.get_value("/about/list_4/0") == "dog"
+
+    # Removing an ancestor should remove all descendants.
+    assert parser.patch({"op": "remove", "path": "/multi_level"})
+    assert not parser.contains_value("/multi_level/list_2/0")
+
+
+def test_patch_add_to_scalar_list_member_invalidates_path_look_ups() -> None:
+    """
+    Ensures that adding a key to a scalar list member (which inserts new members into the list) evicts memoized
+    look-ups of the other list members.
+    """
+    parser = RecipeParser("requirements:\n  host:\n    - setuptools\n    - wheel\n    - pip\n")
+    # Populate the cache with hits and misses.
+    assert [parser.contains_value(f"/requirements/host/{i}") for i in range(4)] == [True, True, True, False]
+    assert parser.patch({"op": "add", "path": "/requirements/host/0/k", "value": ["q", "r"]})
+    assert parser.get_value("/requirements/host/1") == "setuptools"
+    assert parser.get_value("/requirements/host/3") == "pip"
+
+
+def test_get_package_paths_reflects_modifications() -> None:
+    """
+    Ensures that memoized package paths are protected from callers and reflect the state of the recipe after patch
+    operations.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    paths = parser.get_package_paths()
+    assert paths == ["/"]
+    paths.append("/outputs/0")
+    assert parser.get_package_paths() == ["/"]
+    assert parser.patch({"op": "add", "path": "/outputs", "value": [{"name": "foo"}, {"name": "bar"}]})
+    assert parser.get_package_paths() == ["/", "/outputs/0", "/outputs/1"]
+    assert parser.patch({"op": "remove", "path": "/outputs/1"})
+    assert parser.get_package_paths() == ["/", "/outputs/0"]
+
+
+def test_render_reflects_modifications() -> None:
+    """
+    Ensures that memoized renders of an unmodified recipe are not returned once the recipe has been modified.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    rendered: Final = parser.render()
+    assert parser.render() is rendered
+    assert parser.render(omit_trailing_newline=True) == rendered.rstrip("\n")
+    assert parser.patch({"op": "replace", "path": "/build/number", "value": 42})
+    assert parser.render() != rendered
+    assert "number: 42" in parser.render()
+
+
+def test_render_reflects_failed_move() -> None:
+    """
+    Ensures that memoized renders are evicted when a `move` operation fails after the source has been removed.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert "number: 0" in parser.render()
+    assert not parser.patch({"op": "move", "from": "/build/number", "path": "/build/number/mv"})
+    assert not parser.contains_value("/build/number")
+    assert "number:" not in parser.render()
+
+
+# Functions that edit a recipe in-place, without a full re-parse.
+_IN_PLACE_EDITS: Final[list[Callable[[RecipeParser], object]]] = [
+    # pylint: disable=protected-access
+    lambda parser: parser._wrap_in_key("/about", "wrapped"),
+    lambda parser: parser._replace_scalar("/build/number", "42"),
+    lambda parser: parser._remove_children("/build", ["skip"]),
+    lambda parser: parser._sort_subtree_keys("/", {"test_var_usage": 0}),
+    lambda parser: parser._sort_subtree_keys("/build", {}, rename="built"),
+    lambda parser: parser.search_and_mutate(r"^setuptools$", lambda s: "wheel"),
+    lambda parser: parser.patch({"op": "remove", "path": "/multi_level/list_2/1"}),
+    lambda parser: parser.add_selector("/build/number", "[win]"),
+    lambda parser: parser.remove_selector("/build/skip"),
+    lambda parser: parser.add_comment("/build/number", "# new comment"),
+    lambda parser: parser.set_variable("name", "foobar"),
+    lambda parser: parser.del_variable("name"),
+    # pylint: enable=protected-access
+]
+
+
+@pytest.mark.parametrize("mutate", _IN_PLACE_EDITS)
+def test_render_reflects_in_place_edits(mutate: Callable[[RecipeParser], object]) -> None:
+    """
+    Ensures that every function that edits the recipe in-place evicts memoized renders, even if the recipe is not
+    flagged as modified.
+
+    :param mutate: Callback that edits the recipe.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    rendered: Final = parser.render()
+    mutate(parser)
+    # Clear the modification flag, so that the memoized render would be returned if it had not been evicted.
+    parser._is_modified = False  # pylint: disable=protected-access
+    edited: Final = parser.render()
+    assert edited != rendered
+    # The memoized render of the edited recipe must match a fresh render.
+    parser._render_cache.clear()  # pylint: disable=protected-access
+    assert parser.render() == edited
+
+
 def test_patch_replace() -> None:
     """
     Tests the `replace` patch op.
@@ -1194,6 +1340,95 @@ def test_search_and_patch_replace(
     assert parser.is_modified() == expected_is_modified
 
 
+def test_wrap_in_key() -> None:
+    """
+    Tests nesting an existing value under a new key, in-place.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert parser.get_value("/requirements/host/0") == "setuptools"
+    assert parser._wrap_in_key("/requirements/host", "wrapped")  # pylint: disable=protected-access
+    assert parser.is_modified()
+    assert parser.get_value("/requirements/host") == {"wrapped": ["setuptools", "fakereq"]}
+    assert not parser.contains_value("/requirements/host/0")
+    # Selectors follow the wrapped values.
+    assert parser.get_selector_paths("[unix]") == [
+        "/package/name",
+        "/requirements/host/wrapped/0",
+        "/requirements/host/wrapped/1",
+    ]
+    # Empty keys can be wrapped, but values that are not keys cannot.
+    assert parser._wrap_in_key("/requirements/empty_field1", "wrapped")  # pylint: disable=protected-access
+    assert parser.get_value("/requirements/empty_field1") == {"wrapped": None}
+    assert not parser._wrap_in_key("/multi_level/list_1/0", "wrapped")  # pylint: disable=protected-access
+    assert not parser._wrap_in_key("/does/not/exist", "wrapped")  # pylint: disable=protected-access
+
+
+def test_replace_scalar() -> None:
+    """
+    Tests replacing a single-line string value in-place.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert parser._replace_scalar("/about/license", "MIT")  # pylint: disable=protected-access
+    assert parser.is_modified()
+    assert parser.get_value("/about/license") == "MIT"
+    # Only keys holding a single value can be replaced, with values that can be stored directly in a node.
+    assert not parser._replace_scalar("/requirements/host", "MIT")  # pylint: disable=protected-access
+    assert not parser._replace_scalar("/requirements/empty_field1", "MIT")  # pylint: disable=protected-access
+    assert not parser._replace_scalar("/about/license", "MIT # comment")  # pylint: disable=protected-access
+    assert not parser._replace_scalar("/does/not/exist", "MIT")  # pylint: disable=protected-access
+
+
+def test_remove_children() -> None:
+    """
+    Tests removing several keys that share a parent, in-place.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert parser._remove_children(  # pylint: disable=protected-access
+        "/requirements", ["run", "does_not_exist", "host"]
+    ) == ["/requirements/run", "/requirements/host"]
+    assert parser.is_modified()
+    assert not parser.contains_value("/requirements/host")
+    assert not parser.contains_value("/requirements/run")
+    assert parser.contains_value("/requirements/empty_field1")
+    # Selectors on removed values are dropped.
+    assert parser.get_selector_paths("[unix]") == ["/package/name"]
+    assert not parser._remove_children("/requirements", ["host"])  # pylint: disable=protected-access
+    assert not parser._remove_children("/does/not/exist", ["host"])  # pylint: disable=protected-access
+
+
+def test_search_and_mutate() -> None:
+    """
+    Tests the ability for the `RecipeParser` to mutate matching string values in-place.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    # Multiline strings are not mutated. Their paths are returned instead.
+    assert parser.search_and_mutate(r"(setuptools|fakereq|type)", str.upper) == ["/about/description"]
+    assert parser.is_modified()
+    assert parser.get_value("/requirements/host") == ["SETUPTOOLS", "FAKEREQ"]
+    assert str(parser.get_value("/about/description")).startswith("This is a PEP '561 type stub package")
+    # Comments and selectors are preserved by default.
+    assert parser.get_selector_paths("[unix]") == ["/package/name", "/requirements/host/0", "/requirements/host/1"]
+
+
+def test_search_and_mutate_drop_comments() -> None:
+    """
+    Tests that the `RecipeParser` can drop comments and selectors on values that are mutated in-place.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert not parser.search_and_mutate(r"^fakereq$", str.upper, preserve_comments_and_selectors=False)
+    assert parser.get_value("/requirements/host/1") == "FAKEREQ"
+    assert parser.get_selector_paths("[unix]") == ["/package/name", "/requirements/host/0"]
+
+
+def test_search_and_mutate_no_match() -> None:
+    """
+    Ensures that the recipe is not marked as modified if no values match.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParser)
+    assert not parser.search_and_mutate(r"does not exist", str.upper)
+    assert not parser.is_modified()
+
+
 def test_diff() -> None:
     """
     Tests diffing output function
@@ -11,6 +11,7 @@ import pytest
 
 from conda_recipe_manager.parser._message_table import MessageCategory
 from conda_recipe_manager.parser.recipe_parser_convert import RecipeParserConvert
+from conda_recipe_manager.parser.recipe_parser_deps import RecipeParserDeps
 from conda_recipe_manager.parser.types import RecipeReaderFlags
 from tests.file_loading import load_file, load_recipe
 
@@ -425,6 +426,12 @@ def test_pre_process_recipe_text(input_file: str, expected_file: str) -> None:
             [],
             [],
         ),
+        # Ensures commonly misspelled fields are renamed
+        (
+            "common-misspellings.yaml",
+            [],
+            [],
+        ),
         # Regression test. Ensures we don't emit a bad `script` section if there are no test scripts, other than
         # `pip check` (which got upgraded to a new flag).
         (
@@ -572,6 +579,47 @@ def test_render_to_v1_recipe_format_with_preprocess(file: str, errors: list[str]
     assert parser.diff() == ""
 
 
+@pytest.mark.parametrize(
+    "file",
+    [
+        # Recipes that render back to their original text, so the parse tree can be copied structurally.
+        "simple-recipe.yaml",
+        "multi-output.yaml",
+        # Recipes whose parse trees are normalized by a round trip through `render()`.
+        "v0_formatter/cfitsio_excessive_indent.yaml",
+        "v0_formatter/cfitsio_excessive_indent_fixed.yaml",
+        "quoted_multiline_str.yaml",
+        "parser_regressions/get_value_summary_none.yaml",
+        "gluonts.yaml",
+        "recipe_variants/openblas/recipe/conda_build_config.yaml",
+    ],
+)
+def test_v1_recipe_working_copy_matches_round_trip(file: str) -> None:
+    """
+    Ensures that the working copy of a recipe being converted is equivalent to re-parsing the rendered recipe.
+
+    :param file: File to test against
+    """
+    parser = load_recipe(file, RecipeParserConvert)
+    expected: Final = RecipeParserDeps(parser.render())
+    assert str(parser._v1_recipe) == str(expected)  # pylint: disable=protected-access
+    # Recipes that were not normalized used to fail to convert.
+    parser.render_to_v1_recipe_format()
+    assert not parser.is_modified()
+
+
+def test_v1_recipe_working_copy_includes_prior_modifications() -> None:
+    """
+    Ensures that the working copy of a recipe being converted is taken when the conversion starts, so modifications
+    made before the conversion are converted and modifications made afterwards are not.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeParserConvert)
+    assert parser.patch({"op": "replace", "path": "/build/number", "value": 42})
+    assert "number: 42" in parser.render_to_v1_recipe_format()[0]
+    assert parser.patch({"op": "replace", "path": "/build/number", "value": 43})
+    assert parser._v1_recipe.get_value("/build/number") == 42  # pylint: disable=protected-access
+
+
 def test_render_to_v1_also_test_latest_python() -> None:
     """
     Validates that the ALSO_TEST_LATEST_PYTHON flag expands python_version to a list
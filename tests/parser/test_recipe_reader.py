@@ -6,11 +6,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Final
+import sys
+from typing import Final, cast
 
 import pytest
+import yaml
 
 from conda_recipe_manager.parser._node_var import NodeVar
+from conda_recipe_manager.parser._traverse import traverse
+from conda_recipe_manager.parser._types import ForceIndentDumper, SafeLoader, StringLoader
+from conda_recipe_manager.parser._utils import str_to_stack_path
 from conda_recipe_manager.parser.cbc_reader import CbcReader  # Used in some parsing tests instead of `RecipeReader`.
 from conda_recipe_manager.parser.enums import SchemaVersion
 from conda_recipe_manager.parser.exceptions import DuplicateKeyException, DuplicateKeyWarning, ParsingJinjaException
@@ -164,6 +169,26 @@ def test_eq(file: str, other_file: str) -> None:
     assert not parser2.is_modified()
 
 
+@pytest.mark.parametrize(
+    "content,other_content",
+    [
+        ("foo: bar\n", "foo: bar\nbaz: qux\n"),
+        ("{% set a = 1 %}\n\nfoo: bar\n", "{% set b = 1 %}\n\nfoo: bar\n"),
+        ("{% set a = 1 %}\n\nfoo: bar\n", "{% set a = 2 %}\n\nfoo: bar\n"),
+        ("foo: bar\n", "foo: baz\n"),
+    ],
+)
+def test_eq_inline_recipes(content: str, other_content: str) -> None:
+    """
+    Tests the equivalency function against recipes that differ in small ways.
+
+    :param content: Recipe file contents to test with
+    :param other_content: "Other" recipe file contents to check against
+    """
+    assert RecipeReader(content) == RecipeReader(content)
+    assert RecipeReader(content) != RecipeReader(other_content)
+
+
 def test_loading_obj_in_list() -> None:
     """
     Regression test: at one point, the parser would crash loading this file, containing an object in a list.
@@ -288,6 +313,128 @@ def test_round_trip_with_changes(file: str, expected: str) -> None:
     assert parser.render() == load_file(expected)
 
 
+@pytest.mark.parametrize(
+    "content",
+    [
+        load_file("simple-recipe.yaml"),
+        load_file("multi-output.yaml"),
+        load_file("v1_format/v1_simple-recipe.yaml"),
+        load_file("parser_regressions/list_of_lists_multiline_str_01.yaml"),
+        # Recipe nested deeper than the recursion limit
+        "".join("  " * i + f"key_{i}:\n" for i in range(sys.getrecursionlimit() + 100))
+        + "  " * (sys.getrecursionlimit() + 100)
+        + "- foo  # [unix]\n",
+    ],
+    ids=[
+        "simple-recipe",
+        "multi-output",
+        "v1_simple-recipe",
+        "list_of_lists_multiline_str_01",
+        "deeply_nested",
+    ],
+)
+def test_structural_clone(content: str) -> None:
+    """
+    Ensures that a structurally cloned recipe is equivalent to, but independent of, the original recipe.
+
+    :param content: Recipe to clone.
+    """
+    parser: Final = RecipeReader(content)
+    # Populate the original recipe's memoized state, which must not be carried over to the clone.
+    parser.render()
+    parser.list_selectors()
+    parser.get_package_paths()
+    parser._index_path_cache()  # pylint: disable=protected-access
+    clone: Final = RecipeReader._structural_clone(parser)  # pylint: disable=protected-access
+    # pylint: disable-next=protected-access
+    assert not (clone._path_cache or clone._render_cache or clone._package_paths_cache or clone._selector_tbl_cache)
+    assert clone == parser
+    assert clone.render() == parser.render()
+    assert clone.list_selectors() == parser.list_selectors()
+    assert clone.list_variables() == parser.list_variables()
+    assert not clone.is_modified()
+    assert clone._root is not parser._root  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        "simple-recipe.yaml",
+        "multi-output.yaml",
+        "v1_format/v1_simple-recipe.yaml",
+        "v0_formatter/cfitsio_excessive_indent_fixed.yaml",
+    ],
+)
+def test_index_path_cache(file: str) -> None:
+    """
+    Ensures that indexing every path in a recipe produces the same look-ups as traversing the recipe.
+
+    :param file: Recipe file to index.
+    """
+    parser: Final = load_recipe(file, RecipeReader)
+    parser._index_path_cache()  # pylint: disable=protected-access
+    for path in parser.list_value_paths():
+        assert path in parser._path_cache  # pylint: disable=protected-access
+    for path, node in parser._path_cache.items():  # pylint: disable=protected-access
+        assert traverse(parser._root, str_to_stack_path(path)) is node  # pylint: disable=protected-access
+
+
+def test_index_path_cache_unaddressable_keys() -> None:
+    """
+    Ensures that keys that can't be addressed by a path give the same look-up results before and after indexing.
+    """
+    content: Final = 'extra:\n  "1": one\n  a/b:\n    c: slash\n  2: two\n  true: yes\n  name: foo\n'
+    paths: Final = ["/extra/1", "/extra/a/b", "/extra/a/b/c", "/extra/2", "/extra/true", "/extra/name", "/extra"]
+    expected: Final = [RecipeReader(content).contains_value(path) for path in paths]
+    assert expected == [False, False, False, False, False, True, True]
+    parser: Final = RecipeReader(content)
+    parser._index_path_cache()  # pylint: disable=protected-access
+    assert [parser.contains_value(path) for path in paths] == expected
+    assert parser.get_value("/extra/name") == "foo"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["foo", "bar >=1.2.3", "${{ compiler('c') }}", "{{ pin_compatible('numpy') }}"],
+        [1, 2.5, True, False, -0.0],
+        ["1.0", "yes", "null", "", "  padded", "foo: bar", "[a]", "{b: 1}", "*star", "&anchor"],
+    ],
+)
+def test_generate_subtree_simple_list(value: list[JsonType]) -> None:
+    """
+    Ensures that lists of simple scalars produce the same subtree as the (slower) YAML-based construction.
+
+    :param value: List of values to generate a subtree for.
+    """
+    expected: Final = RecipeReader._create_private_recipe_reader(  # pylint: disable=protected-access
+        yaml.dump(value, Dumper=ForceIndentDumper, sort_keys=False, width=sys.maxsize)
+    )._root.children  # pylint: disable=protected-access
+    assert RecipeReader._generate_subtree(value) == expected  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"name": "foo", "version": "1.2.3", "number": 0},
+        {"skip": True, "noarch": "python", "script_env": "${{ FOO }}"},
+        {"yes": "no", "1": "1.0", "  padded": "", "foo: bar": "[a]"},
+    ],
+)
+def test_generate_subtree_simple_dict(value: dict[str, JsonType]) -> None:
+    """
+    Ensures that mappings of simple scalars produce the same subtree as the (slower) YAML-based construction.
+
+    :param value: Mapping of values to generate a subtree for.
+    """
+    expected: Final = RecipeReader._create_private_recipe_reader(  # pylint: disable=protected-access
+        yaml.dump(value, Dumper=ForceIndentDumper, sort_keys=False, width=sys.maxsize)
+    )._root.children  # pylint: disable=protected-access
+    actual: Final = RecipeReader._generate_subtree(value)  # pylint: disable=protected-access
+    assert actual == expected
+    assert [node.key_flag for node in actual] == [node.key_flag for node in expected]
+
+
 @pytest.mark.parametrize(
     "file,substitute,expected",
     [
@@ -1632,6 +1779,17 @@ def test_get_variable_references(file: str, var: str, expected: list[str]) -> No
     assert not parser.is_modified()
 
 
+def test_get_variable_references_special_characters() -> None:
+    """
+    Ensures that special regular expression characters in variable names are matched literally.
+    """
+    parser = RecipeReader(
+        '{% set foo.bar = 1 %}\n{% set fooxbar = 2 %}\n\nname: "{{ foo.bar }}"\nother: "{{ fooxbar }}"\n'
+    )
+    assert parser.get_variable_references("foo.bar") == ["/name"]
+    assert parser.get_variable_references("fooxbar") == ["/other"]
+
+
 ## Selectors ##
 
 
@@ -1644,6 +1802,20 @@ def test_list_selectors() -> None:
     assert not parser.is_modified()
 
 
+def test_selector_table_is_built_lazily() -> None:
+    """
+    Ensures that the selector table is not built until a selector is queried, and is only built once.
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeReader)
+    initial_selector_tbl: Final = parser._selector_tbl_cache  # pylint: disable=protected-access
+    assert initial_selector_tbl is None
+    assert parser.contains_selector("[unix]")
+    selector_tbl: Final = parser._selector_tbl_cache  # pylint: disable=protected-access
+    assert selector_tbl is not None
+    assert parser.list_selectors() == ["[unix]", "[py<37]", "[unix and win]"]
+    assert parser._selector_tbl_cache is selector_tbl  # pylint: disable=protected-access
+
+
 def test_contains_selectors() -> None:
     """
     Validates checking if a selector exists in a recipe
@@ -1769,6 +1941,28 @@ def test_get_comments_table(file: str, expected: dict[str, str]) -> None:
     assert parser.get_comments_table() == expected
 
 
+def test_get_dropped_comments() -> None:
+    """
+    Tests determining which previously recorded comments no longer have a location in the recipe
+    """
+    parser = load_recipe("simple-recipe.yaml", RecipeReader)
+    old_comments: Final[dict[str, str]] = parser.get_comments_table()
+    assert not parser.get_dropped_comments(old_comments)
+    assert parser.get_dropped_comments({**old_comments, "/requirements/host/42": "# gone"}) == {
+        "/requirements/host/42": "# gone"
+    }
+
+
+def test_get_dropped_comments_root_scalar() -> None:
+    """
+    Tests that comments on root-level scalars, which are recorded under an empty path, are never reported as dropped.
+    """
+    parser: Final = RecipeReader("name: foo\nbar  # comment\n")
+    old_comments: Final[dict[str, str]] = parser.get_comments_table()
+    assert old_comments == {"": "# comment"}
+    assert not parser.get_dropped_comments(old_comments)
+
+
 def test_search() -> None:
     """
     Tests searching for values
@@ -1854,6 +2048,27 @@ def test_duplicate_keys_exception(file: str, flags: RecipeReaderFlags) -> None:
     assert e.value.message == "Duplicate key found at line 36: script"
 
 
+def test_duplicate_keys_exception_wide_mapping() -> None:
+    """
+    Tests that duplicate keys are detected amongst many sibling keys, including keys added after the first check.
+    """
+    content: Final = "about:\n" + "".join(f"  key_{i}: {i}\n" for i in range(100)) + "  key_42: duplicate\n"
+    with pytest.raises(DuplicateKeyException) as e:
+        RecipeReader(content)
+    assert e.value.message == "Duplicate key found at line 102: key_42"
+
+
+def test_duplicate_keys_flow_mapping_sibling() -> None:
+    """
+    Tests that flow mappings, which are not hashable, do not break duplicate key detection amongst their siblings.
+    """
+    parser: Final = RecipeReader("about: {a: 1}\n  description: |\n    foo\n")
+    assert parser.render() == "about:\n  - {'a': 1}\n  description: |\n    foo\n"
+    with pytest.raises(DuplicateKeyException) as e:
+        RecipeReader("about: {a: 1}\n  key: 1\n  key: 2\n")
+    assert e.value.message == "Duplicate key found at line 3: key"
+
+
 @pytest.mark.parametrize(
     "file,flags",
     [
@@ -1875,3 +2090,150 @@ def test_duplicate_keys_allowed(file: str, flags: RecipeReaderFlags, caplog: pyt
             load_recipe(file, RecipeReader, flags)
 
     assert "Duplicate script keys found, ALLOW_DUPLICATE_KEYS enabled, allowing..." in caplog.text
+
+
+def test_parse_yaml_recursive_sub_deeply_nested() -> None:
+    """
+    Ensures that substitutions are made, in order, in data that is nested deeper than the recursion limit.
+    """
+    depth: Final = sys.getrecursionlimit() + 100
+    data: list[JsonType] = ["a"]
+    for _ in range(depth):
+        data = [{"b": data}, "c"]
+    visited: list[str] = []
+
+    def _modifier(s: str) -> JsonType:
+        visited.append(s)
+        return s.upper()
+
+    result = RecipeReader._parse_yaml_recursive_sub(data, _modifier)  # pylint: disable=protected-access
+    assert visited == ["a"] + ["c"] * depth
+    for _ in range(depth):
+        assert isinstance(result, list)
+        assert result[1] == "C"
+        result = cast(dict[str, JsonType], result[0])["b"]
+    assert result == ["A"]
+
+
+def test_deeply_nested_recipe_selectors() -> None:
+    """
+    Ensures that recipes nested deeper than the recursion limit can be traversed to find paths and selectors.
+    """
+    depth: Final = sys.getrecursionlimit() + 100
+    content: Final = "".join("  " * i + f"key_{i}:\n" for i in range(depth)) + "  " * depth + "- foo  # [unix]\n"
+    parser: Final = RecipeReader(content)
+    expected_path: Final = "/" + "/".join(f"key_{i}" for i in range(depth)) + "/0"
+    assert parser.list_value_paths() == [expected_path]
+    assert parser.get_selector_paths("[unix]") == [expected_path]
+
+
+def test_deeply_nested_recipe_render() -> None:
+    """
+    Ensures that recipes nested deeper than the recursion limit can be rendered.
+    """
+    depth: Final = sys.getrecursionlimit() + 100
+    content: Final = "".join("  " * i + f"key_{i}:\n" for i in range(depth)) + "  " * depth + "- foo  # [unix]\n"
+    parser: Final = RecipeReader(content)
+    assert parser.render() == content
+
+
+def test_deeply_nested_recipe_render_to_object() -> None:
+    """
+    Ensures that recipes nested deeper than the recursion limit can be rendered to a Pythonic object.
+    """
+    depth: Final = sys.getrecursionlimit() + 100
+    content: Final = "".join("  " * i + f"key_{i}:\n" for i in range(depth)) + "  " * depth + "- foo\n"
+    obj = RecipeReader(content).render_to_object()
+    for i in range(depth):
+        obj = cast(dict[str, JsonType], obj)[f"key_{i}"]
+    assert obj == ["foo"]
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "name: foo",
+        "noarch: python",
+        "script_env:",
+        "- setuptools",
+        "- foo.bar-baz/qux",
+        "license_file: LICENSE.txt",
+        # Plain words that the YAML parser does not interpret as strings
+        "skip: true",
+        "- Off",
+        "NULL: foo",
+        # Lines that are not simple pairings of plain words
+        "number: 0",
+        "version: 1.2.3",
+        "- python >=3.8",
+        "key: 'quoted'",
+        "foo: bar  # comment",
+    ],
+)
+@pytest.mark.parametrize("yaml_loader", [SafeLoader, StringLoader])
+def test_load_yaml_line(s: str, yaml_loader: type[SafeLoader]) -> None:
+    """
+    Ensures that loading a line of YAML produces the same results as the YAML parser.
+
+    :param s: Line of YAML to load
+    :param yaml_loader: The YAML loader to use
+    """
+    expected: Final = cast(JsonType, yaml.load(s, Loader=yaml_loader))
+    actual: Final = RecipeReader._load_yaml_line(s, yaml_loader)  # pylint: disable=protected-access
+    assert actual == expected
+    assert type(actual) == type(expected)  # pylint: disable=unidiomatic-typecheck
+
+
+@pytest.mark.parametrize(
+    "s",
+    [
+        "types-toml",
+        "krb5 1.20.1.*",
+        "python >=3.8,<4",
+        "foo ~=1.2 py313h06a4308_0",
+        "yes no",
+        # Plain words that the YAML parser does not interpret as strings
+        "true",
+        "Off",
+        "null",
+        # Scalars that are not plain strings
+        "0",
+        "1.2",
+        "1.2.3",
+        "'quoted'",
+        "foo: bar",
+        "foo # comment",
+    ],
+)
+@pytest.mark.parametrize("yaml_loader", [SafeLoader, StringLoader])
+def test_load_yaml_scalar(s: str, yaml_loader: type[SafeLoader]) -> None:
+    """
+    Ensures that loading a YAML scalar produces the same results as the YAML parser.
+
+    :param s: YAML scalar to load
+    :param yaml_loader: The YAML loader to use
+    """
+    expected: Final = cast(JsonType, yaml.load(s, Loader=yaml_loader))
+    actual: Final = RecipeReader._load_yaml_scalar(s, yaml_loader)  # pylint: disable=protected-access
+    assert actual == expected
+    assert type(actual) == type(expected)  # pylint: disable=unidiomatic-typecheck
+
+
+def test_trailing_comments_are_shared() -> None:
+    """
+    Ensures that identical trailing comments (usually selectors) are stored as a single, shared string.
+    """
+    first: Final = RecipeReader._parse_line_node("- foo  # [win]", False)  # pylint: disable=protected-access
+    second: Final = RecipeReader._parse_line_node("bar: baz  # [win]", False)  # pylint: disable=protected-access
+    assert first.comment == "# [win]"
+    assert first.comment is second.comment
+
+
+def test_comment_only_recipe() -> None:
+    """
+    Ensures that a V0 recipe file containing only top-of-file comments can be parsed and rendered.
+    """
+    content: Final = "# Comment\n# Another comment  # [unix]\n"
+    parser: Final = RecipeReader(content)
+    assert parser.get_schema_version() == SchemaVersion.V0
+    assert parser.render() == content.rstrip("\n")
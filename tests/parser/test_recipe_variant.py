@@ -4,11 +4,15 @@
 
 from __future__ import annotations
 
+import sys
+from typing import Final, cast
+
 import pytest
 
 from conda_recipe_manager.parser.build_context import BuildContext
 from conda_recipe_manager.parser.platform_types import Platform
 from conda_recipe_manager.parser.recipe_variant import RecipeVariant
+from conda_recipe_manager.types import JsonType
 from tests.file_loading import load_file
 
 ## Build Variant Rendering ##
@@ -98,3 +102,22 @@ def test_evaluate_jinja_expressions(file: str, build_context: BuildContext, expe
     parser = RecipeVariant(load_file(file))
     parser._evaluate_jinja_expressions(build_context)  # pylint: disable=protected-access
     assert parser.render() == load_file(expected_file)
+
+
+def test_deeply_nested_recipe_variant() -> None:
+    """
+    Ensures that recipes nested deeper than the recursion limit can be filtered and evaluated.
+    """
+    depth: Final = sys.getrecursionlimit() + 100
+    content: Final = (
+        "{% set name = 'foo' %}\n\n"
+        + "".join("  " * i + f"key_{i}:\n" for i in range(depth))
+        + "  " * depth
+        + "- {{ name }}  # [unix]\n"
+        + "  " * depth
+        + "- bar  # [win]\n"
+    )
+    obj = RecipeVariant(content, BuildContext(platform=Platform.LINUX_64)).render_to_object()
+    for i in range(depth):
+        obj = cast(dict[str, JsonType], obj)[f"key_{i}"]
+    assert obj == ["foo"]
@@ -4,7 +4,19 @@
 
 from __future__ import annotations
 
-from conda_recipe_manager.parser._utils import stack_path_to_str
+from typing import cast
+
+import pytest
+
+from conda_recipe_manager.parser._types import RECIPE_MANAGER_SUB_MARKER, Regex
+from conda_recipe_manager.parser._utils import (
+    contains_jinja_function,
+    iter_jinja_v0_set_statements,
+    num_tab_spaces,
+    search_any_regex,
+    stack_path_to_str,
+    substitute_markers,
+)
 
 
 def test_stack_path_to_str_does_not_modify_input() -> None:
@@ -20,3 +32,129 @@ def test_stack_path_to_str_does_not_modify_input() -> None:
     stack_path_to_str(path_stack)
 
     assert path_stack == ["skip", "build", "/"]
+
+
+@pytest.mark.parametrize(
+    "s,expected",
+    [
+        ("1.2.3", False),
+        ("foo-bar_baz", False),
+        ("name | lower", True),
+        ("name.upper()", True),
+        ("version.replace('-', '_')", True),
+        ("version.split('.')", True),
+        ("'.'.join(parts)", True),
+        ("version[0]", True),
+        ("major + 1", True),
+        ('match(python, ">=3.8")', True),
+        ("env.get('FOO')", False),
+        ("(not a function)", False),
+    ],
+)
+def test_contains_jinja_function(s: str, expected: bool) -> None:
+    """
+    Ensures that the pre-filtered, fused JINJA function check agrees with checking every JINJA function pattern.
+
+    :param s: Target string
+    :param expected: Expected result
+    """
+    assert contains_jinja_function(s) == expected
+    assert search_any_regex(Regex.JINJA_FUNCTIONS_SET, s) == expected
+
+
+@pytest.mark.parametrize(
+    "s,expected",
+    [
+        ("", 0),
+        ("foo: bar", 0),
+        ("  foo: bar", 2),
+        ("    - foo  ", 4),
+        ("      ", 6),
+        ("\tfoo", 0),
+        ("  \t  foo", 2),
+    ],
+)
+def test_num_tab_spaces(s: str, expected: int) -> None:
+    """
+    Ensures that only leading spaces are counted as indentation.
+
+    :param s: Target string
+    :param expected: Expected result
+    """
+    assert num_tab_spaces(s) == expected
+
+
+@pytest.mark.parametrize(
+    "s,key,value",
+    [
+        ('{% set name = "types-toml" %}', "name", '"types-toml"'),
+        ("{%set version=1.2%}", "version", "1.2"),
+        ('{% set soversion = ".".join(version.split(".")[:3]) %}', "soversion", '".".join(version.split(".")[:3])'),
+        ("{% set build_num = 0 -%}  # comment", "build_num", "0 -"),
+    ],
+)
+def test_jinja_v0_set_groups(s: str, key: str, value: str) -> None:
+    """
+    Ensures that the variable name and value are captured from a V0 JINJA set statement.
+
+    :param s: Target string
+    :param key: Expected variable name
+    :param value: Expected (stripped) value
+    """
+    match = Regex.JINJA_V0_SET_MULTI_LINE.match(s)
+    assert match is not None
+    assert cast(str, match.group("key")).strip() == key
+    assert cast(str, match.group("value")).strip() == value
+
+
+@pytest.mark.parametrize(
+    "s,subs,expected,remaining_subs",
+    [
+        ("foo", ["{{ a }}"], "foo", ["{{ a }}"]),
+        (f"{RECIPE_MANAGER_SUB_MARKER}", ["{{ a }}", "{{ b }}"], "{{ a }}", ["{{ b }}"]),
+        (
+            f"{RECIPE_MANAGER_SUB_MARKER}-{RECIPE_MANAGER_SUB_MARKER}.tar.gz",
+            ["{{ a }}", "{{ b }}"],
+            "{{ a }}-{{ b }}.tar.gz",
+            [],
+        ),
+        (
+            f"{RECIPE_MANAGER_SUB_MARKER} {RECIPE_MANAGER_SUB_MARKER}",
+            ["{{ a }}"],
+            f"{{{{ a }}}} {RECIPE_MANAGER_SUB_MARKER}",
+            [],
+        ),
+    ],
+)
+def test_substitute_markers(s: str, subs: list[str], expected: str, remaining_subs: list[str]) -> None:
+    """
+    Ensures that substitution markers are replaced in order and that used substitutions are consumed.
+
+    :param s: Target string
+    :param subs: Substitutions to make
+    :param expected: Expected result
+    :param remaining_subs: Substitutions expected to remain unused
+    """
+    assert substitute_markers(s, subs) == expected
+    assert subs == remaining_subs
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "",
+        "package:\n  name: foo\n",
+        '{% set name = "foo" %}\n{% set version = "1.0" %}  # comment\npackage:\n  name: {{ name }}\n',
+        "  {% set indented = 1 %}\nfoo: {% set not_at_line_start = 2 %}\n{% if unix %}{% set x = 3 %}\n",
+        '{% set multi_line = [\n  "a",\n  "b",\n] %}\n{%- set stripped = 4 %}\n{% set last = 5 %}',
+    ],
+)
+def test_iter_jinja_v0_set_statements(content: str) -> None:
+    """
+    Ensures that finding JINJA set statements is equivalent to running the set statement regex over the whole string.
+
+    :param content: Target string
+    """
+    assert [match.span() for match in iter_jinja_v0_set_statements(content)] == [
+        match.span() for match in Regex.JINJA_V0_SET_MULTI_LINE.finditer(content)
+    ]